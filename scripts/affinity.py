@@ -0,0 +1,212 @@
+import glob
+import mmap
+import os
+import threading
+
+import numpy as np
+
+from vectorized_solution import (chunk_ranges, chunk_sign_summary, merge_sign_summaries, polygon_array,
+                                 summary_is_convex)
+
+SYS_CPU = "/sys/devices/system/cpu"
+SYS_NODE = "/sys/devices/system/node"
+PLACEMENT_POLICIES = ("spread", "compact")
+
+def parse_cpu_list(text):
+    """Çekirdeğin "0-3,8,10-11" biçimindeki CPU listesini sayı listesine çevir"""
+    cpus = []
+    for part in (text or "").strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+def _read(path):
+    """sysfs dosyasını oku; yoksa (Linux dışı, konteyner) None döndür"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def cpu_topology():
+    """Bu sürecin kullanabildiği CPU'ların NUMA düğümü, soket ve fiziksel çekirdek bilgisi
+
+    Bilgi /sys altından okunur; okunamazsa her CPU ayrı çekirdek ve tek
+    düğüm (0) kabul edilir, böylece yerleşim planı yine de kurulabilir.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        allowed = sorted(os.sched_getaffinity(0))
+    else:
+        allowed = list(range(os.cpu_count() or 1))
+    node_of = {}
+    for path in glob.glob(os.path.join(SYS_NODE, "node[0-9]*")):
+        node = int(os.path.basename(path)[4:])
+        for cpu in parse_cpu_list(_read(os.path.join(path, "cpulist"))):
+            node_of[cpu] = node
+
+    cpus = []
+    for cpu in allowed:
+        base = os.path.join(SYS_CPU, f"cpu{cpu}", "topology")
+        package = _read(os.path.join(base, "physical_package_id"))
+        core = _read(os.path.join(base, "core_id"))
+        cpus.append({
+            "cpu": cpu,
+            "node": node_of.get(cpu, 0),
+            "package": int(package) if package else 0,
+            "core": int(core) if core else cpu,
+        })
+    # Aynı fiziksel çekirdekteki kardeş thread'lere 0, 1, ... sırası ver
+    seen = {}
+    for c in cpus:
+        key = (c["package"], c["core"])
+        c["smt_rank"] = seen.get(key, 0)
+        seen[key] = c["smt_rank"] + 1
+    return {
+        "cpus": cpus,
+        "nodes": sorted({c["node"] for c in cpus}),
+        "smt": len(seen) < len(cpus),
+    }
+
+def topology_summary(topology=None):
+    """Benchmark JSON'una yazılacak kısa topoloji özeti"""
+    topology = topology or cpu_topology()
+    cpus = topology["cpus"]
+    return {
+        "nodes": len(topology["nodes"]),
+        "packages": len({c["package"] for c in cpus}),
+        "physical_cores": len({(c["package"], c["core"]) for c in cpus}),
+        "logical_cpus": len(cpus),
+        "smt": topology["smt"],
+        "cpus_by_node": {str(node): [c["cpu"] for c in cpus if c["node"] == node] for node in topology["nodes"]},
+    }
+
+def plan_placement(num_workers, topology=None, skip_smt=False, policy="spread"):
+    """Her worker için sabitleneceği CPU numarasını seç
+
+    spread: worker'ları NUMA düğümlerine sırayla dağıt, önce fiziksel çekirdekler
+    compact: bir düğümü doldurmadan sonrakine geçme, SMT kardeşleri yan yana
+    skip_smt: her fiziksel çekirdekten yalnızca ilk thread kullanılır
+    Worker sayısı CPU sayısını aşarsa plan başa sarar.
+    """
+    if policy not in PLACEMENT_POLICIES:
+        raise ValueError(f"Bilinmeyen yerleşim politikası: {policy}")
+    topology = topology or cpu_topology()
+    cpus = [c for c in topology["cpus"] if not (skip_smt and c["smt_rank"] > 0)]
+    if policy == "spread":
+        per_node = [sorted((c for c in cpus if c["node"] == node), key=lambda c: (c["smt_rank"], c["cpu"]))
+                    for node in topology["nodes"]]
+        order = []
+        for rank in range(max(len(p) for p in per_node)):
+            order.extend(p[rank]["cpu"] for p in per_node if rank < len(p))
+    else:
+        order = [c["cpu"] for c in sorted(cpus, key=lambda c: (c["node"], c["package"], c["core"], c["smt_rank"]))]
+    return [order[w % len(order)] for w in range(max(1, num_workers))]
+
+def pin_current_thread(cpus):
+    """Çağıran thread'i verilen CPU'lara sabitle; desteklenmiyorsa False döndür"""
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+    # Linux'ta thread kimliği verildiğinde yalnızca bu thread etkilenir, süreç değil
+    os.sched_setaffinity(threading.get_native_id(), cpus)
+    return True
+
+def page_aligned_ranges(n, num_chunks, itemsize):
+    """chunk_ranges dağılımını sayfa sınırlarına hizala
+
+    Her sayfa tek worker'a düşer; böylece ilk dokunma (first-touch) ile sayfa
+    tam olarak onu kullanacak worker'ın NUMA düğümüne yerleşir.
+    """
+    per_page = max(1, mmap.PAGESIZE // itemsize)
+    ranges = []
+    start = 0
+    for _, end in chunk_ranges(n, num_chunks):
+        end = n if end == n else min(n, int(round(end / per_page)) * per_page)
+        if end > start:
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def run_pinned(plan, ranges, target):
+    """Her aralık için bir thread aç, plan'daki CPU'ya sabitle ve target(start, end) çalıştır"""
+    results = [None] * len(ranges)
+    errors = []
+
+    def worker(w, start, end):
+        try:
+            pin_current_thread([plan[w % len(plan)]])
+            results[w] = target(start, end)
+        except Exception as exc: # hatayı ana thread'de yeniden fırlat
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(w, s, e)) for w, (s, e) in enumerate(ranges)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+    return results
+
+def place_polygon(points, num_workers=4, skip_smt=False, policy="spread", topology=None):
+    """Koordinatları paylaşılan tampona, her parçayı kendi worker'ı yazacak şekilde yerleştir
+
+    np.empty ile ayrılan büyük tamponun sayfaları ilk yazıldıkları anda
+    fiziksel belleğe bağlanır; Linux bu sayfayı yazan CPU'nun düğümünden verir.
+    """
+    coords = polygon_array(points)
+    topology = topology or cpu_topology()
+    plan = plan_placement(num_workers, topology, skip_smt, policy)
+    ranges = page_aligned_ranges(len(coords), num_workers, coords.itemsize * 2)
+    buffer = np.empty_like(coords)
+
+    def touch(start, end):
+        buffer[start:end] = coords[start:end]
+
+    run_pinned(plan, ranges, touch)
+    return {"coords": buffer, "plan": plan, "ranges": ranges, "skip_smt": skip_smt, "policy": policy,
+            "topology": topology}
+
+def pinned_check(placed):
+    """Yerleştirilmiş tamponu, her worker kendi dokunduğu parçayı okuyacak şekilde kontrol et"""
+    coords = placed["coords"]
+    if len(coords) == 0:
+        return True
+    summaries = run_pinned(placed["plan"], placed["ranges"], lambda s, e: chunk_sign_summary(coords, s, e))
+    return summary_is_convex(merge_sign_summaries(summaries))
+
+def pinned_is_polygon_convex(points, num_workers=4, skip_smt=False, policy="spread"):
+    """Yerleştirme ve kontrolü tek çağrıda yap (aynı çokgen tekrar kontrol edilecekse place_polygon kullanın)"""
+    return pinned_check(place_polygon(points, num_workers, skip_smt, policy))
+
+if __name__ == "__main__":
+    import time
+
+    from vectorized_solution import threaded_is_polygon_convex
+
+    topology = cpu_topology()
+    print("🧭 Topoloji:", topology_summary(topology))
+    for policy in PLACEMENT_POLICIES:
+        for skip_smt in (False, True):
+            print("   {:<8} SMT atla={:<5} -> {}".format(policy, str(skip_smt), plan_placement(8, topology, skip_smt, policy)))
+
+    n_points = 10000000
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    coords = np.column_stack([np.cos(angles), np.sin(angles)])
+    workers = min(16, len(topology["cpus"]) * 2)
+    placed = place_polygon(coords, workers)
+
+    # Aynı ölçümü tekrarlayıp sabitlenmiş ve sabitlenmemiş sürelerin dağılımını karşılaştır
+    for name, run in (("sabitlenmemiş", lambda: threaded_is_polygon_convex(coords, workers)),
+                      ("sabitlenmiş", lambda: pinned_check(placed))):
+        times = []
+        for _ in range(10):
+            start_time = time.perf_counter()
+            result = run()
+            times.append(time.perf_counter() - start_time)
+        print("📌 {:<14} {} worker: ortalama {:.4f}s, std {:.4f}s, en kötü/en iyi {:.2f} | sonuç: {}".format(
+            name, workers, np.mean(times), np.std(times), max(times) / min(times), result))
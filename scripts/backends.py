@@ -0,0 +1,94 @@
+from affinity import pinned_check, place_polygon, plan_placement
+from distributed_solution import distributed_convex
+from mixed_precision import edge_vectors32, mixed_is_polygon_convex
+from parallel_solution import parallel_convex
+from probe import probed_vectorized_convex
+from scheduler import scheduled_convex
+from series_solution import is_polygon_convex as serial_convex
+from vectorized_solution import is_polygon_convex as vectorized_convex
+from vectorized_solution import polygon_array, threaded_is_polygon_convex
+
+def as_point_list(coords):
+    """NumPy koordinat dizisini saf Python (x, y) listesine çevir"""
+    return [tuple(p) for p in polygon_array(coords).tolist()]
+
+# Her backend: girdiyi hazırlayan fonksiyon (süreye dahil değil), çalıştıran
+# fonksiyon (points, workers) -> bool ve worker sayısıyla ölçeklenip ölçeklenmediği;
+# CPU'ya sabitlenen backend'lerde placement(workers) kullanılan CPU listesini verir.
+# prepare_per_workers=True ise hazırlık prepare(points, workers) ile çağrılır
+# (ör. sayfaların worker'lar tarafından first-touch ile yerleştirilmesi)
+BACKENDS = {
+    "serial": {
+        "prepare": as_point_list,
+        "run": lambda points, workers: serial_convex(points),
+        "parallel": False,
+    },
+    "threaded": {
+        "prepare": as_point_list,
+        "run": parallel_convex,
+        "parallel": True,
+    },
+    "vectorized": {
+        "prepare": polygon_array,
+        "run": lambda coords, workers: vectorized_convex(coords),
+        "parallel": False,
+    },
+    "vectorized_threads": {
+        "prepare": polygon_array,
+        "run": threaded_is_polygon_convex,
+        "parallel": True,
+    },
+    "probed": {
+        "prepare": polygon_array,
+        # Eşit aralıklı örnek üçlülerde karışık işaret varsa tam taramaya geçmeden CONCAVE
+        "run": lambda coords, workers: probed_vectorized_convex(coords),
+        "parallel": False,
+    },
+    "scheduled": {
+        "prepare": polygon_array,
+        # Tek çokgen için küçük parçalar: kalan işe göre küçülen guided boyutlar + iş çalma
+        "run": lambda coords, workers: scheduled_convex(coords, workers, min_chunk=1024)[0],
+        "parallel": True,
+    },
+    "pinned": {
+        # Worker'lar NUMA düğümlerine yayılmış CPU'lara sabitlenir, tampon hazırlıkta first-touch ile
+        # yerleşir; ölçülen çalıştırma yalnızca her worker'ın kendi sayfalarını taramasıdır
+        "prepare": lambda points, workers: place_polygon(points, workers),
+        "prepare_per_workers": True,
+        "run": lambda placed, workers: pinned_check(placed),
+        "parallel": True,
+        "placement": lambda workers: plan_placement(workers),
+    },
+    "pinned_nosmt": {
+        # Aynı fiziksel çekirdeğin SMT kardeşleri atlanır
+        "prepare": lambda points, workers: place_polygon(points, workers, skip_smt=True),
+        "prepare_per_workers": True,
+        "run": lambda placed, workers: pinned_check(placed),
+        "parallel": True,
+        "placement": lambda workers: plan_placement(workers, skip_smt=True),
+    },
+    "distributed": {
+        "prepare": polygon_array,
+        # Her worker'a ortalama 4 shard düşecek şekilde bölünür
+        "run": lambda coords, workers: distributed_convex(coords, num_workers=workers,
+                                                          shard_size=max(1, -(-len(coords) // (4 * workers)))),
+        "parallel": True,
+    },
+    "float32": {
+        # Tarama float32 kenar vektörleri üzerinde; işareti belirsiz üçlüler float64'ten yeniden hesaplanır
+        "prepare": lambda points: (polygon_array(points), edge_vectors32(points)),
+        "run": lambda prepared, workers: mixed_is_polygon_convex(*prepared),
+        "parallel": False,
+    },
+}
+
+def prepare_backend(backend, points, workers=1):
+    """Backend girdisini hazırla; worker sayısına bağlı hazırlık isteyenlere workers da verilir"""
+    if backend.get("prepare_per_workers"):
+        return backend["prepare"](points, workers)
+    return backend["prepare"](points)
+
+def run_backend(name, points, workers=1):
+    """Adı verilen backend ile convexlik sonucunu hesapla"""
+    backend = BACKENDS[name]
+    return backend["run"](prepare_backend(backend, points, workers), workers)
@@ -0,0 +1,272 @@
+import math
+
+import numpy as np
+
+from point_query import normalize_convex
+from vectorized_solution import batch_indices, batch_is_convex, polygon_array
+
+TWO_PI = 2 * np.pi
+
+def rotating_calipers(points):
+    """Convex çokgenin çapı, en küçük genişliği ve en küçük alanlı sınırlayıcı dikdörtgeni (seri, O(n))
+
+    Çokgen önce normalize_convex ile saat yönünün tersine çevrilir; ardından
+    her kenar için uzak köşe (k), kenar yönünde en ileri (a) ve en geri (b)
+    köşeler kenarla birlikte ileri doğru döner, hiçbir işaretçi geri gitmez.
+    """
+    coords = normalize_convex(points)
+    p = [tuple(v) for v in coords.tolist()]
+    n = len(p)
+
+    def cross(e, i, v):
+        # cross_product_sign ile aynı aritmetik: v köşesinin kenara uzaklığı (|e| ile ölçekli)
+        return e[0] * (p[v % n][1] - p[i][1]) - e[1] * (p[v % n][0] - p[i][0])
+
+    def dot(e, i, v):
+        return e[0] * (p[v % n][0] - p[i][0]) + e[1] * (p[v % n][1] - p[i][1])
+
+    def dist2(u, v):
+        return (p[u % n][0] - p[v % n][0]) ** 2 + (p[u % n][1] - p[v % n][1]) ** 2
+
+    best_diameter, diameter_pair = -1.0, (0, 0)
+    best_width, best_area, rectangle = math.inf, math.inf, None
+    k = a = 1
+    b = None
+    for i in range(n):
+        j = (i + 1) % n
+        e = (p[j][0] - p[i][0], p[j][1] - p[i][1])
+        while cross(e, i, k + 1) > cross(e, i, k):
+            k += 1
+        while dot(e, i, a + 1) > dot(e, i, a):
+            a += 1
+        if b is None:
+            b = a
+        while dot(e, i, b + 1) <= dot(e, i, b) and b + 1 - a < n:
+            b += 1
+        # Kenarın iki ucu, uzak köşe ve (paralel kenarlarda) onun komşusu antipodal çiftlerdir
+        for u, v in ((i, k), (j, k), (i, k + 1), (j, k + 1)):
+            d = dist2(u, v)
+            if d > best_diameter:
+                best_diameter, diameter_pair = d, (u % n, v % n)
+
+        length = math.hypot(e[0], e[1])
+        width = cross(e, i, k) / length
+        hi, lo = dot(e, i, a) / length, dot(e, i, b) / length
+        best_width = min(best_width, width)
+        area = width * (hi - lo)
+        if area < best_area:
+            u = (e[0] / length, e[1] / length)
+            normal = (-u[1], u[0])
+            corners = []
+            for along, across in ((lo, 0), (hi, 0), (hi, width), (lo, width)):
+                corners.append((p[i][0] + u[0] * along + normal[0] * across,
+                                p[i][1] + u[1] * along + normal[1] * across))
+            best_area, rectangle = area, corners
+
+    return {
+        "diameter": math.sqrt(best_diameter),
+        "diameter_points": (p[diameter_pair[0]], p[diameter_pair[1]]),
+        "width": best_width,
+        "rectangle_area": best_area,
+        "rectangle": rectangle,
+    }
+
+def normalize_convex_batch(coords, offsets):
+    """normalize_convex'in çokgen grubu için vektörel hali: (coords, offsets) döndür
+
+    Tekrar eden ve doğrusal köşeler atılır, saat yönündeki çokgenler ters
+    çevrilir. Üçten az köşesi kalan çokgenler (alanı sıfır) boş kalır.
+    """
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    for pass_name in ("duplicate", "collinear"):
+        polygon_ids, i1, i2 = batch_indices(offsets)
+        if pass_name == "duplicate":
+            # Sonraki köşesiyle aynı olan köşeyi at (doğrusal geçişten önce, yoksa iki kopya da düşer)
+            keep = np.any(coords != coords[i1], axis=1)
+        else:
+            p0 = coords[offsets[0]:offsets[-1]]
+            p1, p2 = coords[i1], coords[i2]
+            cp = (p1[:, 0] - p0[:, 0]) * (p2[:, 1] - p1[:, 1]) - (p1[:, 1] - p0[:, 1]) * (p2[:, 0] - p1[:, 0])
+            # i. üçlünün dönüşü (i+1). köşeye aittir
+            keep = np.ones(len(cp), dtype=bool)
+            keep[i1 - offsets[0]] = cp != 0
+        counts = np.bincount(polygon_ids[keep], minlength=len(offsets) - 1)
+        coords = coords[offsets[0]:offsets[-1]][keep]
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    lengths = np.diff(offsets)
+    small = lengths < 3
+    if small.any():
+        keep = np.repeat(~small, lengths)
+        coords = coords[keep]
+        lengths = np.where(small, 0, lengths)
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+    polygon_ids, i1, _ = batch_indices(offsets)
+    area2 = np.bincount(polygon_ids, coords[:, 0] * coords[i1, 1] - coords[:, 1] * coords[i1, 0],
+                        minlength=len(lengths))
+    # Saat yönündeki çokgenlerde köşe sırasını çokgen içinde ters çevir
+    starts = offsets[:-1][polygon_ids]
+    local = np.arange(len(coords)) - starts
+    flipped = np.where(area2[polygon_ids] < 0, starts + lengths[polygon_ids] - 1 - local, starts + local)
+    return np.ascontiguousarray(coords[flipped]), offsets
+
+def _extreme_vertices(coords, offsets, polygon_ids, rel, targets, direction):
+    """Her kenar için direction yönünde en uçtaki köşenin indeksi
+
+    Kenar açıları çokgen içinde artan sıradadır; hedef açıdan büyük ilk kenarın
+    başlangıç köşesi uç köşedir. Açı yuvarlama hatasına karşı komşular da denenir.
+    """
+    starts = offsets[:-1][polygon_ids]
+    sizes = (offsets[1:] - offsets[:-1])[polygon_ids]
+    keys = polygon_ids * 8.0 + rel # rel < 2π < 8: çokgenler anahtar ekseninde ayrışır
+    found = np.searchsorted(keys, polygon_ids * 8.0 + targets % TWO_PI, side="left")
+    local = found - starts
+    candidates = starts[:, None] + (local[:, None] + np.array([-1, 0, 1])) % sizes[:, None]
+    projections = np.einsum("kcd,kd->kc", coords[candidates], direction)
+    return candidates[np.arange(len(candidates)), projections.argmax(axis=1)]
+
+def _segment_argmin(values, segment_starts):
+    """Sıralı ve bitişik segmentlerin her birinde en küçük değerin (ilk) indeksi"""
+    minima = np.minimum.reduceat(values, segment_starts)
+    segment = np.repeat(np.arange(len(segment_starts)), np.diff(np.append(segment_starts, len(values))))
+    hits = np.flatnonzero(values == minima[segment])
+    return hits[np.searchsorted(segment[hits], np.arange(len(segment_starts)))]
+
+def batch_caliper_metrics(coords, offsets, check_convex=True):
+    """Çokgen grubunun her biri için döner kumpas ölçülerini vektörel hesapla
+
+    Dönüş sözlüğündeki diziler çokgen başınadır: diameter, diameter_points
+    (m, 2, 2), width, rectangle_area, rectangle (m, 4, 2). Alanı sıfır olan
+    çokgenlerde değerler NaN'dır.
+    """
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    num_polygons = len(offsets) - 1
+    if check_convex and not batch_is_convex(coords, offsets).all():
+        raise ValueError("Döner kumpas yalnızca convex çokgenler için geçerlidir")
+    coords, offsets = normalize_convex_batch(coords, offsets)
+    result = {
+        "diameter": np.full(num_polygons, np.nan),
+        "diameter_points": np.full((num_polygons, 2, 2), np.nan),
+        "width": np.full(num_polygons, np.nan),
+        "rectangle_area": np.full(num_polygons, np.nan),
+        "rectangle": np.full((num_polygons, 4, 2), np.nan),
+    }
+    if len(coords) == 0:
+        return result
+
+    polygon_ids, i1, _ = batch_indices(offsets)
+    starts = offsets[:-1][polygon_ids]
+    edges = coords[i1] - coords
+    lengths = np.hypot(edges[:, 0], edges[:, 1])
+    u = edges / lengths[:, None]
+    normal = np.column_stack([-u[:, 1], u[:, 0]]) # saat yönü tersinde çokgenin içine bakar
+
+    # Kenar açılarını çokgenin ilk kenarına göre [0, 2π) aralığında artan hale getir
+    angles = np.arctan2(edges[:, 1], edges[:, 0])
+    rel = (angles - angles[starts]) % TWO_PI
+
+    # Kenarın normali yönünde en uzak köşe: kenar açısı + π'yi geçen ilk kenar
+    far = _extreme_vertices(coords, offsets, polygon_ids, rel, rel + np.pi, normal)
+    ahead = _extreme_vertices(coords, offsets, polygon_ids, rel, rel + np.pi / 2, u)
+    behind = _extreme_vertices(coords, offsets, polygon_ids, rel, rel + 3 * np.pi / 2, -u)
+
+    width = np.einsum("kd,kd->k", coords[far] - coords, normal)
+    hi = np.einsum("kd,kd->k", coords[ahead] - coords, u)
+    lo = np.einsum("kd,kd->k", coords[behind] - coords, u)
+    area = width * (hi - lo)
+
+    present = np.nonzero(np.diff(offsets) > 0)[0]
+    edge_starts = offsets[present]
+    result["width"][present] = np.minimum.reduceat(width, edge_starts)
+    best = _segment_argmin(area, edge_starts)
+    result["rectangle_area"][present] = area[best]
+    origin, ub, nb = coords[best], u[best], normal[best]
+    zero = np.zeros(len(best))
+    for c, (along, across) in enumerate(((lo[best], zero), (hi[best], zero), (hi[best], width[best]),
+                                         (lo[best], width[best]))):
+        result["rectangle"][present, c] = origin + ub * along[:, None] + nb * across[:, None]
+
+    # Antipodal çiftler: v köşesi, gelen ve giden kenarlarının uzak köşeleri arasındaki
+    # tüm köşelerle (paralel kenarlar için birer fazlası dahil) eşleşir; toplam O(n) çift
+    sizes = np.diff(offsets)[polygon_ids]
+    local_far = far - starts
+    incoming = np.roll(np.arange(len(coords)), 1)
+    incoming[edge_starts] = offsets[present + 1] - 1
+    first = (far[incoming] - starts - 1) % sizes
+    span = np.minimum((local_far - first) % sizes + 2, sizes)
+    owner = np.repeat(np.arange(len(coords)), span)
+    step = np.arange(span.sum()) - np.repeat(np.cumsum(span) - span, span)
+    partner = starts[owner] + (first[owner] + step) % sizes[owner]
+    d2 = np.sum((coords[owner] - coords[partner]) ** 2, axis=1)
+    # owner köşe sırasında olduğundan çiftler çokgenlere göre zaten gruplu
+    best_pair = _segment_argmin(-d2, np.searchsorted(polygon_ids[owner], present))
+    result["diameter"][present] = np.sqrt(d2[best_pair])
+    result["diameter_points"][present, 0] = coords[owner[best_pair]]
+    result["diameter_points"][present, 1] = coords[partner[best_pair]]
+    return result
+
+def caliper_metrics(points):
+    """Tek convex çokgen için batch_caliper_metrics sonucunu skaler değerlerle döndür"""
+    coords = normalize_convex(points)
+    result = batch_caliper_metrics(coords, [0, len(coords)], check_convex=False)
+    return {
+        "diameter": float(result["diameter"][0]),
+        "diameter_points": tuple(map(tuple, result["diameter_points"][0].tolist())),
+        "width": float(result["width"][0]),
+        "rectangle_area": float(result["rectangle_area"][0]),
+        "rectangle": [tuple(c) for c in result["rectangle"][0].tolist()],
+    }
+
+if __name__ == "__main__":
+    import time
+
+    # 🔸 Örnek: 4x2 dikdörtgen (bir doğrusal köşe ile)
+    rect = [(0, 0), (2, 0), (4, 0), (4, 2), (0, 2)]
+    metrics = caliper_metrics(rect)
+    print("Dikdörtgen -> çap: {:.4f}, genişlik: {:.4f}, dikdörtgen alanı: {:.4f}".format(
+        metrics["diameter"], metrics["width"], metrics["rectangle_area"]))
+
+    # Tek büyük convex çokgen: seri O(n) kumpas ile vektörel sürüm
+    rng = np.random.default_rng(0)
+    n_points = 1000000
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False) + 0.3
+    big = np.column_stack([3 * np.cos(angles), np.sin(angles)])
+    for name, fn in (("seri", rotating_calipers), ("vektörel", caliper_metrics)):
+        start_time = time.time()
+        metrics = fn(big)
+        print("📐 {:<9} {} köşe: çap {:.6f}, genişlik {:.6f}, alan {:.6f} ({:.3f} saniye)".format(
+            name, n_points, metrics["diameter"], metrics["width"], metrics["rectangle_area"], time.time() - start_time))
+
+    # Toplu mod: karışık yönlü, tekrar eden köşeli rastgele convex çokgenler
+    polygons = []
+    for k, n in enumerate(rng.integers(3, 40, 100000)):
+        a = np.sort(rng.uniform(0, 2 * np.pi, n))
+        poly = rng.uniform(-100, 100, 2) + rng.uniform(1, 10) * np.column_stack([np.cos(a), rng.uniform(0.2, 1) * np.sin(a)])
+        if k % 3 == 0:
+            poly = np.vstack([poly, poly[-1:]]) # tekrar eden köşe
+        polygons.append(poly[::-1] if k % 2 else poly)
+    coords = np.concatenate(polygons)
+    offsets = np.concatenate([[0], np.cumsum([len(p) for p in polygons])])
+    start_time = time.time()
+    batch = batch_caliper_metrics(coords, offsets)
+    print("📦 {} çokgen toplu ölçüm: {:.3f} saniye".format(len(polygons), time.time() - start_time))
+
+    # O(n²) kaba kuvvet ile karşılaştır
+    mismatches = 0
+    for k in rng.choice(len(polygons), 300, replace=False):
+        p = normalize_convex(polygons[k])
+        diameter = np.sqrt(((p[:, None] - p[None]) ** 2).sum(axis=2)).max()
+        e = np.roll(p, -1, axis=0) - p
+        u = e / np.hypot(e[:, 0], e[:, 1])[:, None]
+        rel = p[None] - p[:, None]
+        along = np.einsum("id,ijd->ij", u, rel)
+        across = u[:, 0, None] * rel[..., 1] - u[:, 1, None] * rel[..., 0]
+        expected = (diameter, across.max(axis=1).min(), (across.max(axis=1) * np.ptp(along, axis=1)).min())
+        serial = rotating_calipers(polygons[k])
+        actual = (batch["diameter"][k], batch["width"][k], batch["rectangle_area"][k])
+        mismatches += not (np.allclose(actual, expected) and np.allclose(
+            (serial["diameter"], serial["width"], serial["rectangle_area"]), expected))
+    print("Kaba kuvvet karşılaştırması: {} farklı sonuç".format(mismatches))
@@ -0,0 +1,260 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from point_query import normalize_convex
+from vectorized_solution import batch_is_convex, polygon_array
+
+VERTICES_PER_TASK = 1 << 20 # process havuzunda görev başına yaklaşık köşe sayısı
+OUTPUT_CAPACITY = 2 # paylaşılan çıktı tamponunda görev başına ayrılan yer: girdi köşesi × bu oran
+
+_WORKER = {} # process havuzu worker'ında paylaşılan tamponların görünümleri
+
+def clip_window(window):
+    """Kırpma penceresini saat yönünün tersine, tekrar ve doğrusal köşesiz hale getir
+
+    Pencere convex ve alanı sıfırdan büyük olmalıdır; değilse normalize_convex
+    ValueError fırlatır.
+    """
+    return normalize_convex(window)
+
+def window_sides(coords, a, b):
+    """Her nokta için (a, b, p) üçlüsünün cross_product_sign ile aynı aritmetikle dönüşü
+
+    Saat yönünün tersine pencerede >= 0 içeride (kenarın üstü dahil) demektir.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        return (b[0] - a[0]) * (coords[:, 1] - b[1]) - (b[1] - a[1]) * (coords[:, 0] - b[0])
+
+def _as_points(coords):
+    """(n, 2) float64 diziyi kopyalamadan n öğeli complex128 görünümüne çevir"""
+    return np.ascontiguousarray(coords).view(np.complex128).ravel()
+
+def next_vertex(offsets):
+    """Her köşeden sonraki köşenin indeksi (son köşe çokgenin ilk köşesine sarar)
+
+    batch_indices'ten daha ucuzdur: yalnızca boş olmayan çokgenlerin son
+    köşeleri düzeltilir, mod işlemi yapılmaz.
+    """
+    following = np.arange(1, offsets[-1] + 1, dtype=np.int64)
+    nonempty = offsets[1:] > offsets[:-1]
+    following[offsets[1:][nonempty] - 1] = offsets[:-1][nonempty]
+    return following
+
+def clip_half_plane(coords, offsets, a, b):
+    """Sutherland–Hodgman'ın tek adımı: tüm çokgenleri a->b kenarının sol yarı düzlemine kırp
+
+    Her (S, E) kenarı için, iç/dış durumu değişiyorsa önce kesişim noktası,
+    E içerideyse E yazılır. Çıktı konumları köşe başına yazılan nokta
+    sayısının kümülatif toplamından gelir; yeni ofsetler de aynı toplamdan okunur.
+    NaN içeren köşeler dışarıda sayılır.
+    """
+    if len(coords) == 0:
+        return coords, offsets
+    side = window_sides(coords, a, b)
+    inside = side >= 0
+    following = next_vertex(offsets)
+    inside_next = inside[following]
+    crossing = np.flatnonzero(inside != inside_next)
+    emitted = inside_next.astype(np.int64)
+    emitted[crossing] += 1
+    ends = np.cumsum(emitted)
+    clipped = np.empty((int(ends[-1]), 2))
+    # (x, y) satırları tek complex128 öğe olarak taşınır: 2 sütunlu fancy indekslemeden çok daha hızlı
+    points, out = _as_points(coords), _as_points(clipped)
+
+    e = following[crossing]
+    side_s, side_e = side[crossing], side[e]
+    # İşaretler zıt olduğundan payda sıfır olamaz
+    t = side_s / (side_s - side_e)
+    s_xy, e_xy = points[crossing].view(np.float64).reshape(-1, 2), points[e].view(np.float64).reshape(-1, 2)
+    out[ends[crossing] - emitted[crossing]] = _as_points(s_xy + t[:, None] * (e_xy - s_xy))
+    kept = np.flatnonzero(inside_next)
+    out[ends[kept] - 1] = points[following[kept]]
+    return clipped, np.concatenate([[0], ends])[offsets]
+
+def _clip_range(coords, offsets, window, return_convex):
+    """Bir çokgen aralığını pencereye kırp, istenirse convexliği de hesapla"""
+    for k in range(len(window)):
+        coords, offsets = clip_half_plane(coords, offsets, window[k], window[(k + 1) % len(window)])
+    convex = batch_is_convex(coords, offsets) if return_convex else None
+    return coords, offsets, convex
+
+def task_ranges(offsets, vertices_per_task=VERTICES_PER_TASK):
+    """Çokgenleri yaklaşık eşit köşe sayılı ardışık aralıklara böl"""
+    num_polygons = len(offsets) - 1
+    targets = np.arange(vertices_per_task, offsets[-1], vertices_per_task)
+    cuts = np.unique(np.concatenate([[0], np.searchsorted(offsets, targets), [num_polygons]]))
+    return list(zip(cuts[:-1].tolist(), cuts[1:].tolist()))
+
+def _shared_array(shape, dtype):
+    """Yeni SharedMemory bloğu ve üzerindeki NumPy görünümü"""
+    dtype = np.dtype(dtype)
+    block = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+def _init_clip_worker(specs, window, return_convex):
+    """Process havuzu başlatıcısı: girdi ve çıktı tamponlarına adlarıyla bağlan (kopyasız)"""
+    blocks = [SharedMemory(name=name) for name, _, _ in specs]
+    coords, offsets, out = (np.ndarray(shape, dtype=dtype, buffer=block.buf)
+                            for block, (_, shape, dtype) in zip(blocks, specs))
+    _WORKER.update(blocks=blocks, coords=coords, offsets=offsets, out=out, window=window, return_convex=return_convex)
+
+def _clip_task(task):
+    """Paylaşılan girdideki çokgen aralığını kırp, köşeleri paylaşılan çıktıdaki yerine yaz
+
+    Dönüş: (köşe sayısı, yerel ofsetler, convex, taşan köşeler). Köşeler
+    yalnızca ayrılan yere sığmazsa (çok sayıda kesişim) geri gönderilir.
+    """
+    first, last, out_start, capacity = task
+    w = _WORKER
+    offsets = w["offsets"][first:last + 1]
+    clipped, clipped_offsets, convex = _clip_range(
+        w["coords"][offsets[0]:offsets[-1]], offsets - offsets[0], w["window"], w["return_convex"])
+    if len(clipped) > capacity:
+        return len(clipped), clipped_offsets, convex, clipped
+    w["out"][out_start:out_start + len(clipped)] = clipped
+    return len(clipped), clipped_offsets, convex, None
+
+def usable_cpus():
+    """Bu sürecin çalışabildiği CPU sayısı"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _merge_results(results, return_convex):
+    """Görev çıktılarını tek (koordinatlar, ofsetler[, convex]) grubunda birleştir"""
+    if not results:
+        results = [(np.zeros((0, 2)), np.zeros(1, dtype=np.int64), np.zeros(0, dtype=bool))]
+    shifts = np.cumsum([0] + [len(r[0]) for r in results[:-1]])
+    clipped = np.concatenate([r[0] for r in results])
+    clipped_offsets = np.concatenate([[0]] + [r[1][1:] + shift for r, shift in zip(results, shifts)])
+    if return_convex:
+        return clipped, clipped_offsets, np.concatenate([r[2] for r in results])
+    return clipped, clipped_offsets
+
+def _clip_in_pool(coords, offsets, window, return_convex, ranges, num_workers):
+    """Görevleri process havuzunda çalıştır; girdi ve çıktı köşeleri paylaşılan bellekte kalır
+
+    Worker'lara yalnızca çokgen aralıkları gider, geriye köşe sayıları,
+    ofsetler ve convex sonuçları döner; köşeler pickle ile taşınmaz.
+    """
+    sizes = np.array([offsets[e] - offsets[s] for s, e in ranges], dtype=np.int64)
+    capacities = OUTPUT_CAPACITY * sizes + len(window)
+    slots = np.concatenate([[0], np.cumsum(capacities)])
+    blocks, views = [], []
+    try:
+        for shape, dtype, source in ((coords.shape, coords.dtype, coords), (offsets.shape, offsets.dtype, offsets),
+                                     ((int(slots[-1]), 2), np.float64, None)):
+            block, view = _shared_array(shape, dtype)
+            blocks.append(block)
+            views.append(view)
+            if source is not None:
+                view[:] = source
+        specs = [(block.name, view.shape, view.dtype.str) for block, view in zip(blocks, views)]
+        tasks = [(s, e, int(slots[k]), int(capacities[k])) for k, (s, e) in enumerate(ranges)]
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_clip_worker,
+                                 initargs=(specs, window, return_convex)) as executor:
+            results = [(views[2][start:start + count] if overflow is None else overflow, local_offsets, convex)
+                       for (count, local_offsets, convex, overflow), start
+                       in zip(executor.map(_clip_task, tasks), slots[:-1].tolist())]
+        merged = _merge_results(results, return_convex) # paylaşılan tampondan tek kopya
+        del results
+        return merged
+    finally:
+        del views[:] # tampon görünümleri kapanmadan önce bırakılmalı
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def clip_batch(coords, offsets, window, return_convex=False, num_workers=1, vertices_per_task=VERTICES_PER_TASK):
+    """Çokgen grubunu convex pencereye kırp
+
+    Dönüş: (kırpılmış_koordinatlar, kırpılmış_ofsetler) ya da return_convex ile
+    (..., convex). k. çıktı çokgeni k. girdi çokgeninin kırpılmış halidir;
+    pencerenin dışında kalanlar boş çokgen olur (convex=True). Convexlik
+    sonuçları kırpmayla aynı görevde, yeni üretilen köşeler üzerinde hesaplanır.
+    num_workers > 1 ise görevler process havuzuna dağıtılır; girdi ve çıktı
+    köşeleri paylaşılan bellekte tutulur. Worker sayısı kullanılabilir CPU
+    sayısıyla sınırlanır: tek CPU'da havuz yalnızca ek yük getirir.
+    """
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    window = clip_window(window)
+    coords = coords[offsets[0]:offsets[-1]]
+    offsets = offsets - offsets[0]
+    ranges = task_ranges(offsets, vertices_per_task)
+    num_workers = min(num_workers, usable_cpus())
+    if num_workers > 1 and len(ranges) > 1:
+        return _clip_in_pool(coords, offsets, window, return_convex, ranges, num_workers)
+    results = [_clip_range(coords[offsets[s]:offsets[e]], offsets[s:e + 1] - offsets[s], window, return_convex)
+               for s, e in ranges]
+    return _merge_results(results, return_convex)
+
+def clip_polygon(points, window):
+    """Tek çokgeni convex pencereye kırp ve köşelerini döndür"""
+    coords = polygon_array(points)
+    clipped, _ = clip_batch(coords, [0, len(coords)], window)
+    return clipped
+
+def clip_polygon_reference(points, window):
+    """Saf Python Sutherland–Hodgman (doğrulama ve karşılaştırma için)"""
+    window = clip_window(window).tolist()
+    output = [tuple(p) for p in polygon_array(points).tolist()]
+    for k in range(len(window)):
+        a, b = window[k], window[(k + 1) % len(window)]
+        if not output:
+            break
+        polygon, output = output, []
+        sides = [(b[0] - a[0]) * (p[1] - b[1]) - (b[1] - a[1]) * (p[0] - b[0]) for p in polygon]
+        for i in range(len(polygon)):
+            j = (i + 1) % len(polygon)
+            if (sides[i] >= 0) != (sides[j] >= 0):
+                t = sides[i] / (sides[i] - sides[j])
+                s, e = polygon[i], polygon[j]
+                output.append((s[0] + t * (e[0] - s[0]), s[1] + t * (e[1] - s[1])))
+            if sides[j] >= 0:
+                output.append(polygon[j])
+    return np.asarray(output, dtype=np.float64).reshape(-1, 2)
+
+if __name__ == "__main__":
+    import time
+
+    # 🔸 Örnek: kare pencereye kırpılan içbükey çokgen
+    window = [(0, 0), (4, 0), (4, 4), (0, 4)]
+    points = [(-1, 1), (2, -1), (5, 1), (2, 2), (5, 5), (-1, 5)]
+    print("Kırpılmış çokgen:", clip_polygon(points, window).tolist())
+
+    # Sahneye dağılmış çok sayıda küçük çokgen, altıgen pencere
+    rng = np.random.default_rng(0)
+    num_polygons = 1000000
+    sizes = rng.integers(3, 12, num_polygons)
+    centers = rng.uniform(-100, 100, (num_polygons, 2))
+    polygon_ids = np.repeat(np.arange(num_polygons), sizes)
+    # Her çokgenin açıları kendi içinde sıralı: yıldız biçimli (çoğu içbükey) çokgenler
+    angles = np.sort(polygon_ids * 2 * np.pi + rng.uniform(0, 2 * np.pi, len(polygon_ids))) - polygon_ids * 2 * np.pi
+    radii = rng.uniform(0.5, 3, len(angles)) * np.where(rng.random(len(angles)) < 0.3, 0.4, 1.0)
+    coords = np.repeat(centers, sizes, axis=0) + radii[:, None] * np.column_stack([np.cos(angles), np.sin(angles)])
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    hexagon = 90 * np.column_stack([np.cos(np.arange(6) * np.pi / 3), np.sin(np.arange(6) * np.pi / 3)])
+    print("\n📦 {} çokgen, {} köşe, altıgen pencere | kullanılabilir CPU: {}".format(
+        num_polygons, len(coords), usable_cpus()))
+
+    for workers in (1, 4):
+        start_time = time.perf_counter()
+        clipped, clipped_offsets, convex = clip_batch(coords, offsets, hexagon, return_convex=True, num_workers=workers)
+        print("   ✂️  {} worker: {:.3f}s | çıktı {} köşe, {} boş olmayan çokgen, {} convex".format(
+            workers, time.perf_counter() - start_time, len(clipped), int((np.diff(clipped_offsets) > 0).sum()),
+            int(convex.sum())))
+
+    # Saf Python referansı ile alt kümede karşılaştırma
+    sample = rng.choice(num_polygons, 20000, replace=False)
+    start_time = time.perf_counter()
+    expected = [clip_polygon_reference(coords[offsets[k]:offsets[k + 1]], hexagon) for k in sample]
+    reference_time = time.perf_counter() - start_time
+    mismatches = sum(not np.array_equal(clipped[clipped_offsets[k]:clipped_offsets[k + 1]], e)
+                     for k, e in zip(sample, expected))
+    print("   🐍 Saf Python, {} çokgen: {:.3f}s (tüm grup için ~{:.1f}s) | farklı sonuç: {}".format(
+        len(sample), reference_time, reference_time * num_polygons / len(sample), mismatches))
@@ -1,190 +1,303 @@
+import argparse
+import base64
+import html
+import json
+import math
+import os
+import sys
+import time
+from collections import defaultdict
+
+import matplotlib
+matplotlib.use("Agg") # pencere açmadan dosyaya çiz
 import matplotlib.pyplot as plt
-import numpy as np
 
-def create_comprehensive_report():
-    """Tüm test sonuçlarını içeren kapsamlı rapor"""
-    
-    print("🎯 ÇOKGEN CONVEXLİK KONTROLÜ - PERFORMANS ANALİZİ RAPORU")
-    print("="*70)
-    
-    # Test sonuçlarımızın özeti
-    test_results = {
-        "Küçük Nokta Sayıları (1K-200K)": {
-            "nokta_aralığı": "1,000 - 200,000",
-            "thread_sayısı": 8,
-            "en_iyi_hızlanma": "1.19x (200K nokta)",
-            "ortalama_hızlanma": "1.10x",
-            "gözlem": "Paralel avantaj sınırlı (thread overhead)"
-        },
-        "Büyük Nokta Sayıları (50K-2M)": {
-            "nokta_aralığı": "50,000 - 2,000,000", 
-            "thread_sayısı": 16,
-            "en_iyi_hızlanma": "1.19x (2M nokta)",
-            "ortalama_hızlanma": "1.10x",
-            "gözlem": "Paralel avantaj belirginleşiyor"
-        },
-        "Ekstrem Nokta Sayıları (1M-10M)": {
-            "nokta_aralığı": "1,000,000 - 10,000,000",
-            "thread_sayısı": 16,
-            "en_iyi_hızlanma": "1.18x (1M nokta)",
-            "ortalama_hızlanma": "1.16x",
-            "gözlem": "Sürekli paralel avantaj"
+DEFAULT_INPUTS = ["scaling_results/scaling_study.json", "memory_results/memory_profile.json"]
+
+def load_cases(paths):
+    """Benchmark JSON dosyalarındaki (scaling_study, memory_profile) ölçümleri oku"""
+    cases = []
+    hosts = []
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        if "host" in data:
+            hosts.append(data["host"])
+        for case in data.get("cases", []):
+            case = dict(case)
+            case.setdefault("study", "size")
+            case["source"] = os.path.basename(path)
+            cases.append(case)
+    return cases, hosts
+
+def best_by_size(cases):
+    """Her (backend, boyut) için en hızlı ölçüm (en iyi worker sayısıyla)"""
+    best = {}
+    for case in cases:
+        key = (case["backend"], case["size"])
+        if key not in best or case["seconds"] < best[key]["seconds"]:
+            best[key] = case
+    return best
+
+def backend_tables(cases, baseline="serial"):
+    """Backend başına satırlar: süre, temel backend'e göre hızlanma ve verimlilik"""
+    best = best_by_size(cases)
+    # Verimlilik aynı backend'in aynı boyuttaki tek worker ölçümüne göre hesaplanır
+    single = {(c["backend"], c["study"], c["size"]): c["seconds"] for c in cases if c["workers"] == 1}
+    tables = defaultdict(list)
+    for case in sorted(cases, key=lambda c: (c["backend"], c["study"], c["size"], c["workers"])):
+        base = best.get((baseline, case["size"]))
+        speedup = base["seconds"] / case["seconds"] if base and case["seconds"] > 0 else None
+        one = single.get((case["backend"], case["study"], case["size"]))
+        tables[case["backend"]].append({
+            "study": case["study"], "size": case["size"], "workers": case["workers"],
+            "seconds": case["seconds"], "speedup": speedup,
+            "efficiency": one / (case["seconds"] * case["workers"]) if one and case["seconds"] > 0 else None,
+            "bytes_per_vertex": case.get("bytes_per_vertex"),
+        })
+    return dict(tables)
+
+def find_crossovers(cases, baseline="serial"):
+    """Her backend'in temel backend'den hızlı hale geldiği nokta sayısını bul
+
+    Boyutlar arasında hızlanma 1'i kestiğinde log(boyut)-log(hızlanma) doğrusal
+    aralanır. Hiç kesmiyorsa None: ya her boyutta hızlı ya da hiç hızlı değil.
+    """
+    best = best_by_size(cases)
+    sizes_by_backend = defaultdict(set)
+    for backend, size in best:
+        sizes_by_backend[backend].add(size)
+    crossovers = {}
+    for backend, sizes in sizes_by_backend.items():
+        if backend == baseline:
+            continue
+        points = [(s, best[(baseline, s)]["seconds"] / best[(backend, s)]["seconds"])
+                  for s in sorted(sizes) if (baseline, s) in best]
+        if len(points) < 2:
+            continue
+        crossing = None
+        for (s0, r0), (s1, r1) in zip(points, points[1:]):
+            if (r0 < 1) != (r1 < 1):
+                # log-log doğrusal aralama ile hızlanmanın 1 olduğu boyut
+                t = -math.log(r0) / (math.log(r1) - math.log(r0))
+                crossing = {"size": float(math.exp(math.log(s0) + t * (math.log(s1) - math.log(s0)))),
+                            "direction": "hızlanıyor" if r1 >= 1 else "yavaşlıyor"}
+        crossovers[backend] = {
+            "crossing": crossing,
+            "faster_everywhere": all(r >= 1 for _, r in points),
+            "slower_everywhere": all(r < 1 for _, r in points),
+            "points": points,
         }
-    }
-    
-    print("\n📊 TEST SONUÇLARI ÖZETİ")
-    print("-"*70)
-    
-    for test_name, results in test_results.items():
-        print(f"\n🔹 {test_name}")
-        print(f"   Nokta Aralığı: {results['nokta_aralığı']}")
-        print(f"   Thread Sayısı: {results['thread_sayısı']}")
-        print(f"   En İyi Hızlanma: {results['en_iyi_hızlanma']}")
-        print(f"   Ortalama Hızlanma: {results['ortalama_hızlanma']}")
-        print(f"   Gözlem: {results['gözlem']}")
-    
-    print("\n" + "="*70)
-    print("📈 ANA BULGULAR")
-    print("="*70)
-    
-    findings = [
-        "1️⃣ Küçük nokta sayılarında (<50K) paralel işlem overhead nedeniyle yavaşlayabilir",
-        "2️⃣ 50K-100K nokta aralığında paralel ve seri performans dengelenir",
-        "3️⃣ 100K+ nokta sayılarında paralel işlem sürekli avantaj sağlar", 
-        "4️⃣ En yüksek hızlanma oranı ~1.19x (16-20% performance artışı)",
-        "5️⃣ Nokta sayısı arttıkça paralel avantaj daha stabil hale gelir",
-        "6️⃣ Thread sayısı artışı (8→16) belirgin performans artışı sağlamaz",
-        "7️⃣ 10M+ nokta sayılarında bile %15-18 hızlanma elde edilir"
-    ]
-    
-    for finding in findings:
-        print(f"\n{finding}")
-    
-    print("\n" + "="*70)
-    print("🔍 TEKNİK ANALİZ")
-    print("="*70)
-    
-    technical_analysis = {
-        "Paralel İşlem Stratejisi": "Cross-product hesaplamaları thread'lere dağıtılır",
-        "Thread Senkronizasyonu": "Lock mekanizması ile race condition önlenir",
-        "Optimal Thread Sayısı": "8-16 thread arası optimal performans",
-        "Memory Overhead": "Minimal - sadece sonuç listesi paylaşılır",
-        "CPU Utilization": "Multi-core sistemlerde iyi ölçeklenir"
-    }
-    
-    for aspect, detail in technical_analysis.items():
-        print(f"\n🔧 {aspect}:")
-        print(f"   {detail}")
-    
-    print("\n" + "="*70)
-    print("💡 ÖNERİLER")
-    print("="*70)
-    
-    recommendations = [
-        "✅ 100K+ nokta sayılarında paralel işlem kullanın",
-        "✅ 8-16 thread ile optimal performans elde edin", 
-        "✅ Thread overhead'ı minimize etmek için büyük veri setlerinde kullanın",
-        "✅ Memory-bound işlemler için paralel avantaj sınırlı olabilir",
-        "✅ Real-time uygulamalarda paralel versiyon tercih edin"
-    ]
-    
-    for rec in recommendations:
-        print(f"\n{rec}")
-    
-    print("\n" + "="*70)
-    print("🎨 GRAFİK ANALİZ ÖZETİ")
-    print("="*70)
-    
-    graph_insights = [
-        "📊 Log-log grafiğinde paralel avantaj net görülür",
-        "📈 Hızlanma oranı nokta sayısı ile stabil kalır (~1.15x)",
-        "⏱️ Zaman kazancı nokta sayısı ile linear artar",
-        "🎯 Verimlilik %6-7 seviyelerinde (16 thread için)"
-    ]
-    
-    for insight in graph_insights:
-        print(f"\n{insight}")
-    
-    print("\n" + "="*70)
-    print("🔚 SONUÇ")
-    print("="*70)
-    
-    conclusion = """
-Bu analiz, çokgen convexlik kontrolü algoritmasının paralel ve seri versiyonları
-arasındaki performans farkını kapsamlı olarak incelemiştir.
-
-🎯 TEMEL SONUÇ: Paralel işlem, büyük nokta sayılarında (100K+) tutarlı bir 
-şekilde %15-19 performans artışı sağlamaktadır.
-
-🚀 PROJE BAŞARISI: Paralel programlama teknikleri kullanılarak, hesaplama 
-yoğun işlemlerde anlamlı hızlanma elde edilmiştir.
-
-📊 VERİ ODESTEKLİ: 1 milyon ila 10 milyon nokta aralığında yapılan testler, 
-paralel işlemin tutarlı avantajını kanıtlamıştır.
-"""
-    
-    print(conclusion)
-    print("\n" + "="*70)
-    print("📝 RAPOR SONU - " + "Paralel Programlama Projesi")
-    print("="*70)
-
-def create_summary_visualization():
-    """Özet görselleştirme"""
-    # Örnek veri (testlerden elde edilen)
-    nokta_sayilari = [50000, 100000, 200000, 500000, 1000000, 2000000, 5000000, 10000000]
-    seri_sureler = [0.032, 0.062, 0.128, 0.312, 0.656, 1.283, 3.180, 6.474]
-    paralel_sureler = [0.033, 0.060, 0.114, 0.273, 0.554, 1.103, 2.839, 5.532]
-    hizlanma = [s/p for s, p in zip(seri_sureler, paralel_sureler)]
-    
+    return crossovers
+
+def case_key(case):
+    return (case["backend"], case["study"], case["size"], case["workers"])
+
+def diff_runs(old_cases, new_cases, threshold=0.1):
+    """İki çalıştırma arasındaki süre değişimleri (oran = yeni / eski)"""
+    old = {case_key(c): c for c in old_cases}
+    rows = []
+    for case in new_cases:
+        before = old.get(case_key(case))
+        if before is None or not before["seconds"]:
+            continue
+        ratio = case["seconds"] / before["seconds"]
+        status = "gerileme" if ratio > 1 + threshold else ("iyileşme" if ratio < 1 - threshold else "aynı")
+        rows.append({"backend": case["backend"], "study": case["study"], "size": case["size"],
+                     "workers": case["workers"], "old": before["seconds"], "new": case["seconds"],
+                     "ratio": ratio, "status": status})
+    return sorted(rows, key=lambda r: -abs(math.log(r["ratio"])))
+
+def generate_findings(tables, crossovers, diff_rows, baseline="serial"):
+    """Bulgular metnini sabit yazılmış cümleler yerine ölçümlerden üret"""
+    findings = []
+    for backend, rows in tables.items():
+        scored = [r for r in rows if r["speedup"] is not None]
+        if backend == baseline or not scored:
+            continue
+        top = max(scored, key=lambda r: r["speedup"])
+        findings.append(f"{backend}: en iyi hızlanma {top['speedup']:.2f}x ({top['size']:,} nokta, "
+                        f"{top['workers']} worker, paralel verim {_fmt(top['efficiency'], '{:.2f}')})")
+    for backend, info in sorted(crossovers.items()):
+        if info["crossing"]:
+            findings.append(f"{backend}: ~{info['crossing']['size']:,.0f} noktada {baseline}'a göre "
+                            f"{info['crossing']['direction']}")
+        elif info["faster_everywhere"]:
+            findings.append(f"{backend}: ölçülen tüm boyutlarda {baseline}'dan hızlı")
+        elif info["slower_everywhere"]:
+            findings.append(f"{backend}: ölçülen hiçbir boyutta {baseline}'dan hızlı değil")
+    regressions = [r for r in diff_rows if r["status"] == "gerileme"]
+    improvements = [r for r in diff_rows if r["status"] == "iyileşme"]
+    if diff_rows:
+        findings.append(f"Önceki çalıştırmaya göre {len(regressions)} gerileme, {len(improvements)} iyileşme")
+    return findings
+
+def plot_report(cases, tables, crossovers, diff_rows, output_dir, baseline="serial"):
+    """Rapor grafiklerini PNG olarak kaydet, dosya yollarını döndür"""
+    paths = []
+    best = best_by_size(cases)
+    backends = sorted({c["backend"] for c in cases})
+
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-    fig.suptitle('Paralel vs Seri Çokgen Convexlik Analizi - Kapsamlı Sonuç', fontsize=16, fontweight='bold')
-    
-    # 1. Performans karşılaştırması
-    ax1.loglog(nokta_sayilari, seri_sureler, 'b-o', label='Seri', linewidth=2, markersize=6)
-    ax1.loglog(nokta_sayilari, paralel_sureler, 'r-s', label='Paralel', linewidth=2, markersize=6)
-    ax1.set_xlabel('Nokta Sayısı')
-    ax1.set_ylabel('Süre (saniye)')
-    ax1.set_title('Seri vs Paralel Çalışma Süreleri')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # 2. Hızlanma trendi
-    ax2.semilogx(nokta_sayilari, hizlanma, 'g-^', linewidth=2, markersize=8)
-    ax2.axhline(y=1, color='k', linestyle='--', alpha=0.5)
-    ax2.set_xlabel('Nokta Sayısı')
-    ax2.set_ylabel('Hızlanma Oranı')
-    ax2.set_title('Paralel Hızlanma Trendi')
-    ax2.grid(True, alpha=0.3)
-    
-    # 3. Zaman kazancı
-    zaman_kazanci = [s - p for s, p in zip(seri_sureler, paralel_sureler)]
-    ax3.bar(range(len(nokta_sayilari)), zaman_kazanci, alpha=0.7, color='orange')
-    ax3.set_xlabel('Test Sırası')
-    ax3.set_ylabel('Zaman Kazancı (saniye)')
-    ax3.set_title('Paralel İşlemden Zaman Kazancı')
-    ax3.set_xticks(range(len(nokta_sayilari)))
-    ax3.set_xticklabels([f'{n//1000}K' if n < 1000000 else f'{n//1000000}M' for n in nokta_sayilari])
-    ax3.grid(True, alpha=0.3)
-    
-    # 4. Performans artış yüzdesi
-    performans_artis = [(s-p)/s * 100 for s, p in zip(seri_sureler, paralel_sureler)]
-    ax4.semilogx(nokta_sayilari, performans_artis, 'm-d', linewidth=2, markersize=6)
-    ax4.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax4.set_xlabel('Nokta Sayısı')
-    ax4.set_ylabel('Performans Artışı (%)')
-    ax4.set_title('Paralel İşlem Performans Artışı')
-    ax4.grid(True, alpha=0.3)
-    
+    fig.suptitle("Çokgen Convexlik Benchmark Raporu", fontsize=16, fontweight="bold")
+    for backend in backends:
+        sizes = sorted(s for b, s in best if b == backend)
+        if sizes:
+            line, = ax1.loglog(sizes, [best[(backend, s)]["seconds"] for s in sizes], "-o", label=backend)
+            speed = [(s, best[(baseline, s)]["seconds"] / best[(backend, s)]["seconds"])
+                     for s in sizes if (baseline, s) in best]
+            if speed and backend != baseline:
+                ax2.semilogx(*zip(*speed), "-o", color=line.get_color(), label=backend)
+                crossing = crossovers.get(backend, {}).get("crossing")
+                if crossing:
+                    ax2.axvline(crossing["size"], color=line.get_color(), linestyle=":", alpha=0.7)
+
+        # Yalnızca strong scaling çalışmasının satırları: aynı boyuttaki memory_profile
+        # (study="size") ölçümleri farklı koşullarda alındığından eğriye karışmamalı
+        strong = defaultdict(list)
+        for row in tables.get(backend, []):
+            if row["study"] == "strong":
+                strong[row["size"]].append(row)
+        for size, rows in strong.items():
+            rows = sorted(rows, key=lambda r: r["workers"])
+            if len(rows) < 2:
+                continue
+            base = rows[0]["seconds"] * rows[0]["workers"]
+            workers = [r["workers"] for r in rows]
+            ax3.plot(workers, [base / r["seconds"] for r in rows], "-o", label=f"{backend} ({size:,})")
+            ax4.plot(workers, [base / r["seconds"] / r["workers"] for r in rows], "-o", label=f"{backend} ({size:,})")
+
+    ax2.axhline(y=1, color="k", linestyle="--", alpha=0.5)
+    ax4.axhline(y=1, color="k", linestyle="--", alpha=0.5)
+    titles = [(ax1, "Çalışma Süresi (en iyi yapılandırma)", "Nokta Sayısı", "Süre (saniye)"),
+              (ax2, f"{baseline} Backend'ine Göre Hızlanma", "Nokta Sayısı", "Hızlanma"),
+              (ax3, "Worker Sayısına Göre Hızlanma", "Worker Sayısı", "Hızlanma"),
+              (ax4, "Paralel Verimlilik", "Worker Sayısı", "Verimlilik")]
+    for ax, title, xlabel, ylabel in titles:
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.grid(True, alpha=0.3)
+        if ax.get_legend_handles_labels()[0]:
+            ax.legend(fontsize=8)
     plt.tight_layout()
-    plt.show()
+    path = os.path.join(output_dir, "overview.png")
+    fig.savefig(path, dpi=110)
+    plt.close(fig)
+    paths.append(path)
+
+    if diff_rows:
+        rows = diff_rows[:30]
+        fig, ax = plt.subplots(figsize=(12, max(4, 0.3 * len(rows))))
+        labels = [f"{r['backend']} {r['study']} {r['size']:,} / {r['workers']}w" for r in rows]
+        colors = ["#d62728" if r["status"] == "gerileme" else "#2ca02c" if r["status"] == "iyileşme" else "#7f7f7f"
+                  for r in rows]
+        ax.barh(range(len(rows)), [r["ratio"] for r in rows], color=colors)
+        ax.axvline(1, color="k", linestyle="--")
+        ax.set_yticks(range(len(rows)))
+        ax.set_yticklabels(labels, fontsize=8)
+        ax.invert_yaxis()
+        ax.set_xlabel("Süre oranı (yeni / eski)")
+        ax.set_title("Önceki Çalıştırmaya Göre Değişim")
+        plt.tight_layout()
+        path = os.path.join(output_dir, "diff.png")
+        fig.savefig(path, dpi=110)
+        plt.close(fig)
+        paths.append(path)
+    return paths
+
+def _fmt(value, pattern):
+    return "-" if value is None else pattern.format(value)
+
+def render_html(tables, findings, diff_rows, image_paths, hosts, inputs):
+    """Grafikleri base64 olarak gömen, çevrimdışı açılabilen tek HTML dosyası üret"""
+    parts = ["<!DOCTYPE html><html><head><meta charset='utf-8'><title>Convexlik Benchmark Raporu</title>",
+             "<style>body{font-family:sans-serif;margin:2em;max-width:1200px}table{border-collapse:collapse;"
+             "margin-bottom:1.5em}td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}"
+             "th{background:#eee}.gerileme{color:#c00}.iyileşme{color:#080}img{max-width:100%}</style>",
+             "</head><body><h1>Çokgen Convexlik Benchmark Raporu</h1>",
+             f"<p>Oluşturulma: {html.escape(time.strftime('%Y-%m-%d %H:%M:%S'))} | Girdiler: "
+             f"{html.escape(', '.join(inputs))}</p>"]
+    for host in hosts:
+        parts.append(f"<p>Makine: {html.escape(str(host.get('hostname')))} — {html.escape(str(host.get('platform')))}"
+                     f", {host.get('cpu_count')} CPU, Python {html.escape(str(host.get('python')))}</p>")
+        if "topology" in host:
+            parts.append(f"<p>Topoloji: {html.escape(json.dumps(host['topology']))}</p>")
+
+    parts.append("<h2>Bulgular</h2><ul>")
+    parts.extend(f"<li>{html.escape(f)}</li>" for f in findings)
+    parts.append("</ul>")
+
+    for path in image_paths:
+        with open(path, "rb") as f:
+            encoded = base64.b64encode(f.read()).decode("ascii")
+        parts.append(f"<img alt='{html.escape(os.path.basename(path))}' src='data:image/png;base64,{encoded}'>")
+
+    parts.append("<h2>Backend Tabloları</h2>")
+    for backend, rows in sorted(tables.items()):
+        parts.append(f"<h3>{html.escape(backend)}</h3><table><tr><th>Çalışma</th><th>Nokta</th><th>Worker</th>"
+                     "<th>Süre (s)</th><th>Hızlanma</th><th>Verim</th><th>B/köşe</th></tr>")
+        for r in rows:
+            parts.append(f"<tr><td>{html.escape(r['study'])}</td><td>{r['size']:,}</td><td>{r['workers']}</td>"
+                         f"<td>{r['seconds']:.5f}</td><td>{_fmt(r['speedup'], '{:.2f}x')}</td>"
+                         f"<td>{_fmt(r['efficiency'], '{:.2f}')}</td><td>{_fmt(r['bytes_per_vertex'], '{:.1f}')}</td></tr>")
+        parts.append("</table>")
+
+    if diff_rows:
+        parts.append("<h2>Önceki Çalıştırmaya Göre Fark</h2><table><tr><th>Backend</th><th>Çalışma</th><th>Nokta</th>"
+                     "<th>Worker</th><th>Eski (s)</th><th>Yeni (s)</th><th>Oran</th><th>Durum</th></tr>")
+        for r in diff_rows:
+            parts.append(f"<tr class='{r['status']}'><td>{html.escape(r['backend'])}</td><td>{html.escape(r['study'])}</td>"
+                         f"<td>{r['size']:,}</td><td>{r['workers']}</td><td>{r['old']:.5f}</td><td>{r['new']:.5f}</td>"
+                         f"<td>{r['ratio']:.2f}x</td><td>{r['status']}</td></tr>")
+        parts.append("</table>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+def create_comprehensive_report(inputs, output_dir, baseline_runs=None, baseline_backend="serial", threshold=0.1):
+    """Benchmark JSON'larından tablo, grafik, bulgu ve fark içeren rapor paketini yaz"""
+    cases, hosts = load_cases(inputs)
+    if not cases:
+        raise ValueError("Girdi dosyalarında ölçüm bulunamadı")
+    old_cases = load_cases(baseline_runs)[0] if baseline_runs else []
+
+    tables = backend_tables(cases, baseline_backend)
+    crossovers = find_crossovers(cases, baseline_backend)
+    diff_rows = diff_runs(old_cases, cases, threshold) if old_cases else []
+    findings = generate_findings(tables, crossovers, diff_rows, baseline_backend)
+
+    os.makedirs(output_dir, exist_ok=True)
+    image_paths = plot_report(cases, tables, crossovers, diff_rows, output_dir, baseline_backend)
+    html_path = os.path.join(output_dir, "report.html")
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(render_html(tables, findings, diff_rows, image_paths, hosts, inputs))
+    with open(os.path.join(output_dir, "summary.json"), "w") as f:
+        json.dump({"findings": findings, "tables": tables, "diff": diff_rows,
+                   "crossovers": {b: {k: v for k, v in info.items() if k != "points"}
+                                  for b, info in crossovers.items()}}, f, indent=2, ensure_ascii=False)
+    return {"html": html_path, "images": image_paths, "findings": findings, "diff": diff_rows}
 
 if __name__ == "__main__":
-    # Kapsamlı rapor oluştur
-    create_comprehensive_report()
-    
-    # Özet görselleştirme
-    create_summary_visualization()
-    
-    print("\n🎊 RAPOR TAMAMLANDI!")
-    print("Bu analiz, paralel programlamanın gerçek dünya uygulamalarındaki")
-    print("etkisini kanıtlamış ve ölçülebilir sonuçlar sunmuştur.")
+    parser = argparse.ArgumentParser(description="Benchmark JSON çıktılarından çevrimdışı HTML/PNG rapor")
+    parser.add_argument("inputs", nargs="*", help="scaling_study.json / memory_profile.json dosyaları")
+    parser.add_argument("--baseline-run", nargs="+", help="fark görünümü için önceki çalıştırmanın JSON dosyaları")
+    parser.add_argument("--baseline-backend", default="serial", help="hızlanmanın hesaplandığı backend")
+    parser.add_argument("--threshold", type=float, default=0.1, help="gerileme/iyileşme sayılan oran eşiği")
+    parser.add_argument("--output", default="report_bundle")
+    args = parser.parse_args()
+
+    inputs = args.inputs or [p for p in DEFAULT_INPUTS if os.path.exists(p)]
+    if not inputs:
+        sys.exit("❌ Benchmark JSON bulunamadı: önce scaling_study.py veya memory_profile.py çalıştırın")
+
+    print("🎯 ÇOKGEN CONVEXLİK KONTROLÜ - PERFORMANS ANALİZİ RAPORU")
+    print("=" * 70)
+    report = create_comprehensive_report(inputs, args.output, args.baseline_run, args.baseline_backend,
+                                         args.threshold)
+    print("\n📈 ANA BULGULAR")
+    print("-" * 70)
+    for finding in report["findings"]:
+        print(f"🔹 {finding}")
+    print(f"\n📝 Rapor: {report['html']}")
+    for path in report["images"]:
+        print(f"🎨 Grafik: {path}")
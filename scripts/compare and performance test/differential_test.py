@@ -0,0 +1,181 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from backends import BACKENDS, as_point_list, prepare_backend
+from series_solution import is_polygon_convex as reference_convex
+from vectorized_solution import chunk_ranges
+
+SLOW_BACKENDS = {"distributed": 25} # yavaş backend'ler yalnızca her N. durumda çalışır
+WORKER_CHOICES = [1, 2, 3, 4, 7, 16]
+
+def regular_polygon(rng, n):
+    """Rastgele açılarla convex çokgen (saat yönünün tersine)"""
+    angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+    radius = rng.uniform(1, 100)
+    return np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+
+def star_polygon(rng, n):
+    """İç ve dış yarıçap arasında zikzak yapan concave çokgen"""
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    radius = np.where(np.arange(n) % 2 == 0, 10.0, rng.uniform(2, 9))
+    return np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+
+def with_collinear_runs(rng, coords):
+    """Kenarların üzerine doğrusal ara noktalar ekle"""
+    result = []
+    for i in range(len(coords)):
+        p, q = coords[i], coords[(i + 1) % len(coords)]
+        result.append(p)
+        for t in np.linspace(0, 1, rng.integers(0, 4) + 2)[1:-1]:
+            result.append(p + (q - p) * t)
+    return np.array(result)
+
+def with_duplicates(rng, coords):
+    """Bazı köşeleri art arda tekrarla"""
+    repeats = rng.integers(1, 4, len(coords)) * (rng.random(len(coords)) < 0.3) + 1
+    return np.repeat(coords, repeats, axis=0)
+
+def with_boundary_dent(rng, coords, workers):
+    """Convex çokgende tam bir thread parça sınırındaki köşeyi içeri it"""
+    coords = coords.copy()
+    n = len(coords)
+    boundaries = [start for start, _ in chunk_ranges(n, workers)]
+    # Sınır üçlüsünün ilk, orta ve son noktası (halo'nun kapsadığı köşeler)
+    i = (rng.choice(boundaries) + rng.integers(-2, 3)) % n
+    coords[i] = coords[i] * 0.1
+    return coords
+
+def generate_case(seed):
+    """Seed'den tekrarlanabilir bir zorlayıcı test durumu üret"""
+    rng = np.random.default_rng(seed)
+    workers = int(rng.choice(WORKER_CHOICES))
+    kind = rng.choice(["convex", "concave", "triangle", "collinear", "duplicates",
+                       "huge", "boundary", "tiny"])
+    n = int(rng.integers(4, 64)) if rng.random() < 0.8 else int(rng.integers(64, 3000))
+
+    if kind == "triangle":
+        coords = rng.uniform(-10, 10, (3, 2))
+    elif kind == "tiny":
+        coords = rng.uniform(-10, 10, (int(rng.integers(1, 3)), 2))
+    elif kind == "concave":
+        coords = star_polygon(rng, max(n, 4))
+    elif kind == "collinear":
+        coords = with_collinear_runs(rng, regular_polygon(rng, n))
+    elif kind == "duplicates":
+        coords = with_duplicates(rng, regular_polygon(rng, n))
+    elif kind == "huge":
+        coords = regular_polygon(rng, n) * 10.0 ** rng.integers(10, 300)
+    elif kind == "boundary":
+        coords = with_boundary_dent(rng, regular_polygon(rng, n), workers)
+    else:
+        coords = regular_polygon(rng, n)
+
+    if rng.random() < 0.5:
+        coords = coords[::-1] # saat yönü / tersi
+    if rng.random() < 0.3:
+        coords = np.round(coords) # tam sayı koordinatlar: gerçek doğrusallıklar
+    return {"seed": int(seed), "kind": str(kind), "workers": workers,
+            "coords": np.ascontiguousarray(coords, dtype=np.float64)}
+
+def disagrees(name, coords, workers):
+    """Backend referanstan farklı sonuç verirse (veya hata atarsa) açıklama döndür"""
+    expected = reference_convex(as_point_list(coords))
+    try:
+        backend = BACKENDS[name]
+        actual = backend["run"](prepare_backend(backend, coords, workers), workers)
+    except Exception as exc:
+        return f"{type(exc).__name__}: {exc}"
+    if bool(actual) != expected:
+        return f"beklenen {expected}, bulunan {bool(actual)}"
+    return None
+
+def shrink_case(name, coords, workers):
+    """Hatayı koruyarak köşe sayısını, worker sayısını ve koordinatları küçült"""
+    # 1) Köşe parçalarını silme (delta debugging)
+    chunk = max(1, len(coords) // 2)
+    while chunk >= 1:
+        i = 0
+        removed = False
+        while i < len(coords):
+            candidate = np.concatenate([coords[:i], coords[i + chunk:]])
+            if len(candidate) > 0 and disagrees(name, candidate, workers):
+                coords = candidate
+                removed = True
+            else:
+                i += chunk
+        if not removed:
+            chunk //= 2
+
+    # 2) Daha az worker ile tekrar dene
+    for smaller in range(1, workers):
+        if disagrees(name, coords, smaller):
+            workers = smaller
+            break
+
+    # 3) Koordinatları tam sayıya yuvarla ve ölçeği küçült
+    for simplify in (np.round, lambda c: np.round(c / 10.0 ** np.floor(np.log10(np.abs(c).max() + 1)))):
+        with np.errstate(all="ignore"):
+            candidate = simplify(coords)
+        if np.isfinite(candidate).all() and disagrees(name, candidate, workers):
+            coords = candidate
+    return coords, workers
+
+def run_differential(seed=0, iterations=300, backends=None, shrink=True, verbose=True):
+    """Tüm backend'leri referans is_polygon_convex ile karşılaştır ve hataları küçült"""
+    backends = list(BACKENDS) if backends is None else backends
+    failures = []
+    seen = set()
+    start_time = time.time()
+
+    for k in range(iterations):
+        case = generate_case(seed * 1000003 + k)
+        for name in backends:
+            if k % SLOW_BACKENDS.get(name, 1) != 0:
+                continue
+            reason = disagrees(name, case["coords"], case["workers"])
+            if reason is None:
+                continue
+            coords, workers = case["coords"], case["workers"]
+            if shrink:
+                coords, workers = shrink_case(name, coords, workers)
+            key = (name, len(coords), workers)
+            if key in seen:
+                continue # aynı küçük örneği tekrar raporlama
+            seen.add(key)
+            failure = {"backend": name, "seed": case["seed"], "kind": case["kind"],
+                       "original_size": len(case["coords"]), "workers": workers,
+                       "reason": disagrees(name, coords, workers), "reproducer": coords.tolist()}
+            failures.append(failure)
+            if verbose:
+                print(f"❌ {name} seed={case['seed']} ({case['kind']}): {failure['reason']} "
+                      f"→ {len(coords)} köşe, {workers} worker")
+
+    if verbose:
+        print(f"\n{iterations} durum × {len(backends)} backend: {len(failures)} farklı hata "
+              f"({time.time() - start_time:.1f} saniye)")
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backend'ler arası rastgele diferansiyel doğruluk testi")
+    parser.add_argument("--seed", type=int, default=random.randrange(1000))
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--no-shrink", action="store_true")
+    parser.add_argument("--output", help="hataların (küçültülmüş örneklerle) yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    print(f"🔍 DİFERANSİYEL TEST (seed={args.seed})")
+    print("=" * 60)
+    failures = run_differential(args.seed, args.iterations, args.backends, not args.no_shrink)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "failures": failures}, f, indent=2)
+    sys.exit(1 if failures else 0)
@@ -1,9 +1,14 @@
 import matplotlib.pyplot as plt
 import numpy as np
+import os
+import sys
 import time
 import threading
 import random
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from affinity import pin_current_thread, plan_placement, topology_summary
+
 # Global değişkenler paralel işlem için
 PARALLEL_SIGNS = []
 PARALLEL_LOCK = threading.Lock()
@@ -42,8 +47,10 @@ def generate_large_polygon(n_points):
         points.append((x, y))
     return points
 
-def parallel_convex_worker(points_batch):
+def parallel_convex_worker(points_batch, cpu=None):
     """Paralel işlem için worker fonksiyonu"""
+    if cpu is not None:
+        pin_current_thread([cpu]) # işletim sistemi worker'ı çekirdekler arasında taşımasın
     local_signs = []
     
     for point_trio in points_batch:
@@ -55,8 +62,8 @@ def parallel_convex_worker(points_batch):
     with PARALLEL_LOCK:
         PARALLEL_SIGNS.extend(local_signs)
 
-def measure_parallel_time(points, num_threads=16):
-    """Paralel kodun çalışma süresini ölç"""
+def measure_parallel_time(points, num_threads=16, placement=None):
+    """Paralel kodun çalışma süresini ölç (placement: i. thread'in sabitleneceği CPU listesi)"""
     global PARALLEL_SIGNS
     PARALLEL_SIGNS.clear()
     
@@ -81,7 +88,8 @@ def measure_parallel_time(points, num_threads=16):
         batch = point_trios[start_idx:end_idx]
         
         if batch:
-            thread = threading.Thread(target=parallel_convex_worker, args=(batch,))
+            cpu = placement[i % len(placement)] if placement else None
+            thread = threading.Thread(target=parallel_convex_worker, args=(batch, cpu))
             threads.append(thread)
             thread.start()
         
@@ -98,12 +106,16 @@ def measure_parallel_time(points, num_threads=16):
     end_time = time.time()
     return end_time - start_time, result
 
-def extreme_performance_test():
+def extreme_performance_test(pin=True, skip_smt=False):
     """Çok yüksek nokta sayıları ile test"""
     point_counts = [1000000, 2000000, 5000000, 10000000]
+    placement = plan_placement(16, skip_smt=skip_smt) if pin else None
     
     print("🚀 EKSTREM PERFORMANS TESTİ")
     print("="*60)
+    # Ölçümlerin tekrarlanabilmesi için kullanılan topoloji ve yerleşim kaydedilir
+    print(f"Topoloji: {topology_summary()}")
+    print(f"Thread yerleşimi: {placement if pin else 'işletim sistemine bırakıldı'}")
     print("Nokta Sayısı | Seri (s) | Paralel (s) | Hızlanma | Kazanç")
     print("-"*60)
     
@@ -122,7 +134,7 @@ def extreme_performance_test():
         serial_time = time.time() - start
         
         print("  → Paralel test...")
-        parallel_time, parallel_result = measure_parallel_time(points, num_threads=16)
+        parallel_time, parallel_result = measure_parallel_time(points, num_threads=16, placement=placement)
         
         speedup = serial_time / parallel_time if parallel_time > 0 else 1
         time_saved = serial_time - parallel_time
@@ -134,7 +146,8 @@ def extreme_performance_test():
             'serial_time': serial_time,
             'parallel_time': parallel_time,
             'speedup': speedup,
-            'time_saved': time_saved
+            'time_saved': time_saved,
+            'cpus': placement
         })
     
     print("\n" + "="*60)
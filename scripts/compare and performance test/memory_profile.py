@@ -0,0 +1,168 @@
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from backends import BACKENDS, as_point_list, prepare_backend
+from extreme_performance_test import measure_parallel_time
+
+RAW_BYTES_PER_VERTEX = 2 * 8 # float64 x, y: ham koordinat tamponu
+
+# Eski ölçüm yolu: diğer backend'lerle aynı girdiden tuple listesi + point_trios listesi
+LEGACY_BACKENDS = {
+    "legacy_trios": {
+        "prepare": as_point_list,
+        "run": lambda points, workers: measure_parallel_time(points, num_threads=max(1, workers))[1],
+        "parallel": True,
+    },
+}
+
+def read_proc_status():
+    """/proc/self/status içinden anlık (VmRSS) ve tepe (VmHWM) RSS değerlerini byte olarak oku"""
+    values = {}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    values[key] = int(rest.split()[0]) * 1024
+    except OSError:
+        pass
+    if "VmHWM" not in values:
+        # /proc yoksa getrusage tepe değeri kullanılır (sıfırlanamaz)
+        values["VmHWM"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        values.setdefault("VmRSS", values["VmHWM"])
+    return values
+
+def reset_peak_rss():
+    """Tepe RSS sayacını (VmHWM) anlık RSS'e sıfırla; başarılıysa True döndür"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def profile_memory(prepare, run, coords, workers):
+    """Girdi hazırlığı + çalıştırma sırasında tepe RSS ve izlenen Python ayırmalarını ölç"""
+    gc.collect()
+    peak_reset = reset_peak_rss()
+    rss_before = read_proc_status()["VmRSS"]
+
+    tracemalloc.start()
+    prepared = prepare(coords)
+    input_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = run(prepared, workers)
+    _, run_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    status = read_proc_status()
+    del prepared
+    gc.collect()
+
+    n = len(coords)
+    raw_bytes = n * RAW_BYTES_PER_VERTEX
+    # reset_peak tepeyi o anki izlenen boyuta (hazırlanmış girdi dahil) çeker: run_peak zaten toplam tepedir
+    traced_peak = run_peak
+    return {
+        "result": bool(result),
+        "peak_rss_bytes": status["VmHWM"],
+        "rss_growth_bytes": status["VmHWM"] - rss_before,
+        "peak_rss_reset": peak_reset,
+        "children_peak_rss_bytes": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024,
+        "traced_input_bytes": input_bytes,
+        "traced_peak_bytes": traced_peak,
+        "traced_working_bytes": traced_peak - input_bytes,
+        "bytes_per_vertex": traced_peak / n if n else 0.0,
+        "raw_bytes": raw_bytes,
+        "amplification": traced_peak / raw_bytes if raw_bytes else 0.0,
+    }
+
+def profile_case(name, backend, coords, workers, repeats=3):
+    """Bir backend/boyut çifti için süreyi ve belleği birlikte ölç"""
+    prepared = prepare_backend(backend, coords, workers)
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        backend["run"](prepared, workers)
+        times.append(time.perf_counter() - start_time)
+    del prepared
+
+    # tracemalloc süreyi bozduğu için bellek ayrı bir çalıştırmada ölçülür
+    case = {"backend": name, "size": len(coords), "workers": workers, "seconds": min(times)}
+    case.update(profile_memory(lambda c: prepare_backend(backend, c, workers), backend["run"], coords, workers))
+    return case
+
+def run_memory_profile(backends, sizes, workers, repeats):
+    """Tüm backend ve boyutlar için bellek/süre ölçümü yap"""
+    all_backends = dict(BACKENDS, **LEGACY_BACKENDS)
+    cases = []
+    print(f"{'Backend':<20} {'Nokta':>10} {'Süre (s)':>10} {'Tepe RSS (MB)':>14} "
+          f"{'İzlenen (MB)':>13} {'B/köşe':>8} {'Büyütme':>8}")
+    print("-" * 90)
+    for size in sizes:
+        angles = np.linspace(0, 2 * np.pi, size, endpoint=False)
+        coords = np.column_stack([10 * np.cos(angles), 10 * np.sin(angles)])
+        for name in backends:
+            case = profile_case(name, all_backends[name], coords, workers, repeats)
+            cases.append(case)
+            print(f"{name:<20} {size:>10,} {case['seconds']:>10.4f} {case['rss_growth_bytes'] / 2**20:>14.1f} "
+                  f"{case['traced_peak_bytes'] / 2**20:>13.1f} {case['bytes_per_vertex']:>8.1f} "
+                  f"{case['amplification']:>7.1f}x")
+    return cases
+
+def find_regressions(cases, baseline_cases, tolerance=0.2):
+    """Temel çalıştırmaya göre tolerance oranından fazla büyüyen bellek/süre değerlerini bul"""
+    baseline = {(c["backend"], c["size"]): c for c in baseline_cases}
+    regressions = []
+    for case in cases:
+        base = baseline.get((case["backend"], case["size"]))
+        if base is None:
+            continue
+        for metric in ("traced_peak_bytes", "rss_growth_bytes", "seconds"):
+            old, new = base.get(metric), case.get(metric)
+            if old and new and new > old * (1 + tolerance):
+                regressions.append({"backend": case["backend"], "size": case["size"], "metric": metric,
+                                    "baseline": old, "current": new, "ratio": new / old})
+    return regressions
+
+if __name__ == "__main__":
+    all_names = list(BACKENDS) + list(LEGACY_BACKENDS)
+    parser = argparse.ArgumentParser(description="Benchmark'larda süre ile birlikte bellek profili")
+    parser.add_argument("--backends", nargs="+", default=[n for n in all_names if n != "distributed"],
+                        choices=all_names)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100000, 1000000])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", default="memory_results/memory_profile.json")
+    parser.add_argument("--baseline", help="karşılaştırılacak önceki memory_profile.json")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print("🧠 BELLEK PROFİLİ")
+    print("=" * 90)
+    cases = run_memory_profile(args.backends, args.sizes, args.workers, args.repeats)
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"cases": cases}, f, indent=2)
+    print(f"\nJSON: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(cases, json.load(f)["cases"], args.tolerance)
+        if regressions:
+            print("\n❌ GERİLEMELER:")
+            for r in regressions:
+                print(f"   {r['backend']} {r['size']:,} nokta {r['metric']}: "
+                      f"{r['baseline']:.4g} → {r['current']:.4g} ({r['ratio']:.2f}x)")
+            sys.exit(1)
+        print("\n✅ Temel çalıştırmaya göre gerileme yok")
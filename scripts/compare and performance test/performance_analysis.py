@@ -5,6 +5,7 @@ import threading
 import random
 
 # Global değişkenler paralel işlem için
+NUM_THREADS = 16 # paralel ölçümde kullanılan thread sayısı
 PARALLEL_SIGNS = []
 PARALLEL_LOCK = threading.Lock()
 
@@ -160,7 +161,7 @@ def run_performance_analysis():
         print("  Paralel işlem test ediliyor...")
         parallel_times_temp = []
         for _ in range(2):
-            p_time, p_result = measure_parallel_time(points, num_threads=16)  # 16 thread kullan
+            p_time, p_result = measure_parallel_time(points, num_threads=NUM_THREADS)
             parallel_times_temp.append(p_time)
         avg_parallel_time = np.mean(parallel_times_temp)
         
@@ -183,7 +184,7 @@ def run_performance_analysis():
     
     return point_counts, serial_times, parallel_times, speedup_ratios
 
-def create_visualizations(point_counts, serial_times, parallel_times, speedup_ratios):
+def create_visualizations(point_counts, serial_times, parallel_times, speedup_ratios, num_threads=NUM_THREADS):
     """Sonuçları görselleştir"""
     
     # Figure ve subplotlar oluştur
@@ -221,12 +222,12 @@ def create_visualizations(point_counts, serial_times, parallel_times, speedup_ra
     ax3.set_xticks(range(len(point_counts)))
     ax3.set_xticklabels(point_counts)
     ax3.grid(True, alpha=0.3)    # 4. Verimlilik analizi
-    efficiency = [s / (p * 16) for s, p in zip(serial_times, parallel_times)]  # 16 thread kullanıldığı için
+    efficiency = [s / (p * num_threads) for s, p in zip(serial_times, parallel_times)]
     ax4.plot(point_counts, efficiency, 'm-d', linewidth=2, markersize=6)
     ax4.axhline(y=1, color='k', linestyle='--', alpha=0.5, label='İdeal verimlilik')
     ax4.set_xlabel('Nokta Sayısı')
     ax4.set_ylabel('Verimlilik (Seri / (Paralel × Thread Sayısı))')
-    ax4.set_title('Paralel İşlem Verimliliği (16 Thread)')
+    ax4.set_title(f'Paralel İşlem Verimliliği ({num_threads} Thread)')
     ax4.legend()
     ax4.grid(True, alpha=0.3)
     ax4.set_xscale('log')
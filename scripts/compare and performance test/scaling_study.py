@@ -0,0 +1,246 @@
+import argparse
+import json
+import os
+import platform
+import socket
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg") # pencere açmadan dosyaya çiz
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from affinity import topology_summary
+from backends import BACKENDS, prepare_backend
+from differential_test import run_differential
+from memory_profile import profile_memory
+
+def generate_convex_polygon(n_points):
+    """Tüm üçlülerin taranmasını gerektiren convex çokgen oluştur (erken çıkış yok)"""
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    return np.column_stack([10 * np.cos(angles), 10 * np.sin(angles)])
+
+def worker_counts(max_workers):
+    """1'den max_workers'a kadar ikinin kuvvetleri (ve max_workers'ın kendisi)"""
+    counts = []
+    p = 1
+    while p < max_workers:
+        counts.append(p)
+        p *= 2
+    counts.append(max_workers)
+    return counts
+
+def host_info():
+    """Ölçeklenme sonuçlarının hangi makinede alındığını kaydet"""
+    return {
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "topology": topology_summary(), # sonuçların aynı yerleşimle tekrarlanabilmesi için
+    }
+
+def time_backend(name, points, workers, repeats=3, memory=False):
+    """Backend'i repeats kez çalıştır, en iyi süreyi ve sonucu döndür"""
+    backend = BACKENDS[name]
+    prepared = prepare_backend(backend, points, workers) # hazırlık süreye dahil değil
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result = backend["run"](prepared, workers)
+        times.append(time.perf_counter() - start_time)
+    case = {"backend": name, "size": len(points), "workers": workers,
+            "seconds": min(times), "result": bool(result)}
+    if "placement" in backend:
+        case["cpus"] = backend["placement"](workers)
+    if memory:
+        del prepared
+        case.update(profile_memory(lambda p: prepare_backend(backend, p, workers), backend["run"], points, workers))
+    return case
+
+def fit_amdahl(workers, speedups):
+    """Amdahl modeli S(p) = 1 / (f + (1 - f) / p) için seri oran f'yi bul"""
+    p = np.asarray(workers, dtype=np.float64)
+    s = np.asarray(speedups, dtype=np.float64)
+    mask = p > 1
+    if not mask.any():
+        return None
+    # 1/S - 1/p = f * (1 - 1/p) -> orijinden geçen en küçük kareler doğrusu
+    a = 1 / s[mask] - 1 / p[mask]
+    b = 1 - 1 / p[mask]
+    return float(np.clip(np.dot(a, b) / np.dot(b, b), 0.0, 1.0))
+
+def fit_gustafson(workers, scaled_speedups):
+    """Gustafson modeli S(p) = p - f * (p - 1) için seri oran f'yi bul"""
+    p = np.asarray(workers, dtype=np.float64)
+    s = np.asarray(scaled_speedups, dtype=np.float64)
+    mask = p > 1
+    if not mask.any():
+        return None
+    a = p[mask] - s[mask]
+    b = p[mask] - 1
+    return float(np.clip(np.dot(a, b) / np.dot(b, b), 0.0, 1.0))
+
+def strong_scaling(name, size, counts, repeats, memory=False):
+    """Sabit boyutta worker sayısını artır"""
+    points = generate_convex_polygon(size)
+    cases = []
+    for workers in counts:
+        case = time_backend(name, points, workers, repeats, memory)
+        case["study"] = "strong"
+        cases.append(case)
+    base = cases[0]["seconds"]
+    for case in cases:
+        case["speedup"] = base / case["seconds"]
+        case["efficiency"] = case["speedup"] / case["workers"]
+    return cases
+
+def weak_scaling(name, base_size, counts, repeats, memory=False):
+    """Worker başına boyut sabit kalacak şekilde boyutu worker sayısıyla büyüt"""
+    cases = []
+    for workers in counts:
+        case = time_backend(name, generate_convex_polygon(base_size * workers), workers, repeats, memory)
+        case["study"] = "weak"
+        cases.append(case)
+    base = cases[0]["seconds"]
+    for case in cases:
+        # Ölçeklenmiş hızlanma: p kat iş, p worker ile ne kadar sürede bitti
+        case["efficiency"] = base / case["seconds"]
+        case["speedup"] = case["workers"] * case["efficiency"]
+    return cases
+
+def run_scaling_study(backends, size, base_size, max_workers, repeats, memory=False):
+    """Her backend için strong ve weak scaling çalıştır, modelleri uydur"""
+    counts = worker_counts(max_workers)
+    cases = []
+    models = {}
+    for name in backends:
+        # Paralel olmayan backend'ler yalnızca referans olarak 1 worker ile ölçülür
+        backend_counts = counts if BACKENDS[name]["parallel"] else [1]
+        print(f"\n⚡ {name}: worker sayıları {backend_counts}")
+
+        strong = strong_scaling(name, size, backend_counts, repeats, memory)
+        weak = weak_scaling(name, base_size, backend_counts, repeats, memory)
+        cases.extend(strong)
+        cases.extend(weak)
+
+        for case in strong + weak:
+            line = (f"  {case['study']:<6} {case['workers']:>3} worker | {case['size']:>10,} nokta | "
+                    f"{case['seconds']:.4f}s | hızlanma {case['speedup']:.2f}x | verim {case['efficiency']:.2f}")
+            if memory:
+                line += f" | {case['bytes_per_vertex']:.1f} B/köşe"
+            print(line)
+
+        amdahl = fit_amdahl([c["workers"] for c in strong], [c["speedup"] for c in strong])
+        gustafson = fit_gustafson([c["workers"] for c in weak], [c["speedup"] for c in weak])
+        models[name] = {
+            "amdahl_serial_fraction": amdahl,
+            "amdahl_max_speedup": (1 / amdahl) if amdahl else None,
+            "gustafson_serial_fraction": gustafson,
+            "best_strong_speedup": max(c["speedup"] for c in strong),
+        }
+    return {
+        "host": host_info(),
+        "config": {"size": size, "base_size": base_size, "max_workers": max_workers, "repeats": repeats,
+                   "memory": memory},
+        "cases": cases,
+        "models": models,
+    }
+
+def create_scaling_plots(study, output_dir):
+    """Strong/weak hızlanma ve verimlilik grafiklerini PNG olarak kaydet"""
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+    fig.suptitle(f"Ölçeklenme Analizi - {study['host']['hostname']} ({study['host']['cpu_count']} CPU)",
+                 fontsize=16, fontweight='bold')
+
+    for name, model in study["models"].items():
+        strong = [c for c in study["cases"] if c["backend"] == name and c["study"] == "strong"]
+        weak = [c for c in study["cases"] if c["backend"] == name and c["study"] == "weak"]
+        if len(strong) < 2:
+            continue
+        workers = [c["workers"] for c in strong]
+
+        line, = ax1.plot(workers, [c["speedup"] for c in strong], '-o', label=name, linewidth=2)
+        f = model["amdahl_serial_fraction"]
+        if f is not None:
+            p = np.linspace(1, max(workers), 50)
+            ax1.plot(p, 1 / (f + (1 - f) / p), '--', color=line.get_color(), alpha=0.6,
+                     label=f"{name} Amdahl f={f:.2f}")
+        ax2.plot(workers, [c["efficiency"] for c in strong], '-o', color=line.get_color(), label=name)
+
+        ax3.plot([c["workers"] for c in weak], [c["speedup"] for c in weak], '-s',
+                 color=line.get_color(), label=name, linewidth=2)
+        g = model["gustafson_serial_fraction"]
+        if g is not None:
+            p = np.linspace(1, max(workers), 50)
+            ax3.plot(p, p - g * (p - 1), '--', color=line.get_color(), alpha=0.6,
+                     label=f"{name} Gustafson f={g:.2f}")
+        ax4.plot([c["workers"] for c in weak], [c["efficiency"] for c in weak], '-s',
+                 color=line.get_color(), label=name)
+
+    max_workers = study["config"]["max_workers"]
+    ax1.plot([1, max_workers], [1, max_workers], 'k:', alpha=0.5, label='İdeal')
+    ax3.plot([1, max_workers], [1, max_workers], 'k:', alpha=0.5, label='İdeal')
+    for ax in (ax2, ax4):
+        ax.axhline(y=1, color='k', linestyle='--', alpha=0.5, label='İdeal verimlilik')
+
+    titles = [
+        (ax1, 'Strong Scaling Hızlanma', 'Hızlanma (T1 / Tp)'),
+        (ax2, 'Strong Scaling Verimlilik', 'Verimlilik (Hızlanma / p)'),
+        (ax3, 'Weak Scaling Ölçeklenmiş Hızlanma', 'Ölçeklenmiş Hızlanma (p × T1 / Tp)'),
+        (ax4, 'Weak Scaling Verimlilik', 'Verimlilik (T1 / Tp)'),
+    ]
+    for ax, title, ylabel in titles:
+        ax.set_title(title)
+        ax.set_xlabel('Worker Sayısı')
+        ax.set_ylabel(ylabel)
+        ax.legend(fontsize=8)
+        ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    path = os.path.join(output_dir, "scaling_study.png")
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+    return path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Strong/weak scaling çalışması ve verimlilik modeli")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--size", type=int, default=1000000, help="strong scaling sabit nokta sayısı")
+    parser.add_argument("--base-size", type=int, default=250000, help="weak scaling worker başına nokta sayısı")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", default="scaling_results")
+    parser.add_argument("--memory", action="store_true", help="her ölçüme tepe RSS ve tracemalloc ekle")
+    parser.add_argument("--verify", type=int, default=100, help="ölçümden önceki diferansiyel test sayısı")
+    args = parser.parse_args()
+
+    if args.verify > 0:
+        print("🔍 Backend'ler referans sonuçla karşılaştırılıyor...")
+        failures = run_differential(0, args.verify, args.backends)
+        if failures:
+            sys.exit("❌ Hatalı backend'ler ölçülmeden önce düzeltilmeli")
+
+    print("📈 ÖLÇEKLENME ÇALIŞMASI")
+    print("="*60)
+    study = run_scaling_study(args.backends, args.size, args.base_size, args.max_workers, args.repeats,
+                              args.memory)
+
+    os.makedirs(args.output, exist_ok=True)
+    json_path = os.path.join(args.output, "scaling_study.json")
+    with open(json_path, "w") as f:
+        json.dump(study, f, indent=2)
+    plot_path = create_scaling_plots(study, args.output)
+
+    print("\n" + "="*60)
+    print("📊 MODEL SONUÇLARI")
+    print("="*60)
+    for name, model in study["models"].items():
+        amdahl = model["amdahl_serial_fraction"]
+        gustafson = model["gustafson_serial_fraction"]
+        print(f"{name:<20} Amdahl f: {'-' if amdahl is None else f'{amdahl:.3f}'} | "
+              f"Gustafson f: {'-' if gustafson is None else f'{gustafson:.3f}'} | "
+              f"en iyi hızlanma: {model['best_strong_speedup']:.2f}x")
+    print(f"\nJSON: {json_path}\nGrafik: {plot_path}")
@@ -0,0 +1,281 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from vectorized_solution import cross_product_signs, halo_chunk, polygon_array
+
+def vertex_turns(coords):
+    """Her köşedeki dönüş: i. değer (i-1, i, i+1) üçlüsünün çapraz çarpımı"""
+    if len(coords) < 3:
+        return np.zeros(len(coords))
+    return np.roll(cross_product_signs(halo_chunk(coords, 0, len(coords))), 1)
+
+def signed_area(coords):
+    """Shoelace formülü ile işaretli alan (saat yönünün tersi pozitif)"""
+    x, y = coords[:, 0], coords[:, 1]
+    return 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+def reflex_vertices(points):
+    """İçbükey (reflex) köşelerin indekslerini döndür (yönelimden bağımsız)"""
+    coords = polygon_array(points)
+    turns = vertex_turns(coords)
+    return np.nonzero(turns * np.sign(signed_area(coords)) < 0)[0]
+
+def piece_areas(coords, pieces):
+    """Parçaların işaretli alanlarını tek vektörel geçişte hesapla (parça başına shoelace)"""
+    if not pieces:
+        return np.zeros(0)
+    lengths = np.array([len(piece) for piece in pieces])
+    flat = np.fromiter((v for piece in pieces for v in piece), dtype=np.int64, count=int(lengths.sum()))
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    following = np.arange(1, len(flat) + 1)
+    following[starts + lengths - 1] = starts
+    x, y = coords[flat, 0], coords[flat, 1]
+    return 0.5 * np.add.reduceat(x * y[following] - y * x[following], starts)
+
+def clean_ring(coords):
+    """Tekrar eden ve doğrusal köşeleri at; kalan köşelerin orijinal indekslerini döndür"""
+    index = np.arange(len(coords))
+    while len(index) >= 3:
+        # Önce tekrarlar atılır: tekrar eden köşenin iki kopyası da sıfır dönüşlü görünür
+        distinct = np.any(coords[index] != np.roll(coords[index], -1, axis=0), axis=1)
+        index = index[distinct] if distinct.any() else index[:1]
+        keep = vertex_turns(coords[index]) != 0
+        if keep.all():
+            break
+        index = index[keep]
+    return index
+
+class _ReflexGrid:
+    """Ear testini hızlandırmak için reflex köşeleri tutan düzgün ızgara"""
+
+    def __init__(self, xs, ys, reflex):
+        xs_r = [xs[i] for i in reflex] or [0.0]
+        ys_r = [ys[i] for i in reflex] or [0.0]
+        self.min_x, self.min_y = min(xs), min(ys)
+        span = max(max(xs) - self.min_x, max(ys) - self.min_y, 1e-300)
+        # Hücre başına ortalama ~2 reflex köşe düşecek boyut
+        self.cell = span / max(1, int(math.sqrt(max(1, len(reflex)) / 2)))
+        self.cells = {}
+        for i, x, y in zip(reflex, xs_r, ys_r):
+            self.cells.setdefault(self.key(x, y), set()).add(i)
+
+    def key(self, x, y):
+        return int((x - self.min_x) // self.cell), int((y - self.min_y) // self.cell)
+
+    def discard(self, i, x, y):
+        bucket = self.cells.get(self.key(x, y))
+        if bucket is not None:
+            bucket.discard(i)
+
+    def query(self, x0, y0, x1, y1, remaining):
+        """Verilen sınırlayıcı kutuya değen hücrelerdeki reflex köşe kümelerinin listesi"""
+        kx0, ky0 = self.key(x0, y0)
+        kx1, ky1 = self.key(x1, y1)
+        if (kx1 - kx0 + 1) * (ky1 - ky0 + 1) > len(remaining):
+            # Büyük kutularda hücreleri gezmek kalan reflex köşeleri taramaktan pahalı
+            return [remaining]
+        cells = self.cells
+        return [cells[key] for key in ((kx, ky) for kx in range(kx0, kx1 + 1) for ky in range(ky0, ky1 + 1))
+                if key in cells]
+
+def ear_clip(xs, ys, turns=None):
+    """Saat yönünün tersine sıralı basit çokgeni üçgenle (ızgara hızlandırmalı ear clipping)
+
+    turns: vertex_turns ile vektörel hesaplanmış köşe dönüşleri. Verilirse
+    reflex kümesi ve yürüyüşün başladığı ilk kulak adayı buradan alınır;
+    köşe başına Python'da dönüş hesaplanmaz.
+    """
+    n = len(xs)
+    prev = [(i - 1) % n for i in range(n)]
+    nxt = [(i + 1) % n for i in range(n)]
+
+    def turn(i):
+        a, b = prev[i], nxt[i]
+        return (xs[i] - xs[a]) * (ys[b] - ys[i]) - (ys[i] - ys[a]) * (xs[b] - xs[i])
+
+    turns = np.array([turn(i) for i in range(n)]) if turns is None else np.asarray(turns)
+    # Yalnızca reflex köşeler bir kulak üçgeninin içinde kalabilir
+    reflex = set(np.flatnonzero(turns <= 0).tolist())
+    grid = _ReflexGrid(xs, ys, sorted(reflex))
+
+    def is_ear(i):
+        a, c = prev[i], nxt[i]
+        ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[i], ys[i], xs[c], ys[c]
+        if (bx - ax) * (cy - by) - (by - ay) * (cx - bx) < 0:
+            return False
+        # Doğrusal (dönüşü sıfır) köşeler sıfır alanlı kulak olarak kırpılabilir
+        for bucket in grid.query(min(ax, bx, cx), min(ay, by, cy), max(ax, bx, cx), max(ay, by, cy), reflex):
+            for r in bucket:
+                rx, ry = xs[r], ys[r]
+                if ((bx - ax) * (ry - ay) - (by - ay) * (rx - ax) >= 0 and
+                        (cx - bx) * (ry - by) - (cy - by) * (rx - bx) >= 0 and
+                        (ax - cx) * (ry - cy) - (ay - cy) * (rx - cx) >= 0 and r != a and r != c and r != i):
+                    return False
+        return True
+
+    triangles = []
+    remaining = n
+    # Yürüyüş vektörel geçişin bulduğu ilk convex köşeden (kulak adayı) başlar
+    convex = np.flatnonzero(turns > 0)
+    i = int(convex[0]) if len(convex) else 0
+    stall = 0
+    while remaining > 3:
+        if is_ear(i):
+            a, c = prev[i], nxt[i]
+            triangles.append((a, i, c))
+            nxt[a], prev[c] = c, a
+            reflex.discard(i)
+            grid.discard(i, xs[i], ys[i])
+            remaining -= 1
+            stall = 0
+            for j in (a, c):
+                if j in reflex and turn(j) > 0:
+                    # Convex hale gelen reflex köşe artık kulakları engelleyemez
+                    reflex.discard(j)
+                    grid.discard(j, xs[j], ys[j])
+            i = c
+        else:
+            i = nxt[i]
+            stall += 1
+            if stall > remaining:
+                raise ValueError("Çokgen basit değil (kendini kesiyor), üçgenleme yapılamadı")
+    triangles.append((prev[i], i, nxt[i]))
+    return triangles
+
+def hertel_mehlhorn(xs, ys, triangles):
+    """Gereksiz köşegenleri silerek üçgenleri convex parçalarda birleştir"""
+    succ = {} # (u, v): u etrafında saat yönünün tersine v'den sonraki komşu
+    pred = {} # (u, v): u etrafında v'den önceki komşu
+    for a, b, c in triangles:
+        for u, v, w in ((a, b, c), (b, c, a), (c, a, b)):
+            succ[(u, v)] = w
+            pred[(u, w)] = v
+
+    def convex_at(u, p, q):
+        return (xs[p] - xs[u]) * (ys[q] - ys[u]) - (ys[p] - ys[u]) * (xs[q] - xs[u]) >= 0
+
+    diagonals = [(u, v) for (u, v) in succ if u < v and (v, u) in succ and (u, v) in pred and (v, u) in pred]
+    for u, v in diagonals:
+        pu, qu = pred[(u, v)], succ[(u, v)]
+        pv, qv = pred[(v, u)], succ[(v, u)]
+        # Köşegen silindiğinde u ve v'deki yeni açılar 180 dereceyi geçmemeli
+        if convex_at(u, pu, qu) and convex_at(v, pv, qv):
+            for x, p, q, y in ((u, pu, qu, v), (v, pv, qv, u)):
+                succ[(x, p)] = q
+                pred[(x, q)] = p
+                del succ[(x, y)], pred[(x, y)]
+
+    # Kalan düzlemsel grafiğin yüzlerini dolaş: a -> b kenarından sonra b -> pred[(b, a)]
+    pieces = []
+    visited = set()
+    for (b, a) in pred:
+        if (a, b) in visited:
+            continue
+        piece = []
+        u, v = a, b
+        while (u, v) not in visited:
+            visited.add((u, v))
+            piece.append(u)
+            u, v = v, pred[(v, u)]
+        pieces.append(piece)
+    return pieces
+
+def decompose_indices(points):
+    """Çokgeni convex parçalara ayır; her parça orijinal köşe indekslerinin listesi (CCW)"""
+    coords = polygon_array(points)
+    index = clean_ring(coords)
+    if len(index) < 3:
+        return []
+    if signed_area(coords[index]) < 0:
+        index = index[::-1] # saat yönünün tersine çevir
+    ring = coords[index]
+
+    # Convexlik kontrolündeki çapraz çarpım geçişi: reflex köşeler ve kulak adayları buradan gelir
+    turns = vertex_turns(ring)
+    if not (turns < 0).any():
+        return [index.tolist()] # reflex köşe yok: çokgen zaten convex
+
+    xs = ring[:, 0].tolist()
+    ys = ring[:, 1].tolist()
+    pieces = hertel_mehlhorn(xs, ys, ear_clip(xs, ys, turns))
+    # Doğrusal köşelerden kalan sıfır alanlı parçalar atılır
+    return [index[piece].tolist() for piece, area in zip(pieces, piece_areas(ring, pieces)) if area > 0]
+
+def decompose(points):
+    """Çokgeni convex parçalara ayır ve parçaların koordinatlarını döndür"""
+    coords = polygon_array(points)
+    return [coords[piece] for piece in decompose_indices(coords)]
+
+def _decompose_range(args):
+    """Process havuzu için: bir çokgen aralığını ayrıştır"""
+    coords, offsets = args
+    return [decompose_indices(coords[offsets[k]:offsets[k + 1]]) for k in range(len(offsets) - 1)]
+
+def decompose_batch(coords, offsets, num_workers=1, polygons_per_task=256):
+    """Çok sayıda çokgeni ayrıştır
+
+    Dönüş: (parça_koordinatları, parça_ofsetleri, parça_sahibi) — parça_sahibi
+    her parçanın hangi girdi çokgenine ait olduğunu gösterir.
+    """
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    num_polygons = len(offsets) - 1
+    tasks = []
+    for start in range(0, num_polygons, polygons_per_task):
+        end = min(start + polygons_per_task, num_polygons)
+        tasks.append((coords[offsets[start]:offsets[end]], offsets[start:end + 1] - offsets[start]))
+
+    if num_workers > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            results = list(executor.map(_decompose_range, tasks))
+    else:
+        results = [_decompose_range(task) for task in tasks]
+
+    piece_index = []
+    piece_offsets = [0]
+    piece_owner = []
+    polygon_id = 0
+    for task_pieces in results:
+        for pieces in task_pieces:
+            base = offsets[polygon_id]
+            for piece in pieces:
+                piece_index.extend(base + i for i in piece)
+                piece_offsets.append(len(piece_index))
+                piece_owner.append(polygon_id)
+            polygon_id += 1
+    return (coords[np.asarray(piece_index, dtype=np.int64)].reshape(-1, 2),
+            np.asarray(piece_offsets, dtype=np.int64), np.asarray(piece_owner, dtype=np.int64))
+
+if __name__ == "__main__":
+    import time
+    from vectorized_solution import batch_is_convex, is_polygon_convex
+
+    # 🔸 Örnek: concave polygon
+    points = [(1, 1), (3, 1), (4, 3), (2, 2), (4, 5), (3, 5), (1, 5), (0, 3)]
+    pieces = decompose(points)
+    print("Reflex köşeler:", reflex_vertices(points).tolist())
+    print("{} convex parça:".format(len(pieces)), [p.tolist() for p in pieces])
+
+    for n_points in (10000, 100000):
+        angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+        radius = np.where(np.arange(n_points) % 4 == 0, 15.0, 8.0) # generate_large_polygon zikzak deseni
+        star = np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+        start_time = time.time()
+        pieces = decompose(star)
+        elapsed_time = time.time() - start_time
+        print("{} köşe: {} parça, hepsi convex: {} ({:.2f} saniye)".format(
+            n_points, len(pieces), all(is_polygon_convex(p) for p in pieces), elapsed_time))
+
+    rng = np.random.default_rng(0)
+    small = [star_points for star_points in (
+        np.column_stack([r * np.cos(a), r * np.sin(a)])
+        for a, r in ((np.linspace(0, 2 * np.pi, 12, endpoint=False), rng.uniform(4, 10, 12)) for _ in range(20000)))]
+    coords = np.concatenate(small)
+    offsets = np.arange(len(small) + 1) * 12
+    start_time = time.time()
+    piece_coords, piece_offsets, owner = decompose_batch(coords, offsets, num_workers=2)
+    elapsed_time = time.time() - start_time
+    print("Toplu: {} çokgen -> {} parça, hepsi convex: {} ({:.2f} saniye)".format(
+        len(small), len(owner), bool(batch_is_convex(piece_coords, piece_offsets).all()), elapsed_time))
@@ -0,0 +1,324 @@
+import json
+import struct
+
+import numpy as np
+
+from vectorized_solution import batch_is_convex, polygon_array
+
+MAGIC = b"CVXD"
+VERSION = 1
+CODECS = ("bitpack", "varint")
+DEFAULT_RESOLUTION = 1e-7 # derece cinsinden ~1 cm
+DEFAULT_BLOCK_VERTICES = 1 << 16
+MAX_GRID = 1 << 53 # float64'in tam sayıları kesin tuttuğu sınır; check_store ızgarayı float64 olarak kullanır
+
+# ---------------------------------------------------------------------------
+# Tamsayı kodlamaları (hepsi vektörel)
+# ---------------------------------------------------------------------------
+
+def zigzag_encode(values):
+    """İşaretli farkları küçük işaretsiz sayılara çevir: 0, -1, 1, -2 -> 0, 1, 2, 3"""
+    values = values.astype(np.int64)
+    return ((values << 1) ^ (values >> 63)).view(np.uint64)
+
+def zigzag_decode(values):
+    """zigzag_encode'un tersi"""
+    values = values.view(np.uint64)
+    return ((values >> np.uint64(1)) ^ (np.uint64(0) - (values & np.uint64(1)))).view(np.int64)
+
+def bit_width(values):
+    """Dizideki en büyük değeri tutmaya yeten bit sayısı"""
+    return int(values.max()).bit_length() if len(values) else 0
+
+def bitpack_encode(values):
+    """Tüm değerleri aynı genişlikte bitlerle art arda yaz: (genişlik, bayt dizisi)"""
+    width = bit_width(values)
+    if width == 0:
+        return 0, b""
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    bits = ((values[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+    return width, np.packbits(bits.ravel()).tobytes()
+
+def _byte_array(data):
+    """bytes veya (memmap) uint8 dizisini kopyalamadan uint8 dizisi olarak gör"""
+    if isinstance(data, np.ndarray):
+        return data.view(np.uint8)
+    return np.frombuffer(data, dtype=np.uint8)
+
+def bitpack_decode(data, width, count):
+    """bitpack_encode'un tersi
+
+    Her değer, başladığı bayttan itibaren 4 veya 8 baytlık büyük-endian
+    kelime olarak (kopyasız kayan pencereden) okunur, kaydırılıp maskelenir;
+    57 bitten geniş değerler bit bit açılır.
+    """
+    if width == 0:
+        return np.zeros(count, dtype=np.uint64)
+    raw = _byte_array(data)
+    if width > 57:
+        bits = np.unpackbits(raw, count=count * width).reshape(count, width)
+        padded = np.zeros((count, 64), dtype=np.uint8)
+        padded[:, 64 - width:] = bits
+        return np.packbits(padded, axis=1).view(">u8").ravel().astype(np.uint64)
+    # 25 bite kadar değer (en fazla 7 bit kaymayla) 32 bitlik kelimeye sığar
+    word, dtype = (4, np.uint32) if width <= 25 else (8, np.uint64)
+    padded = np.concatenate([raw, np.zeros(word, dtype=np.uint8)])
+    windows = np.lib.stride_tricks.as_strided(padded, shape=(len(padded) - word + 1, word), strides=(1, 1))
+    bit_pos = np.arange(count, dtype=np.int64) * width
+    words = windows[bit_pos >> 3].view(f">u{word}").ravel().astype(dtype)
+    values = (words << (bit_pos & 7).astype(dtype)) >> dtype(8 * word - width)
+    return values.astype(np.uint64)
+
+def varint_encode(values):
+    """LEB128 varint: 7 bitlik gruplar, devam eden baytlarda en üst bit 1"""
+    if len(values) == 0:
+        return b""
+    max_bytes = max(1, -(-bit_width(values) // 7))
+    sizes = np.ones(len(values), dtype=np.int64)
+    for k in range(1, max_bytes):
+        sizes += values >= (np.uint64(1) << np.uint64(7 * k))
+    k = np.arange(max_bytes, dtype=np.uint64)
+    groups = ((values[:, None] >> (np.uint64(7) * k)) & np.uint64(0x7F)).astype(np.uint8)
+    groups[np.arange(max_bytes)[None, :] < (sizes[:, None] - 1)] |= 0x80
+    return groups[np.arange(max_bytes)[None, :] < sizes[:, None]].tobytes()
+
+def varint_decode(data, count):
+    """varint_encode'un tersi: bitiş baytlarından değer sınırları bulunur, gruplar reduceat ile toplanır"""
+    raw = _byte_array(data)
+    if count == 0:
+        return np.zeros(0, dtype=np.uint64)
+    ends = np.flatnonzero(raw < 0x80)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    position = np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)
+    parts = (raw & 0x7F).astype(np.uint64) << (np.uint64(7) * position.astype(np.uint64))
+    return np.add.reduceat(parts, starts)
+
+def encode_values(values, codec):
+    """Tek eksen akışını seçilen kodlamayla yaz: (genişlik, baytlar)"""
+    if codec == "bitpack":
+        return bitpack_encode(values)
+    if codec == "varint":
+        return 0, varint_encode(values)
+    raise ValueError(f"Bilinmeyen kodlama: {codec}")
+
+def decode_values(data, width, count, codec):
+    """encode_values'un tersi"""
+    if codec == "bitpack":
+        return bitpack_decode(data, width, count)
+    return varint_decode(data, count)
+
+# ---------------------------------------------------------------------------
+# Blok dosya biçimi
+# ---------------------------------------------------------------------------
+
+def plan_blocks(offsets, block_vertices=DEFAULT_BLOCK_VERTICES):
+    """Çokgenleri bölmeden yaklaşık block_vertices köşelik bloklara grupla: [(ilk, son)] çokgen aralıkları"""
+    blocks = []
+    first = 0
+    for k in range(1, len(offsets)):
+        if offsets[k] - offsets[first] >= block_vertices:
+            blocks.append((first, k))
+            first = k
+    if first < len(offsets) - 1:
+        blocks.append((first, len(offsets) - 1))
+    return blocks
+
+def quantize(coords, resolution):
+    """Koordinatları en küçük köşeye göre resolution ızgarasına yuvarla: (origin, int64 ızgara)
+
+    Sonlu olmayan koordinatlar veya ızgarada 2^53'ü aşan aralık (int64 taşması ya
+    da float64'te kesinlik kaybı) ValueError fırlatır.
+    """
+    if not resolution > 0:
+        raise ValueError(f"Çözünürlük pozitif olmalı: {resolution}")
+    if len(coords) == 0:
+        return np.zeros(2), np.zeros((0, 2), dtype=np.int64)
+    if not np.isfinite(coords).all():
+        raise ValueError("Sonlu olmayan koordinatlar nicemlenemez")
+    origin = coords.min(axis=0)
+    with np.errstate(over="ignore"):
+        scaled = (coords - origin) / resolution
+    if not scaled.max() < MAX_GRID:
+        raise ValueError("Koordinat aralığı {:.3g} çözünürlüğünde ızgaraya sığmıyor ({:.3g} adım > 2^53); "
+                         "daha büyük bir çözünürlük seçin".format(resolution, float(scaled.max())))
+    return origin, np.rint(scaled).astype(np.int64)
+
+def write_store(path, coords, offsets, resolution=DEFAULT_RESOLUTION, codec="bitpack",
+                block_vertices=DEFAULT_BLOCK_VERTICES):
+    """Çokgen grubunu nicemlenmiş, delta + zigzag kodlu bloklar halinde yaz
+
+    Dosya: MAGIC, sürüm, başlık uzunluğu, JSON başlık (blok indeksi dahil),
+    varint çokgen uzunlukları ve blok verileri. Her blok bütün çokgenler
+    içerir ve her eksen için iki akış tutar: çokgen ilk köşeleri ve çokgen
+    içi farklar. Bloğun ilk farkı sıfıra göre alınır, böylece her blok tek
+    başına çözülebilir.
+
+    Nicemleme yakın köşeleri birleştirip convexlik sonucunu değiştirebilir;
+    herhangi bir çokgenin sonucu ızgarada farklı çıkarsa dosya yazılmaz ve
+    ValueError fırlatılır (daha küçük bir çözünürlük gerekir).
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Bilinmeyen kodlama: {codec}")
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    origin, quantized = quantize(coords, resolution)
+    changed = np.flatnonzero(batch_is_convex(coords, offsets) != batch_is_convex(quantized.astype(np.float64), offsets))
+    if len(changed):
+        raise ValueError("{} çözünürlüğünde {} çokgenin convexlik sonucu değişiyor (ilki: {}); "
+                         "daha küçük bir çözünürlük seçin".format(resolution, len(changed), int(changed[0])))
+
+    blocks, payload = [], []
+    position = 0
+    for first, last in plan_blocks(offsets, block_vertices):
+        q = quantized[offsets[first]:offsets[last]]
+        # Boş çokgenlerin ilk köşesi yoktur; başlangıç akışı yalnızca dolu çokgenleri tutar
+        local_starts = (offsets[first:last] - offsets[first])[np.diff(offsets[first:last + 1]) > 0]
+        entry = {"first_polygon": first, "polygons": last - first,
+                 "first_vertex": int(offsets[first]), "vertices": len(q), "streams": []}
+        for axis in range(2):
+            # Çokgen içi farklar küçüktür; çokgenler arası sıçramalar genişliği şişirmesin diye
+            # her çokgenin ilk köşesi ayrı akışta, önceki çokgenin ilk köşesine göre fark olarak saklanır
+            deltas = np.diff(q[:, axis], prepend=0)
+            deltas[local_starts] = 0
+            start_deltas = np.diff(q[local_starts, axis], prepend=0)
+            for values in (start_deltas, deltas):
+                width, data = encode_values(zigzag_encode(values), codec)
+                entry["streams"].append({"offset": position, "bytes": len(data), "width": width})
+                payload.append(data)
+                position += len(data)
+        blocks.append(entry)
+
+    lengths = varint_encode(np.diff(offsets).astype(np.uint64))
+    header = json.dumps({
+        "codec": codec, "resolution": resolution, "origin": origin.tolist(),
+        "polygons": len(offsets) - 1, "vertices": int(offsets[-1] - offsets[0]),
+        "lengths_bytes": len(lengths), "blocks": blocks,
+    }).encode()
+    with open(path, "wb") as f:
+        f.write(MAGIC + struct.pack("<II", VERSION, len(header)))
+        f.write(header)
+        f.write(lengths)
+        for data in payload:
+            f.write(data)
+
+def open_store(path):
+    """Başlığı ve blok indeksini oku; veri bölümü bellek eşlemeli (memmap) açılır"""
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    if raw[:4].tobytes() != MAGIC:
+        raise ValueError(f"Delta deposu değil: {path}")
+    version, header_len = struct.unpack("<II", raw[4:12].tobytes())
+    if version != VERSION:
+        raise ValueError(f"Desteklenmeyen sürüm: {version}")
+    header = json.loads(raw[12:12 + header_len].tobytes())
+    lengths_start = 12 + header_len
+    lengths = varint_decode(raw[lengths_start:lengths_start + header["lengths_bytes"]].tobytes(),
+                            header["polygons"])
+    header["offsets"] = np.concatenate([[0], np.cumsum(lengths.astype(np.int64))])
+    header["payload"] = raw[lengths_start + header["lengths_bytes"]:]
+    header["path"] = path
+    return header
+
+def decode_block_range(store, first_block, last_block, scaled=True):
+    """[first_block, last_block) bloklarını (coords, offsets, ilk çokgen) olarak çöz
+
+    scaled=False nicemlenmiş tamsayı ızgarasını float64 olarak döndürür;
+    convexlik ölçek ve ötelemeden bağımsız olduğundan çekirdeklere bu haliyle
+    verilebilir ve bir çarpma/toplama geçişi atlanır.
+    """
+    blocks = store["blocks"][first_block:last_block]
+    if not blocks:
+        return np.zeros((0, 2)), np.zeros(1, dtype=np.int64), 0
+    coords = np.empty((sum(b["vertices"] for b in blocks), 2), dtype=np.float64)
+    fill = 0
+    for block in blocks:
+        first = block["first_polygon"]
+        local = store["offsets"][first:first + block["polygons"] + 1] - store["offsets"][first]
+        lengths = np.diff(local)
+        nonempty = lengths > 0
+        counts = (int(nonempty.sum()), block["vertices"])
+        for axis in range(2):
+            streams = []
+            for meta, count in zip(block["streams"][2 * axis:2 * axis + 2], counts):
+                data = store["payload"][meta["offset"]:meta["offset"] + meta["bytes"]]
+                streams.append(zigzag_decode(decode_values(data, meta["width"], count, store["codec"])))
+            starts, deltas = np.cumsum(streams[0]), np.cumsum(streams[1])
+            # Çokgen içi birikimli toplamı çokgen başında sıfırla ve ilk köşe değerini ekle
+            shift = deltas[local[:-1][nonempty]] - starts
+            coords[fill:fill + block["vertices"], axis] = deltas - np.repeat(shift, lengths[nonempty])
+        fill += block["vertices"]
+    if scaled:
+        coords *= store["resolution"]
+        coords += store["origin"]
+    first_polygon = blocks[0]["first_polygon"]
+    last_polygon = blocks[-1]["first_polygon"] + blocks[-1]["polygons"]
+    offsets = store["offsets"][first_polygon:last_polygon + 1] - store["offsets"][first_polygon]
+    return coords, offsets, first_polygon
+
+def decode_polygons(store, start, stop, scaled=True):
+    """[start, stop) çokgenlerini yalnızca onları içeren blokları çözerek döndür: (coords, offsets)"""
+    if start >= stop:
+        return np.zeros((0, 2)), np.zeros(1, dtype=np.int64)
+    firsts = [b["first_polygon"] for b in store["blocks"]]
+    first_block = max(0, int(np.searchsorted(firsts, start, side="right")) - 1)
+    last_block = int(np.searchsorted(firsts, stop, side="left"))
+    coords, offsets, first_polygon = decode_block_range(store, first_block, last_block, scaled)
+    lo, hi = start - first_polygon, stop - first_polygon
+    return coords[offsets[lo]:offsets[hi]], offsets[lo:hi + 1] - offsets[lo]
+
+def check_store(store, first_block=0, last_block=None, blocks_per_batch=16):
+    """Blokları doğrudan batch_is_convex'e çözerek depodaki çokgenlerin convexliğini hesapla"""
+    last_block = len(store["blocks"]) if last_block is None else last_block
+    results = []
+    for start in range(first_block, last_block, blocks_per_batch):
+        coords, offsets, _ = decode_block_range(store, start, min(last_block, start + blocks_per_batch), scaled=False)
+        results.append(batch_is_convex(coords, offsets))
+    return np.concatenate(results) if results else np.zeros(0, dtype=bool)
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    # 🔸 Arşiv benzeri veri: ~1 m çözünürlükte, komşu köşeleri birbirine yakın coğrafi çokgenler
+    rng = np.random.default_rng(0)
+    polygons = []
+    for _ in range(20000):
+        n = int(rng.integers(50, 400))
+        angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        radius = 0.01 * (rng.uniform(0.9, 1.0, n) if rng.random() < 0.5 else np.ones(n))
+        center = rng.uniform([26, 36], [45, 42])
+        polygons.append(np.round(center + np.column_stack([radius * np.cos(angles), radius * np.sin(angles)]), 6))
+    coords = np.concatenate(polygons)
+    offsets = np.concatenate([[0], np.cumsum([len(p) for p in polygons])])
+    expected = batch_is_convex(coords, offsets)
+
+    tmp = tempfile.mkdtemp()
+    raw_path = os.path.join(tmp, "polygons.npy")
+    np.save(raw_path, coords)
+    start_time = time.time()
+    loaded = np.load(raw_path)
+    raw_time = time.time() - start_time
+    print("💾 {} çokgen, {} köşe | ham float64: {:.1f} MB, okuma {:.3f}s".format(
+        len(polygons), len(coords), os.path.getsize(raw_path) / 1e6, raw_time))
+
+    for codec in CODECS:
+        path = os.path.join(tmp, f"polygons_{codec}.cvxd")
+        start_time = time.time()
+        write_store(path, coords, offsets, resolution=1e-6, codec=codec)
+        encode_time = time.time() - start_time
+        start_time = time.time()
+        store = open_store(path)
+        decoded, decoded_offsets, _ = decode_block_range(store, 0, len(store["blocks"]))
+        decode_time = time.time() - start_time
+        start_time = time.time()
+        convex = check_store(open_store(path))
+        check_time = time.time() - start_time
+        print("   {:<8} {:.1f} MB ({:.1f}x küçük) | yazma {:.2f}s | çözme {:.3f}s | çöz + kontrol {:.3f}s".format(
+            codec, os.path.getsize(path) / 1e6, os.path.getsize(raw_path) / os.path.getsize(path),
+            encode_time, decode_time, check_time))
+        print("            en büyük hata: {:.2e} | aynı ofsetler: {} | aynı convex sonuçları: {}".format(
+            np.abs(decoded - coords).max(), bool((decoded_offsets == offsets).all()), bool((convex == expected).all())))
+
+    sub_coords, sub_offsets = decode_polygons(store, 12345, 12350)
+    print("Çokgen aralığı [12345, 12350): {} köşe, ilk çokgenle aynı: {}".format(
+        len(sub_coords), bool(np.allclose(sub_coords[:sub_offsets[1]], polygons[12345]))))
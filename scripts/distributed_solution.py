@@ -0,0 +1,276 @@
+import argparse
+import os
+import queue
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+
+from vectorized_solution import (chunk_ranges, chunk_sign_summary, halo_chunk, merge_sign_summaries,
+                                 polygon_array, summary_is_convex)
+
+AUTHKEY_ENV = "CONVEX_AUTHKEY"
+DEFAULT_SHARD_SIZE = 250000 # her shard'daki üçlü sayısı
+DEFAULT_WORKER_TIMEOUT = 300.0 # bağlı worker kalmadığında sonuç beklenecek en uzun süre (saniye)
+
+def load_authkey():
+    """Düğümler arası paylaşılan anahtarı ortam değişkeninden oku; tanımlı değilse hata ver
+
+    multiprocessing.connection mesajları pickle ile taşır: anahtarı bilen
+    herkes koordinatörde ve worker'larda kod çalıştırabilir. Bu yüzden
+    kaynakta yazılı bir varsayılan anahtar kullanılmaz.
+    """
+    authkey = os.environ.get(AUTHKEY_ENV)
+    if not authkey:
+        raise RuntimeError(f"{AUTHKEY_ENV} ortam değişkeni tanımlanmalı (tüm düğümlerde aynı gizli değer)")
+    return authkey.encode()
+
+def shard_ranges(n, shard_size=DEFAULT_SHARD_SIZE):
+    """n üçlüyü en fazla shard_size uzunluğunda index aralıklarına böl"""
+    if n == 0:
+        return []
+    return chunk_ranges(n, -(-n // shard_size))
+
+def make_inline_shards(coords, offsets, shard_size=DEFAULT_SHARD_SIZE):
+    """Bellekteki çokgen grubunu halo'lu koordinat taşıyan shard'lara böl"""
+    shards = []
+    for polygon_id in range(len(offsets) - 1):
+        polygon = coords[offsets[polygon_id]:offsets[polygon_id + 1]]
+        for start, end in shard_ranges(len(polygon), shard_size):
+            # Worker'a yalnızca aralık + 2 noktalık halo gönderilir
+            shards.append({"polygon": polygon_id, "start": start, "end": end,
+                           "coords": np.ascontiguousarray(halo_chunk(polygon, start, end))})
+    return shards
+
+def make_file_shards(path, shard_size=DEFAULT_SHARD_SIZE):
+    """.npy çokgen dosyasını index aralıklarına böl (koordinatlar worker'da okunur)"""
+    n = len(np.load(path, mmap_mode="r"))
+    return [{"polygon": 0, "start": start, "end": end, "path": os.path.abspath(path)}
+            for start, end in shard_ranges(n, shard_size)]
+
+def compute_shard(shard):
+    """Shard'ın kompakt işaret özetini (pozitif var mı, negatif var mı) hesapla"""
+    if "coords" in shard:
+        chunk = shard["coords"]
+        return chunk_sign_summary(chunk, 0, len(chunk) - 2)
+    # Dosya modunda worker yalnızca kendi aralığını ve halo'yu diskten okur
+    coords = np.load(shard["path"], mmap_mode="r")
+    return chunk_sign_summary(coords, shard["start"], shard["end"])
+
+def serve_connection(conn, tasks, results, decided, lock, done, active):
+    """Tek bir worker bağlantısına kuyruktan shard dağıt ve özetleri topla"""
+    shard_id = None
+    with lock:
+        active[0] += 1
+    try:
+        while True:
+            try:
+                shard_id, shard = tasks.get(timeout=0.1)
+            except queue.Empty:
+                if done.is_set():
+                    conn.send(None) # iş kalmadı, worker kapanabilir
+                    return
+                continue # düşen bir worker'ın shard'ı geri gelebilir
+            with lock:
+                if decided.get(shard["polygon"]) is False:
+                    # Çokgen zaten concave bulundu, shard atlanır
+                    results.put((shard_id, shard["polygon"], None))
+                    shard_id = None
+                    continue
+            conn.send((shard_id, shard))
+            returned_id, summary = conn.recv()
+            results.put((returned_id, shard["polygon"], summary))
+            shard_id = None
+    except (EOFError, OSError):
+        # Worker düştü: yarım kalan shard kuyruğa geri konur
+        if shard_id is not None:
+            tasks.put((shard_id, shard))
+    finally:
+        with lock:
+            active[0] -= 1
+        conn.close()
+
+def run_coordinator(shards, num_polygons, address=("127.0.0.1", 0), authkey=None, ready=None, alive=None,
+                    worker_timeout=DEFAULT_WORKER_TIMEOUT):
+    """Shard'ları TCP üzerinden worker'lara dağıt ve her çokgenin sonucunu döndür
+
+    alive verilirse, sonuç beklenirken False dönmesi (tüm worker'lar öldü)
+    RuntimeError ile sonuçlanır. Bağlı hiçbir worker yokken worker_timeout
+    saniye boyunca sonuç gelmezse de RuntimeError fırlatılır (düşen
+    worker'ların shard'ları zaten kuyruğa geri konmuştur).
+    """
+    authkey = load_authkey() if authkey is None else authkey
+    tasks = queue.Queue()
+    for shard_id, shard in enumerate(shards):
+        tasks.put((shard_id, shard))
+    results = queue.Queue()
+    decided = {}
+    lock = threading.Lock()
+    done = threading.Event()
+    summaries = [[] for _ in range(num_polygons)]
+    handlers = []
+    active = [0] # bağlı worker sayısı
+
+    with Listener(address, backlog=128, authkey=authkey) as listener:
+        if ready is not None:
+            ready(listener.address)
+
+        def accept_loop():
+            while True:
+                try:
+                    conn = listener.accept()
+                except OSError:
+                    return # listener kapatıldı
+                handler = threading.Thread(target=serve_connection,
+                                           args=(conn, tasks, results, decided, lock, done, active), daemon=True)
+                handler.start()
+                handlers.append(handler)
+
+        threading.Thread(target=accept_loop, daemon=True).start()
+
+        # Final reduce: her çokgenin shard özetleri birleştirilir
+        last_seen = time.monotonic()
+        for _ in range(len(shards)):
+            while True:
+                try:
+                    shard_id, polygon_id, summary = results.get(timeout=0.5)
+                    last_seen = time.monotonic()
+                    break
+                except queue.Empty:
+                    if alive is not None and not alive():
+                        raise RuntimeError("Tüm worker'lar sonlandı, shard'lar tamamlanamadı")
+                    with lock:
+                        connected = active[0]
+                    if connected:
+                        last_seen = time.monotonic()
+                    elif worker_timeout is not None and time.monotonic() - last_seen > worker_timeout:
+                        raise RuntimeError("{:.0f} saniyedir bağlı worker yok, {} shard tamamlanamadı".format(
+                            worker_timeout, tasks.qsize()))
+            if summary is None:
+                continue
+            summaries[polygon_id].append(summary)
+            with lock:
+                if not summary_is_convex(merge_sign_summaries(summaries[polygon_id])):
+                    decided[polygon_id] = False
+        done.set()
+        # Bağlı worker'lara kapanma mesajı gidene kadar bekle
+        for handler in list(handlers):
+            handler.join()
+
+    return [summary_is_convex(merge_sign_summaries(s)) for s in summaries]
+
+def run_worker(address, authkey=None):
+    """Koordinatöre bağlan, shard çek, özet döndür; iş bitince çık"""
+    authkey = load_authkey() if authkey is None else authkey
+    processed = 0
+    try:
+        conn = Client(tuple(address), authkey=authkey)
+    except (ConnectionError, EOFError):
+        return processed # koordinatör tüm shard'lar bitince kapanmış olabilir
+    with conn:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break # koordinatör işi bitirip kapandı
+            if message is None:
+                break
+            shard_id, shard = message
+            conn.send((shard_id, compute_shard(shard)))
+            processed += 1
+    return processed
+
+def run_local_cluster(shards, num_polygons, num_workers=4, authkey=None):
+    """Koordinatörü ve worker'ları tek makinede yerel process'ler olarak çalıştır
+
+    Anahtar verilmezse her çalıştırma için rastgele üretilir; yalnızca
+    127.0.0.1'e bağlanan bu süreçlerle ortam değişkeni üzerinden paylaşılır.
+    """
+    authkey = secrets.token_hex(32).encode() if authkey is None else authkey
+    workers = []
+    env = dict(os.environ, **{AUTHKEY_ENV: authkey.decode()})
+
+    def start_workers(listener_address):
+        # Worker'lar gerçek düğümlerdeki gibi bu dosyanın "worker" komutuyla başlatılır
+        host, port = listener_address
+        for _ in range(num_workers):
+            workers.append(subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "worker", "--host", host, "--port", str(port)],
+                env=env, stdout=subprocess.DEVNULL))
+
+    try:
+        return run_coordinator(shards, num_polygons, ("127.0.0.1", 0), authkey, ready=start_workers,
+                               alive=lambda: any(p.poll() is None for p in workers))
+    finally:
+        for p in workers:
+            p.wait()
+
+def distributed_convex(points, num_workers=4, shard_size=DEFAULT_SHARD_SIZE):
+    """Tek çokgenin convexliğini yerel küme üzerinde hesapla"""
+    coords = polygon_array(points)
+    shards = make_inline_shards(coords, [0, len(coords)], shard_size)
+    return run_local_cluster(shards, 1, num_workers)[0]
+
+def distributed_batch_convex(coords, offsets, num_workers=4, shard_size=DEFAULT_SHARD_SIZE):
+    """Çokgen grubunun convexliğini yerel küme üzerinde hesapla"""
+    coords = polygon_array(coords)
+    shards = make_inline_shards(coords, offsets, shard_size)
+    return run_local_cluster(shards, len(offsets) - 1, num_workers)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shard'lı çok düğümlü convexlik kontrolü")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    coord = sub.add_parser("coordinator", help=".npy çokgen dosyasını worker'lara dağıt")
+    coord.add_argument("file")
+    coord.add_argument("--host", default="127.0.0.1",
+                       help="dinlenecek adres; diğer düğümler için güvenilir ağdaki arayüzü verin")
+    coord.add_argument("--port", type=int, default=6000)
+    coord.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    coord.add_argument("--worker-timeout", type=float, default=DEFAULT_WORKER_TIMEOUT,
+                       help="bağlı worker kalmadığında vazgeçmeden önce beklenecek saniye")
+
+    work = sub.add_parser("worker", help="Koordinatörden shard çekip işle")
+    work.add_argument("--host", default="127.0.0.1")
+    work.add_argument("--port", type=int, default=6000)
+
+    local = sub.add_parser("local", help="Tüm düğümleri yerel process olarak çalıştır")
+    local.add_argument("--points", type=int, default=1000000)
+    local.add_argument("--workers", type=int, default=4)
+    local.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+
+    args = parser.parse_args()
+
+    if args.mode in ("coordinator", "worker") and not os.environ.get(AUTHKEY_ENV):
+        sys.exit(f"❌ {AUTHKEY_ENV} tanımlı değil: tüm düğümlerde aynı gizli değeri ayarlayın")
+
+    if args.mode == "coordinator":
+        shards = make_file_shards(args.file, args.shard_size)
+        print("{} shard hazır, worker bekleniyor ({}:{})".format(len(shards), args.host, args.port))
+        start_time = time.time()
+        try:
+            is_convex = run_coordinator(shards, 1, (args.host, args.port), worker_timeout=args.worker_timeout)[0]
+        except RuntimeError as exc:
+            sys.exit(f"❌ {exc}")
+        print("Polygon is " + ("CONVEX" if is_convex else "CONCAVE"))
+        print("Elapsed time: {:.2f} seconds".format(time.time() - start_time))
+    elif args.mode == "worker":
+        processed = run_worker((args.host, args.port))
+        print("{} shard işlendi".format(processed))
+    else:
+        angles = np.linspace(0, 2 * np.pi, args.points, endpoint=False)
+        radius = np.where(np.arange(args.points) % 4 == 0, 15.0, 8.0) # zikzak (concave)
+        polygons = [np.column_stack([10 * np.cos(angles), 10 * np.sin(angles)]),
+                    np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])]
+        coords = np.concatenate(polygons)
+        offsets = [0, args.points, 2 * args.points]
+
+        start_time = time.time()
+        results = distributed_batch_convex(coords, offsets, args.workers, args.shard_size)
+        for polygon_id, is_convex in enumerate(results):
+            print("Çokgen {}: {}".format(polygon_id, "CONVEX" if is_convex else "CONCAVE"))
+        print("Elapsed time: {:.2f} seconds".format(time.time() - start_time))
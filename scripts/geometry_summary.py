@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from vectorized_solution import chunk_ranges, halo_chunk, polygon_array, turn_flags
+
+BLOCK_TRIPLES = 1 << 16 # ara diziler önbellekte kalsın diye parçalar bu boyutta bloklarla işlenir
+
+def empty_partial():
+    """Hiç üçlü içermeyen kısmi özet (birleştirmenin birim elemanı)"""
+    return {"has_pos": False, "has_neg": False, "area2": 0.0, "perimeter": 0.0, "triples": 0}
+
+def partial_summary(window):
+    """Halo'lu nokta penceresindeki üçlülerden kısmi özet çıkar
+
+    k. üçlü (k, k+1, k+2) noktalarını kullanır ve (k+1 -> k+2) kenarını sayar;
+    böylece tüm çokgen üzerinde her kenar tam bir kez toplanır.
+    """
+    x = window[:, 0]
+    y = window[:, 1]
+    # Kenar farkları bir kez hesaplanır; dönüş, alan ve çevre hepsi bunları kullanır
+    dx = x[1:] - x[:-1]
+    dy = y[1:] - y[:-1]
+    with np.errstate(over="ignore", invalid="ignore"):
+        # cross_product_sign ile aynı işlem sırası: (x2 - x1)*(y3 - y2) - (y2 - y1)*(x3 - x2)
+        cp = dx[:-1] * dy[1:] - dy[:-1] * dx[1:]
+        # Shoelace terimi: x_p * y_q - y_p * x_q = x_p * dy - y_p * dx
+        area2 = float(np.sum(x[1:-1] * dy[1:] - y[1:-1] * dx[1:]))
+        perimeter = float(np.sum(np.hypot(dx[1:], dy[1:])))
+    positive, negative = turn_flags(cp)
+    return {"has_pos": bool(positive.any()), "has_neg": bool(negative.any()),
+            "area2": area2, "perimeter": perimeter, "triples": len(cp)}
+
+def merge_partial_summaries(parts):
+    """Kısmi özetleri tek özette birleştir (sıra ve gruplama önemsiz)"""
+    merged = empty_partial()
+    for part in parts:
+        merged["has_pos"] = merged["has_pos"] or part["has_pos"]
+        merged["has_neg"] = merged["has_neg"] or part["has_neg"]
+        merged["area2"] += part["area2"]
+        merged["perimeter"] += part["perimeter"]
+        merged["triples"] += part["triples"]
+    return merged
+
+def finalize_summary(partial):
+    """Birleştirilmiş kısmi özetten convexlik, yönelim, alan ve çevreyi üret"""
+    signed_area = 0.5 * partial["area2"]
+    if signed_area > 0:
+        orientation = "ccw"
+    elif signed_area < 0:
+        orientation = "cw"
+    else:
+        orientation = "degenerate"
+    return {
+        "convex": not (partial["has_pos"] and partial["has_neg"]),
+        "orientation": orientation,
+        "signed_area": signed_area,
+        "area": abs(signed_area),
+        "perimeter": partial["perimeter"],
+        "vertices": partial["triples"],
+    }
+
+def chunk_partial_summary(coords, start, end, block=BLOCK_TRIPLES):
+    """[start, end) aralığındaki üçlülerin kısmi özetini önbellek boyutlu bloklarla hesapla"""
+    return merge_partial_summaries(partial_summary(halo_chunk(coords, s, min(s + block, end)))
+                                   for s in range(start, end, block))
+
+def geometry_summary(points, num_chunks=1):
+    """Convexlik, yönelim, işaretli alan ve çevreyi tek geçişte hesapla"""
+    coords = polygon_array(points)
+    parts = [chunk_partial_summary(coords, start, end) for start, end in chunk_ranges(len(coords), num_chunks)]
+    return finalize_summary(merge_partial_summaries(parts))
+
+def threaded_geometry_summary(points, num_threads=4):
+    """Parçaların kısmi özetlerini thread havuzunda paralel hesapla"""
+    coords = polygon_array(points)
+    ranges = chunk_ranges(len(coords), num_threads)
+    if not ranges:
+        return finalize_summary(empty_partial())
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        parts = executor.map(lambda r: chunk_partial_summary(coords, r[0], r[1]), ranges)
+        return finalize_summary(merge_partial_summaries(parts))
+
+def streaming_geometry_summary(blocks):
+    """Nokta blokları akışından (ör. dosyadan okunan parçalar) özeti hesapla
+
+    Her bloğa önceki bloğun son iki noktası eklenir; çokgeni kapatan son iki
+    üçlü akış bitince ilk iki noktayla işlenir. Bellekte tek seferde yalnızca
+    bir blok tutulur.
+    """
+    parts = []
+    head = np.empty((0, 2))
+    tail = np.empty((0, 2))
+    for block in blocks:
+        block = polygon_array(block)
+        if len(head) < 2:
+            head = np.concatenate([head, block[:2 - len(head)]])
+        window = np.concatenate([tail, block])
+        if len(window) >= 3:
+            parts.append(partial_summary(window))
+            window = window[-2:]
+        tail = window
+
+    if len(head) < 2 or not parts:
+        # Üçten az nokta: tüm nokta kümesi zaten tail içinde
+        return geometry_summary(tail)
+    parts.append(partial_summary(np.concatenate([tail, head])))
+    return finalize_summary(merge_partial_summaries(parts))
+
+if __name__ == "__main__":
+    import time
+    from vectorized_solution import is_polygon_convex
+
+    # 🔸 Örnek: saat yönünde concave çokgen
+    points = [(0, 0), (0, 2), (1, 1), (2, 2), (2, 0)]
+    print("Örnek:", geometry_summary(points))
+
+    n_points = 10000000
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    big = np.column_stack([10 * np.cos(angles), 10 * np.sin(angles)])
+
+    # Eski yol: convexlik kontrolü + alan + çevre için ayrı geçişler
+    start_time = time.time()
+    is_polygon_convex(big)
+    x, y = big[:, 0], big[:, 1]
+    area = 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    perimeter = np.hypot(*(np.roll(big, -1, axis=0) - big).T).sum()
+    separate_time = time.time() - start_time
+
+    for name, run in (("Tek geçiş", lambda: geometry_summary(big)),
+                      ("Tek geçiş (4 thread)", lambda: threaded_geometry_summary(big, 4)),
+                      ("Akış (1M blok)", lambda: streaming_geometry_summary(np.array_split(big, 10)))):
+        start_time = time.time()
+        summary = run()
+        elapsed_time = time.time() - start_time
+        print("{:<22} {:.4f} saniye | convex: {} | alan: {:.6f} (beklenen {:.6f}) | çevre: {:.6f}".format(
+            name, elapsed_time, summary["convex"], summary["area"], abs(area), summary["perimeter"]))
+    print("Ayrı geçişler:         {:.4f} saniye".format(separate_time))
@@ -0,0 +1,450 @@
+import io
+import json
+import os
+import queue
+import re
+import struct
+import threading
+
+import numpy as np
+
+from vectorized_solution import batch_is_convex
+
+DEFAULT_BATCH_VERTICES = 1 << 20 # bir batch tamponundaki köşe sayısı (16 MB float64)
+READ_SIZE = 1 << 20
+STOP_POLL_SECONDS = 0.1 # dolu kuyruktaki üreticinin tüketicinin durup durmadığını kontrol etme aralığı
+
+FORMATS = {
+    ".geojson": "geojson", ".json": "geojson",
+    ".geojsonl": "geojsonseq", ".geojsons": "geojsonseq", ".ndjson": "geojsonseq",
+    ".wkt": "wkt", ".wkb": "wkb", ".hex": "wkb-hex", ".npy": "npy",
+}
+
+# ---------------------------------------------------------------------------
+# GeoJSON
+# ---------------------------------------------------------------------------
+
+def geometry_rings(geometry):
+    """GeoJSON geometrisinden (parça, halka, koordinat listesi) üçlülerini üret"""
+    if not geometry:
+        return
+    kind = geometry.get("type")
+    if kind == "Polygon":
+        for ring_idx, ring in enumerate(geometry["coordinates"]):
+            yield 0, ring_idx, ring
+    elif kind == "MultiPolygon":
+        for part_idx, polygon in enumerate(geometry["coordinates"]):
+            for ring_idx, ring in enumerate(polygon):
+                yield part_idx, ring_idx, ring
+    elif kind == "Feature":
+        yield from geometry_rings(geometry.get("geometry"))
+    # Nokta, çizgi ve diğer geometri tipleri convexlik kontrolüne girmez
+
+def iter_geojson_features(stream, read_size=READ_SIZE):
+    """FeatureCollection'ı tamamını belleğe almadan feature feature çöz
+
+    Üst düzey nesnenin üyeleri sırayla çözülür; "features" dizisi yalnızca
+    üst düzey anahtar olarak tanınır, başka üyelerin içindeki aynı metin
+    ayrıştırmayı bozmaz. Nesnede "features" yoksa (tek geometri veya feature)
+    nesnenin kendisi döndürülür.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill(size):
+        nonlocal buf, pos, eof
+        chunk = stream.read(size)
+        eof = not chunk
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def skip(chars):
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill(read_size)
+
+    def peek():
+        if pos >= len(buf):
+            raise ValueError("GeoJSON akışı yarıda kesilmiş")
+        return buf[pos]
+
+    def decode():
+        # pos'taki JSON değerini çöz; tampon yetmiyorsa okumayı büyüterek tekrar dene
+        nonlocal pos
+        size = read_size
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                if end < len(buf) or eof: # tampon sonunda biten bir sayı kesilmiş olabilir
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError("GeoJSON akışı yarıda kesilmiş veya geçersiz")
+            fill(size)
+            size *= 2 # büyük değerleri tekrar tekrar baştan çözmemek için okumayı büyüt
+
+    skip(" \t\r\n")
+    if pos >= len(buf):
+        return
+    if peek() != "{":
+        yield decode()
+        return
+    pos += 1
+
+    # Üst düzey üyeler: "features" gelene kadar diğerleri çözülüp saklanır
+    members = {}
+    while True:
+        skip(" \t\r\n,")
+        if peek() == "}":
+            yield members # FeatureCollection değil: tek bir geometri veya feature
+            return
+        key = decode()
+        skip(" \t\r\n:")
+        if key == "features":
+            if peek() != "[":
+                raise ValueError('"features" üyesi bir dizi olmalı')
+            pos += 1
+            break
+        members[key] = decode()
+
+    while True:
+        skip(" \t\r\n,")
+        if peek() == "]":
+            return
+        yield decode()
+
+def iter_geojson_seq(stream):
+    """Satır başına bir feature içeren GeoJSON metin dizisini (RFC 8142) oku"""
+    for line in stream:
+        line = line.strip().lstrip("\x1e")
+        if line:
+            yield json.loads(line)
+
+# ---------------------------------------------------------------------------
+# WKT
+# ---------------------------------------------------------------------------
+
+RING_PATTERN = re.compile(r"\(([^()]*)\)")
+POLYGON_PATTERN = re.compile(r"\((\s*\([^()]*\)(?:\s*,\s*\([^()]*\))*)\s*\)")
+
+def wkt_ring_array(text):
+    """'x y, x y, ...' halka metnini (n, 2) diziye çevir (Z/M koordinatları atılır)"""
+    dims = len(text.split(",", 1)[0].split())
+    values = np.array(text.replace(",", " ").split(), dtype=np.float64)
+    return values.reshape(-1, dims)[:, :2]
+
+def wkt_polygon_rings(text):
+    """Tek bir WKT (veya EWKT) satırından (parça, halka, koordinat) üçlülerini üret"""
+    text = text.strip()
+    if text.upper().startswith("SRID="):
+        text = text.split(";", 1)[1]
+    kind = text.split("(", 1)[0].split()[0].upper() if text else ""
+    body = text[text.find("("):] if "(" in text else ""
+    if kind == "POLYGON":
+        for ring_idx, ring in enumerate(RING_PATTERN.findall(body)):
+            yield 0, ring_idx, wkt_ring_array(ring)
+    elif kind == "MULTIPOLYGON":
+        for part_idx, polygon in enumerate(POLYGON_PATTERN.findall(body[1:-1])):
+            for ring_idx, ring in enumerate(RING_PATTERN.findall(polygon)):
+                yield part_idx, ring_idx, wkt_ring_array(ring)
+
+# ---------------------------------------------------------------------------
+# WKB
+# ---------------------------------------------------------------------------
+
+def _read_exact(stream, n):
+    data = stream.read(n)
+    if len(data) < n:
+        raise ValueError("WKB akışı yarıda kesilmiş")
+    return data
+
+def read_wkb_geometry(stream):
+    """Akıştan tek bir WKB/EWKB geometrisi oku; poligon parçalarının halka listesini döndür
+
+    Akış bittiyse None döner. Poligon olmayan geometriler okunup atlanır.
+    """
+    first = stream.read(1)
+    if not first:
+        return None
+    order = "<" if first == b"\x01" else ">"
+    (code,) = struct.unpack(order + "I", _read_exact(stream, 4))
+    has_z = bool(code & 0x80000000) # EWKB bayrakları
+    has_m = bool(code & 0x40000000)
+    if code & 0x20000000:
+        _read_exact(stream, 4) # SRID
+    code &= 0x0FFFFFFF
+    has_z = has_z or code // 1000 in (1, 3) # ISO WKB: 1003 = Polygon Z, 3003 = Polygon ZM
+    has_m = has_m or code // 1000 in (2, 3)
+    kind = code % 1000
+    dims = 2 + has_z + has_m
+
+    def count():
+        return struct.unpack(order + "I", _read_exact(stream, 4))[0]
+
+    def points(n):
+        data = _read_exact(stream, 8 * dims * n)
+        return np.frombuffer(data, dtype=order + "f8").reshape(n, dims)[:, :2]
+
+    if kind == 1: # Point
+        points(1)
+        return []
+    if kind == 2: # LineString
+        points(count())
+        return []
+    if kind == 3: # Polygon
+        return [[points(count()) for _ in range(count())]]
+    if kind in (4, 5, 6, 7): # Multi* ve GeometryCollection: iç içe tam geometriler
+        parts = []
+        for _ in range(count()):
+            parts.extend(read_wkb_geometry(stream) or [])
+        return parts
+    raise ValueError(f"Desteklenmeyen WKB geometri tipi: {code}")
+
+def iter_wkb(stream):
+    """Art arda yazılmış ikili WKB geometrilerini sırayla oku"""
+    while True:
+        parts = read_wkb_geometry(stream)
+        if parts is None:
+            return
+        yield parts
+
+def iter_wkb_hex(stream):
+    """Satır başına bir hex kodlu WKB (ör. PostGIS dökümü) oku"""
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield read_wkb_geometry(io.BytesIO(bytes.fromhex(line))) or []
+
+def wkb_parts_rings(parts):
+    """read_wkb_geometry çıktısından (parça, halka, koordinat) üçlülerini üret"""
+    for part_idx, rings in enumerate(parts):
+        for ring_idx, ring in enumerate(rings):
+            yield part_idx, ring_idx, ring
+
+# ---------------------------------------------------------------------------
+# Ortak halka akışı ve batch tamponları
+# ---------------------------------------------------------------------------
+
+def file_format(path, fmt=None):
+    """Biçim verilmemişse dosya uzantısından bul"""
+    fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError(f"Dosya biçimi tanınamadı: {path}")
+    return fmt
+
+def iter_stream_rings(stream, fmt, exterior_only=False):
+    """Açık bir akıştaki halkaları akıt (wkb ve npy için ikili, diğerleri için metin akışı)"""
+    if fmt == "npy":
+        records = [[(0, 0, np.load(stream))]] # tek çokgen: distributed_solution ile aynı (n, 2) dizi
+    elif fmt in ("wkb", "wkb-hex"):
+        records = (wkb_parts_rings(parts) for parts in (iter_wkb(stream) if fmt == "wkb" else iter_wkb_hex(stream)))
+    elif fmt == "geojson":
+        records = (geometry_rings(f) for f in iter_geojson_features(stream))
+    elif fmt == "geojsonseq":
+        records = (geometry_rings(f) for f in iter_geojson_seq(stream))
+    elif fmt == "wkt":
+        records = (wkt_polygon_rings(line) for line in stream if line.strip())
+    else:
+        raise ValueError(f"Bilinmeyen biçim: {fmt}")
+
+    for feature_idx, rings in enumerate(records):
+        for part_idx, ring_idx, ring in rings:
+            if exterior_only and ring_idx > 0:
+                continue
+            yield feature_idx, part_idx, ring_idx, ring
+
+def open_format_stream(path, fmt):
+    """Biçime uygun kipte (ikili/metin) dosyayı aç"""
+    if fmt in ("wkb", "npy"):
+        return open(path, "rb")
+    return open(path, encoding="utf-8")
+
+def iter_file_rings(path, fmt=None, exterior_only=False):
+    """Dosyadaki tüm poligon halkalarını (feature, parça, halka, koordinat) olarak akıt"""
+    fmt = file_format(path, fmt)
+    with open_format_stream(path, fmt) as stream:
+        yield from iter_stream_rings(stream, fmt, exterior_only)
+
+def open_ring_length(ring):
+    """Halkanın sonundaki, ilk köşeyi tekrar eden kapanış köşelerini sayma"""
+    k = len(ring)
+    if k == 0:
+        return 0
+    first = tuple(ring[0][:2])
+    while k > 1 and tuple(ring[k - 1][:2]) == first:
+        k -= 1
+    return k
+
+def new_batch(capacity):
+    """Boş bir batch tamponu: koordinatlar doğrudan bu bitişik diziye yazılır"""
+    return {"coords": np.empty((capacity, 2), dtype=np.float64), "fill": 0, "offsets": [0], "ids": []}
+
+def finish_batch(batch):
+    """Tamponu batch_is_convex'in beklediği (coords, offsets, ids) biçimine getir"""
+    return (batch["coords"][:batch["fill"]], np.asarray(batch["offsets"], dtype=np.int64),
+            np.asarray(batch["ids"], dtype=np.int64).reshape(-1, 3))
+
+def iter_batches(rings, batch_vertices=DEFAULT_BATCH_VERTICES):
+    """Halka akışını sabit kapasiteli bitişik batch tamponlarına yaz"""
+    batch = new_batch(batch_vertices)
+    for feature_idx, part_idx, ring_idx, ring in rings:
+        k = open_ring_length(ring)
+        if k == 0:
+            continue
+        fill = batch["fill"]
+        if fill + k > len(batch["coords"]):
+            if batch["ids"]:
+                yield finish_batch(batch)
+            batch = new_batch(max(batch_vertices, k)) # tampondan büyük halka kendi batch'ini alır
+            fill = 0
+
+        target = batch["coords"][fill:fill + k]
+        if isinstance(ring, np.ndarray):
+            target[:] = ring[:k]
+        else:
+            try:
+                target[:] = ring[:k] # [x, y] listeleri ara dizi olmadan tampona yazılır
+            except ValueError:
+                target[:] = [p[:2] for p in ring[:k]] # Z koordinatlı GeoJSON
+        batch["fill"] = fill + k
+        batch["offsets"].append(fill + k)
+        batch["ids"].append((feature_idx, part_idx, ring_idx))
+    if batch["ids"]:
+        yield finish_batch(batch)
+
+def iter_convex_batches(rings, batch_vertices=DEFAULT_BATCH_VERTICES, queue_depth=4):
+    """Ayrıştırma (üretici thread) ile convexlik kontrolünü (bu thread) üst üste çalıştır
+
+    Her batch için (ids, offsets, convex) döndürür; kuyruk sınırı bellekte
+    bekleyen batch sayısını queue_depth ile sınırlar. Tüketici erken durursa
+    veya hata alırsa üretici durdurulur ve halka kaynağı kapatılır.
+    """
+    batches = queue.Queue(maxsize=queue_depth)
+    errors = []
+    stop = threading.Event()
+
+    def put(item):
+        # Kuyruk doluyken tüketicinin bırakıp bırakmadığı düzenli aralıklarla kontrol edilir
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=STOP_POLL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for batch in iter_batches(rings, batch_vertices):
+                if not put(batch):
+                    break
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            close = getattr(rings, "close", None)
+            if close is not None:
+                close() # üretecin açtığı dosya bu thread'de kapanır
+            put(None)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            coords, offsets, ids = batch
+            yield ids, offsets, batch_is_convex(coords, offsets)
+    finally:
+        stop.set()
+        producer.join()
+    if errors:
+        raise errors[0]
+
+def check_file(path, fmt=None, batch_vertices=DEFAULT_BATCH_VERTICES, exterior_only=False):
+    """Dosyadaki tüm halkaların convexliğini akış halinde kontrol et
+
+    Dönüş: feature/part/ring numaraları, köşe sayısı ve convex sonucu dizileri.
+    """
+    ids, vertices, convex = [], [], []
+    rings = iter_file_rings(path, fmt, exterior_only)
+    for batch_ids, offsets, batch_convex in iter_convex_batches(rings, batch_vertices):
+        ids.append(batch_ids)
+        vertices.append(np.diff(offsets))
+        convex.append(batch_convex)
+    ids = np.concatenate(ids) if ids else np.zeros((0, 3), dtype=np.int64)
+    return {
+        "feature": ids[:, 0], "part": ids[:, 1], "ring": ids[:, 2],
+        "vertices": np.concatenate(vertices) if vertices else np.zeros(0, dtype=np.int64),
+        "convex": np.concatenate(convex) if convex else np.zeros(0, dtype=bool),
+    }
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+    import time
+    from series_solution import is_polygon_convex
+
+    parser = argparse.ArgumentParser(description="GeoJSON/WKT/WKB dosyalarında akış halinde convexlik kontrolü")
+    parser.add_argument("path", nargs="?", help="girdi dosyası (verilmezse sentetik örnek üretilir)")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())))
+    parser.add_argument("--batch-vertices", type=int, default=DEFAULT_BATCH_VERTICES)
+    parser.add_argument("--exterior-only", action="store_true")
+    parser.add_argument("--features", type=int, default=50000, help="sentetik örnekteki feature sayısı")
+    args = parser.parse_args()
+
+    if args.path:
+        start_time = time.time()
+        result = check_file(args.path, args.format, args.batch_vertices, args.exterior_only)
+        print("{} halka, {} convex ({:.2f} saniye)".format(
+            len(result["convex"]), int(result["convex"].sum()), time.time() - start_time))
+        raise SystemExit
+
+    # 🔸 Sentetik veri: kapalı halkalı (ilk köşe sonda tekrar eden) poligonlar
+    rng = np.random.default_rng(0)
+    polygons = []
+    for _ in range(args.features):
+        n = int(rng.integers(8, 64))
+        angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+        radius = rng.uniform(5, 10, n) if rng.random() < 0.5 else np.full(n, 10.0)
+        ring = np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+        polygons.append(np.vstack([ring, ring[:1]]))
+
+    tmp = tempfile.mkdtemp()
+    paths = {"geojson": os.path.join(tmp, "polygons.geojson"),
+             "wkt": os.path.join(tmp, "polygons.wkt"),
+             "wkb": os.path.join(tmp, "polygons.wkb")}
+    with open(paths["geojson"], "w") as f:
+        json.dump({"type": "FeatureCollection", "features": [
+            {"type": "Feature", "properties": {}, "geometry": {"type": "Polygon", "coordinates": [p.tolist()]}}
+            for p in polygons]}, f)
+    with open(paths["wkt"], "w") as f:
+        for p in polygons:
+            f.write("POLYGON ((" + ", ".join(f"{x!r} {y!r}" for x, y in p.tolist()) + "))\n")
+    with open(paths["wkb"], "wb") as f:
+        for p in polygons:
+            f.write(struct.pack("<BIII", 1, 3, 1, len(p)) + p.astype("<f8").tobytes())
+
+    # Eski yol: json.load + tuple listeleri + her poligon için is_polygon_convex
+    start_time = time.time()
+    with open(paths["geojson"]) as f:
+        data = json.load(f)
+    expected = [is_polygon_convex([tuple(p) for p in feature["geometry"]["coordinates"][0][:-1]])
+                for feature in data["features"]]
+    legacy_time = time.time() - start_time
+    del data
+    print("📥 {} poligon | json.load + is_polygon_convex: {:.2f} saniye".format(len(polygons), legacy_time))
+
+    for fmt, path in paths.items():
+        start_time = time.time()
+        result = check_file(path)
+        elapsed_time = time.time() - start_time
+        print("   {:<8} akış + batch_is_convex: {:.2f} saniye ({:.1f}x) | aynı sonuç: {}".format(
+            fmt, elapsed_time, legacy_time / elapsed_time, result["convex"].tolist() == expected))
@@ -0,0 +1,235 @@
+import numpy as np
+
+from vectorized_solution import batch_is_convex, is_polygon_convex, polygon_array
+
+BATCH_MAX_VERTICES = 64 # toplu SAT'te doldurulmuş dizi boyutu; daha büyük çokgenler tek tek test edilir
+CHUNK_PAIRS = 1 << 15
+
+def orient_ccw(points):
+    """Convex çokgeni tekrar eden köşelerden arındır ve saat yönünün tersine çevir
+
+    Sıfır çapraz çarpımlar atlandığından tekrarlanan köşe içbükey bir dönüşü
+    gizleyebilir; convexlik bu yüzden tekrarlar atıldıktan sonra denetlenir.
+    """
+    coords = polygon_array(points)
+    keep = np.any(coords != np.roll(coords, -1, axis=0), axis=1)
+    coords = coords[keep] if keep.any() else coords[:1]
+    if not is_polygon_convex(coords):
+        raise ValueError("Kesişim testi yalnızca convex çokgenler için geçerlidir")
+    x, y = coords[:, 0], coords[:, 1]
+    area2 = np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))
+    if len(coords) < 3 or area2 == 0:
+        raise ValueError("Kesişim testi alanı sıfırdan büyük convex çokgen gerektirir")
+    return coords if area2 > 0 else coords[::-1]
+
+def minkowski_difference(a, b):
+    """a ⊕ (-b) convex çokgenini kenar açılarını birleştirerek O(n + m) sürede kur
+
+    Sonucun kenarları tam olarak a ve b'nin kenarlarıdır; bu yüzden orijinin bu
+    çokgenin dışında kaldığı kenar, SAT'in ayırıcı ekseni olur.
+    """
+    p = orient_ccw(a)
+    q = -orient_ccw(b) # 180 derece döndürme yönelimi korur
+    # İki çokgeni de en alttaki (sonra en soldaki) köşeden başlat
+    p = np.roll(p, -np.lexsort((p[:, 0], p[:, 1]))[0], axis=0)
+    q = np.roll(q, -np.lexsort((q[:, 0], q[:, 1]))[0], axis=0)
+    ep = np.roll(p, -1, axis=0) - p
+    eq = np.roll(q, -1, axis=0) - q
+
+    result = []
+    i = j = 0
+    n, m = len(p), len(q)
+    while i < n or j < m:
+        result.append(p[i % n] + q[j % m])
+        if i == n:
+            j += 1
+            continue
+        if j == m:
+            i += 1
+            continue
+        # cross_product_sign ile aynı aritmetik: hangi kenar daha az dönüyor?
+        cross = ep[i, 0] * eq[j, 1] - ep[i, 1] * eq[j, 0]
+        if cross >= 0:
+            i += 1
+        if cross <= 0:
+            j += 1
+    return np.array(result)
+
+def separating_axis(a, b):
+    """a ile b'yi ayıran eksen (kenar normali) varsa döndür, kesişiyorlarsa None"""
+    s = minkowski_difference(a, b)
+    edges = np.roll(s, -1, axis=0) - s
+    # Orijin kenarın sağında (dışında) ise o kenarın normali ayırıcı eksendir
+    side = edges[:, 0] * (0 - s[:, 1]) - edges[:, 1] * (0 - s[:, 0])
+    outside = np.nonzero(side < 0)[0]
+    if len(outside) == 0:
+        return None
+    e = edges[outside[0]]
+    return np.array([e[1], -e[0]]) / np.hypot(e[0], e[1])
+
+def convex_intersect(a, b):
+    """İki convex çokgen kesişiyor veya değiyor mu (O(n + m) SAT)"""
+    return separating_axis(a, b) is None
+
+def polygon_bounds(coords, offsets):
+    """Her çokgenin eksen hizalı sınırlayıcı kutusu: (min_x, min_y, max_x, max_y)"""
+    starts = offsets[:-1]
+    lo = np.minimum.reduceat(coords, starts, axis=0)
+    hi = np.maximum.reduceat(coords, starts, axis=0)
+    return np.column_stack([lo, hi])
+
+def boxes_overlap(bounds, ia, ib):
+    """Geniş faz: çiftlerin sınırlayıcı kutuları çakışıyor mu"""
+    a, b = bounds[ia], bounds[ib]
+    return (a[:, 0] <= b[:, 2]) & (b[:, 0] <= a[:, 2]) & (a[:, 1] <= b[:, 3]) & (b[:, 1] <= a[:, 3])
+
+def padded_polygons(coords, offsets, width):
+    """Çokgenleri son köşeyi tekrarlayarak (k, width, 2) dizisine doldur
+
+    Tekrarlanan köşe sıfır uzunluklu kenar üretir; böyle bir kenar hiçbir
+    köşeyi kesin dışarıda bırakmadığı için SAT sonucunu değiştirmez.
+    """
+    lengths = np.diff(offsets)
+    local = np.minimum(np.arange(width)[None, :], lengths[:, None] - 1)
+    return coords[offsets[:-1, None] + local]
+
+def drop_repeated(coords, offsets):
+    """Her çokgende art arda tekrar eden köşeleri (son -> ilk dahil) at: (coords, offsets)"""
+    if len(coords) == 0:
+        return coords, offsets
+    nxt = np.arange(len(coords)) + 1
+    nonempty = offsets[1:] > offsets[:-1]
+    nxt[offsets[1:][nonempty] - 1] = offsets[:-1][nonempty]
+    keep = np.any(coords != coords[nxt], axis=1)
+    # Tüm köşeleri aynı olan çokgenden tek köşe kalır
+    keep[offsets[:-1][nonempty]] |= np.logical_or.reduceat(keep, offsets[:-1][nonempty]) == 0
+    return coords[keep], np.concatenate([[0], np.cumsum(keep)])[offsets - offsets[0]]
+
+def sat_pairs(pa, pb, sign_a, sign_b):
+    """Doldurulmuş çokgen çiftleri için vektörel SAT: kesişen çiftlerin maskesi"""
+    def separated_by_edges_of(p, sign, other):
+        edges = np.roll(p, -1, axis=1) - p # (c, K, 2)
+        # Her kenar için diğer çokgenin köşeleriyle çapraz çarpım: (c, K kenar, K köşe)
+        rel_x = other[:, None, :, 0] - p[:, :, None, 0]
+        rel_y = other[:, None, :, 1] - p[:, :, None, 1]
+        cross = edges[:, :, None, 0] * rel_y - edges[:, :, None, 1] * rel_x
+        # Tüm köşeler kenarın dış tarafındaysa o kenarın normali ayırıcı eksendir
+        return ((cross * sign[:, None, None]) < 0).all(axis=2).any(axis=1)
+
+    return ~(separated_by_edges_of(pa, sign_a, pb) | separated_by_edges_of(pb, sign_b, pa))
+
+def batch_intersect(coords, offsets, pairs, broad_phase=True, check_convex=False, chunk_pairs=CHUNK_PAIRS):
+    """(i, j) çokgen çiftleri için kesişim sonuçlarını toplu hesapla
+
+    coords/offsets batch_is_convex ile aynı düzendedir. Önce sınırlayıcı kutular
+    elenir, kalan küçük çokgen çiftleri doldurulmuş dizilerle vektörel SAT'e,
+    büyük olanlar O(n + m) tekli teste gider.
+    """
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    # Tekrarlanan köşeler içbükey dönüşleri gizlemesin diye önce atılır
+    if check_convex and not batch_is_convex(*drop_repeated(coords, offsets)).all():
+        raise ValueError("Kesişim testi yalnızca convex çokgenler için geçerlidir")
+
+    result = np.zeros(len(pairs), dtype=bool)
+    candidates = np.arange(len(pairs))
+    if broad_phase:
+        candidates = candidates[boxes_overlap(polygon_bounds(coords, offsets), pairs[:, 0], pairs[:, 1])]
+    if len(candidates) == 0:
+        return result
+
+    lengths = np.diff(offsets)
+    x, y = coords[:, 0], coords[:, 1]
+    nxt = np.arange(len(coords)) + 1
+    nxt[offsets[1:] - 1] = offsets[:-1] # her çokgenin son köşesi ilk köşesine bağlanır
+    area2 = np.add.reduceat(x * y[nxt] - y * x[nxt], offsets[:-1])
+    sign = np.sign(area2)
+
+    small = np.maximum(lengths[pairs[candidates, 0]], lengths[pairs[candidates, 1]]) <= BATCH_MAX_VERTICES
+    vectorized = candidates[small]
+    if len(vectorized):
+        width = int(max(lengths[pairs[vectorized]].max(), 1))
+        padded = padded_polygons(coords, offsets, width)
+        for start in range(0, len(vectorized), chunk_pairs):
+            idx = vectorized[start:start + chunk_pairs]
+            ia, ib = pairs[idx, 0], pairs[idx, 1]
+            result[idx] = sat_pairs(padded[ia], padded[ib], sign[ia], sign[ib])
+    for k in candidates[~small]:
+        a, b = pairs[k]
+        result[k] = convex_intersect(coords[offsets[a]:offsets[a + 1]], coords[offsets[b]:offsets[b + 1]])
+    return result
+
+def candidate_pairs(bounds, chunk_pairs=1 << 22):
+    """Sınırlayıcı kutuları x ekseninde sıralayıp tarayarak (sweep and prune) aday çiftleri bul
+
+    x'te çakışan çiftler en fazla chunk_pairs'lik bloklar halinde üretilip
+    hemen y'de elenir; böylece bellek sahnedeki yoğunlukla sınırlı kalır.
+    """
+    order = np.argsort(bounds[:, 0], kind="stable")
+    min_x = bounds[order, 0]
+    # Sıralı listede i'den sonra, i'nin max_x değerinden önce başlayan kutular x'te çakışır
+    reach = np.searchsorted(min_x, bounds[order, 2], side="right")
+    counts = np.maximum(reach - np.arange(len(order)) - 1, 0)
+    ends = np.cumsum(counts)
+    found = []
+    i = 0
+    while i < len(order):
+        # Toplam aday sayısı chunk_pairs'i aşmayacak kadar sıralı kutu al (en az bir)
+        j = max(i + 1, int(np.searchsorted(ends, ends[i] - counts[i] + chunk_pairs, side="right")))
+        block = counts[i:j]
+        first = np.repeat(np.arange(i, j), block)
+        second = first + 1 + np.arange(block.sum()) - np.repeat(np.cumsum(block) - block, block)
+        pairs = np.column_stack([order[first], order[second]])
+        found.append(pairs[boxes_overlap(bounds, pairs[:, 0], pairs[:, 1])])
+        i = j
+    return np.concatenate(found) if found else np.empty((0, 2), dtype=np.int64)
+
+def find_intersections(coords, offsets, check_convex=False):
+    """Tüm çokgenler arasında kesişen çiftleri bul (sweep and prune + SAT)"""
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    pairs = candidate_pairs(polygon_bounds(coords, offsets))
+    return pairs[batch_intersect(coords, offsets, pairs, broad_phase=False, check_convex=check_convex)]
+
+if __name__ == "__main__":
+    import time
+
+    # 🔸 Örnek: iki kare ve bir üçgen
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    shifted = [(1, 1), (3, 1), (3, 3), (1, 3)]
+    far = [(5, 0), (6, 0), (5.5, 1)]
+    print("Kare ∩ kaydırılmış kare:", convex_intersect(square, shifted), "| convex:", is_polygon_convex(square))
+    print("Kare ∩ uzak üçgen:", convex_intersect(square, far), "| ayırıcı eksen:", separating_axis(square, far))
+
+    # Rastgele küçük convex çokgenlerden oluşan sahne
+    rng = np.random.default_rng(0)
+    n_polygons = 200000
+    sizes = rng.integers(3, 12, n_polygons)
+    polygons = []
+    for n, center in zip(sizes, rng.uniform(0, 1000, (n_polygons, 2))):
+        angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+        polygons.append(center + rng.uniform(0.5, 2.0) * np.column_stack([np.cos(angles), np.sin(angles)]))
+    coords = np.concatenate(polygons)
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+
+    n_pairs = 1000000
+    pairs = rng.integers(0, n_polygons, (n_pairs, 2))
+    pairs[: n_pairs // 2, 1] = (pairs[: n_pairs // 2, 0] + 1) % n_polygons
+    near = rng.integers(0, n_polygons, n_pairs // 4)
+    polygons_near = np.argsort(np.round(coords[offsets[:-1], 0] / 4) * 1000 + coords[offsets[:-1], 1] / 4)
+    pairs[n_pairs // 2: n_pairs // 2 + len(near)] = np.column_stack([polygons_near[near], polygons_near[(near + 1) % n_polygons]])
+
+    start_time = time.time()
+    hits = batch_intersect(coords, offsets, pairs)
+    elapsed_time = time.time() - start_time
+    print("{} çift: {} kesişim ({:.2f} saniye, {:.2f}M çift/sn)".format(
+        n_pairs, int(hits.sum()), elapsed_time, n_pairs / elapsed_time / 1e6))
+
+    check = rng.choice(np.nonzero(boxes_overlap(polygon_bounds(coords, offsets), pairs[:, 0], pairs[:, 1]))[0], 2000)
+    mismatches = sum(convex_intersect(polygons[pairs[k, 0]], polygons[pairs[k, 1]]) != hits[k] for k in check)
+    print("Tekli O(n + m) test ile karşılaştırma: {} farklı sonuç".format(mismatches))
+
+    start_time = time.time()
+    found = find_intersections(coords, offsets)
+    print("Sahnedeki tüm kesişen çiftler: {} ({:.2f} saniye)".format(len(found), time.time() - start_time))
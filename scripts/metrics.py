@@ -0,0 +1,256 @@
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+QUANTILES = (0.5, 0.95, 0.99)
+DEFAULT_WINDOW = 2048 # yüzdelikler son bu kadar gözlemden hesaplanır
+PREFIX = "convex_"
+DEFAULT_PORT = 0 # boş bir port seçilir; 9100 node_exporter'ın varsayılanıdır
+
+def new_registry(window=DEFAULT_WINDOW):
+    """Boş metrik kaydı: sayaçlar, göstergeler ve gecikme özetleri (etiket demetine göre)"""
+    return {"lock": threading.Lock(), "window": window, "help": {},
+            "counters": {}, "gauges": {}, "summaries": {}}
+
+REGISTRY = new_registry()
+
+def _key(labels):
+    return tuple(sorted(labels.items()))
+
+def describe(name, kind, text, registry=REGISTRY):
+    """Metriğin Prometheus # HELP / # TYPE satırlarını kaydet"""
+    registry["help"][name] = (kind, text)
+
+def inc(name, value=1, registry=REGISTRY, **labels):
+    """Sayacı artır"""
+    with registry["lock"]:
+        series = registry["counters"].setdefault(name, {})
+        series[_key(labels)] = series.get(_key(labels), 0) + value
+
+def set_gauge(name, value, registry=REGISTRY, **labels):
+    """Göstergeye son değeri yaz"""
+    with registry["lock"]:
+        registry["gauges"].setdefault(name, {})[_key(labels)] = value
+
+def observe(name, value, registry=REGISTRY, **labels):
+    """Gecikme gözlemi ekle: toplam/sayı tutulur, son window gözlem yüzdelikler için saklanır"""
+    with registry["lock"]:
+        series = registry["summaries"].setdefault(name, {})
+        entry = series.get(_key(labels))
+        if entry is None:
+            entry = series[_key(labels)] = {"sum": 0.0, "count": 0, "recent": deque(maxlen=registry["window"])}
+        entry["sum"] += value
+        entry["count"] += 1
+        entry["recent"].append(value)
+
+describe("polygons_total", "counter", "Kontrol edilen çokgen sayısı")
+describe("vertices_total", "counter", "Kontrol edilen köşe sayısı")
+describe("checks_total", "counter", "Backend çağrısı sayısı (verdict etiketiyle)")
+describe("check_seconds", "summary", "Tek backend çağrısının süresi")
+describe("cache_requests_total", "counter", "Önbellek istekleri (result=hit|miss)")
+describe("cache_hit_ratio", "gauge", "Önbellek isabet oranı")
+describe("worker_utilization", "gauge", "Worker'ın meşgul süresinin duvar süresine oranı")
+describe("stage_utilization", "gauge", "Boru hattı aşamasının meşgul süresinin duvar süresine oranı")
+describe("stage_stall_seconds_total", "counter", "Boru hattı aşamasının bekleme süresi (kind=starved|blocked)")
+
+# ---------------------------------------------------------------------------
+# Kayıt yardımcıları: çağrı başına bir kez çalışır, köşe döngüsüne girmez
+# ---------------------------------------------------------------------------
+
+def record_check(backend, polygons, vertices, seconds, convex=None, registry=REGISTRY):
+    """Bir backend çağrısının sonucunu tek seferde kaydet"""
+    inc("polygons_total", polygons, registry, backend=backend)
+    inc("vertices_total", vertices, registry, backend=backend)
+    verdict = "unknown" if convex is None else ("convex" if convex else "concave")
+    inc("checks_total", 1, registry, backend=backend, verdict=verdict)
+    observe("check_seconds", seconds, registry, backend=backend)
+
+def record_cache(cache, hit, registry=REGISTRY):
+    """Önbellek isabetini/ıskalamasını say ve isabet oranını güncelle"""
+    inc("cache_requests_total", 1, registry, cache=cache, result="hit" if hit else "miss")
+    with registry["lock"]:
+        series = registry["counters"]["cache_requests_total"]
+        hits = series.get(_key({"cache": cache, "result": "hit"}), 0)
+        misses = series.get(_key({"cache": cache, "result": "miss"}), 0)
+    set_gauge("cache_hit_ratio", hits / (hits + misses), registry, cache=cache)
+
+def record_scheduler_stats(stats, registry=REGISTRY):
+    """scheduler.scheduled_batch_convex istatistiklerinden worker kullanım oranlarını yaz"""
+    wall = stats["wall_seconds"]
+    for w, worker in enumerate(stats["per_worker"]):
+        set_gauge("worker_utilization", worker["busy_seconds"] / wall if wall > 0 else 0.0, registry,
+                  pool="scheduler", worker=str(w))
+
+def record_pipeline_stats(stats, registry=REGISTRY):
+    """pipeline.run_pipeline istatistiklerinden aşama kullanımı ve bekleme sürelerini yaz"""
+    for stage in ("io", "compute", "write"):
+        s = stats[stage]
+        set_gauge("stage_utilization", s["utilization"], registry, stage=stage)
+        inc("stage_stall_seconds_total", s["starved_seconds"], registry, stage=stage, kind="starved")
+        inc("stage_stall_seconds_total", s["blocked_seconds"], registry, stage=stage, kind="blocked")
+
+def instrumented_run(name, points, workers=1, registry=REGISTRY):
+    """backends.BACKENDS içindeki backend'i çalıştır ve çağrıyı kaydet (hazırlık süreye dahil değil)"""
+    from backends import BACKENDS, prepare_backend
+    backend = BACKENDS[name]
+    prepared = prepare_backend(backend, points, workers)
+    start_time = time.perf_counter()
+    result = backend["run"](prepared, workers)
+    record_check(name, 1, len(points), time.perf_counter() - start_time, bool(result), registry)
+    return result
+
+def timed_batch(backend, check, coords, offsets, registry=REGISTRY):
+    """check(coords, offsets) toplu çağrısını ölç; çokgen başına sayaçlar tek artışla eklenir"""
+    start_time = time.perf_counter()
+    result = check(coords, offsets)
+    record_check(backend, len(offsets) - 1, int(offsets[-1] - offsets[0]), time.perf_counter() - start_time,
+                 registry=registry)
+    return result
+
+# ---------------------------------------------------------------------------
+# Dışa aktarma
+# ---------------------------------------------------------------------------
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _labels(key, extra=()):
+    items = list(key) + list(extra)
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}" if items else ""
+
+def _format_value(value):
+    return repr(float(value)) if not isinstance(value, int) else str(value)
+
+def snapshot(registry=REGISTRY):
+    """Kaydın tutarlı bir kopyası; yüzdelikler burada (kilidin dışında) hesaplanır"""
+    with registry["lock"]:
+        counters = {name: dict(series) for name, series in registry["counters"].items()}
+        gauges = {name: dict(series) for name, series in registry["gauges"].items()}
+        summaries = {name: {key: (entry["sum"], entry["count"], list(entry["recent"]))
+                            for key, entry in series.items()}
+                     for name, series in registry["summaries"].items()}
+    for series in summaries.values():
+        for key, (total, count, recent) in series.items():
+            series[key] = {"sum": total, "count": count,
+                           "quantiles": dict(zip(QUANTILES, np.quantile(recent, QUANTILES).tolist()))}
+    return {"counters": counters, "gauges": gauges, "summaries": summaries}
+
+def prometheus_text(registry=REGISTRY):
+    """Kaydı Prometheus metin biçiminde (0.0.4) döndür"""
+    snap = snapshot(registry)
+    lines = []
+
+    def header(name, kind):
+        full = PREFIX + name
+        text = registry["help"].get(name, (kind, name))[1]
+        lines.append(f"# HELP {full} {text}")
+        lines.append(f"# TYPE {full} {kind}")
+        return full
+
+    for name, series in sorted(snap["counters"].items()):
+        full = header(name, "counter")
+        lines.extend(f"{full}{_labels(key)} {_format_value(v)}" for key, v in sorted(series.items()))
+    for name, series in sorted(snap["gauges"].items()):
+        full = header(name, "gauge")
+        lines.extend(f"{full}{_labels(key)} {_format_value(v)}" for key, v in sorted(series.items()))
+    for name, series in sorted(snap["summaries"].items()):
+        full = header(name, "summary")
+        for key, entry in sorted(series.items()):
+            for q, value in entry["quantiles"].items():
+                lines.append(f"{full}{_labels(key, [('quantile', q)])} {_format_value(value)}")
+            lines.append(f"{full}_sum{_labels(key)} {_format_value(entry['sum'])}")
+            lines.append(f"{full}_count{_labels(key)} {entry['count']}")
+    return "\n".join(lines) + "\n"
+
+def write_metrics(path, registry=REGISTRY):
+    """Metin dosyasını geçici dosya + os.replace ile atomik yaz (node_exporter textfile toplayıcısı için)"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(prometheus_text(registry))
+    os.replace(tmp, path)
+
+def write_metrics_periodically(path, interval=15.0, registry=REGISTRY):
+    """Arka planda her interval saniyede bir dosyaya yaz; durdurmak için dönen Event'i set edin"""
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            write_metrics(path, registry)
+        write_metrics(path, registry) # durdurulurken son durumu yaz
+
+    threading.Thread(target=loop, daemon=True).start()
+    return stop
+
+def serve_metrics(port=DEFAULT_PORT, host="127.0.0.1", registry=REGISTRY):
+    """/metrics uç noktasını arka plan thread'inde sun; dönen sunucu .shutdown() ile durdurulur
+
+    port=0 ise işletim sistemi boş bir port seçer; bağlanılan port server.server_address[1]'dedir.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = prometheus_text(registry).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args): # istek başına konsola yazma
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    import argparse
+    import urllib.request
+
+    from range_query import build_range_index
+    from scheduler import scheduled_batch_convex
+    from vectorized_solution import batch_is_convex
+
+    parser = argparse.ArgumentParser(description="Sürekli çalışan kontrol işi için metrik uç noktası örneği")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0: boş bir port seç (varsayılan)")
+    parser.add_argument("--file", help="metriklerin periyodik yazılacağı dosya")
+    parser.add_argument("--interval", type=float, default=5.0)
+    parser.add_argument("--duration", type=float, default=5.0, help="örnek işin süresi (saniye)")
+    args = parser.parse_args()
+
+    server = serve_metrics(args.port)
+    stop = write_metrics_periodically(args.file, args.interval) if args.file else None
+    print(f"📡 Metrikler: http://127.0.0.1:{server.server_address[1]}/metrics")
+
+    # 🔸 Örnek iş: rastgele çokgen grupları, tekrar sorulan çokgenler için indeks önbelleği
+    rng = np.random.default_rng(0)
+    index_cache = {}
+    deadline = time.time() + args.duration
+    while time.time() < deadline:
+        sizes = rng.integers(3, 2000, 500)
+        coords = rng.normal(size=(int(sizes.sum()), 2))
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        timed_batch("vectorized_batch", batch_is_convex, coords, offsets)
+        convex, stats = scheduled_batch_convex(coords, offsets, num_workers=4)
+        record_check("scheduled", len(sizes), len(coords), stats["wall_seconds"])
+        record_scheduler_stats(stats)
+
+        angles = np.linspace(0, 2 * np.pi, int(rng.integers(1000, 100000)), endpoint=False)
+        instrumented_run("vectorized", np.column_stack([np.cos(angles), np.sin(angles)]))
+
+        polygon_id = int(rng.integers(0, 20))
+        record_cache("range_index", polygon_id in index_cache)
+        if polygon_id not in index_cache:
+            index_cache[polygon_id] = build_range_index(rng.normal(size=(10000, 2)))
+
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+        print(response.read().decode())
+    server.shutdown()
+    if stop is not None:
+        stop.set()
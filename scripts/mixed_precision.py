@@ -0,0 +1,181 @@
+import numpy as np
+
+from vectorized_solution import batch_indices, polygon_array, turn_flags
+
+BLOCK_TRIPLES = 1 << 16 # blok geçicileri önbellekte kalsın
+# float32 kenarlarla hesaplanan çapraz çarpımın, float64 referansına göre hata sınırı:
+# |cp32 - cp64| <= RELATIVE_BOUND * (|ax*by| + |ay*bx|) + ABSOLUTE_BOUND (iki kat pay ile)
+RELATIVE_BOUND = np.float32(2.0 ** -21)
+ABSOLUTE_BOUND = np.float32(2.0 ** -120) # alt normal çarpımların mutlak hatası için
+FLOAT32_TINY = np.finfo(np.float32).tiny
+
+def edge_vectors32(points):
+    """Her köşeden sonrakine (sonuncudan ilkine) kenar vektörlerini float32 olarak sakla
+
+    Üçlünün çapraz çarpımı yalnızca iki ardışık kenara bağlıdır; kenarlar
+    koordinatlardan farklı olarak ötelemeden bağımsızdır, bu yüzden float32
+    göreli hatası koordinatların büyüklüğünden etkilenmez. float32'de alt
+    normal kalan bileşenler (göreli hata sınırı geçersiz) NaN yapılır ve o
+    kenara dokunan üçlüler float64'e yükseltilir.
+    """
+    coords = polygon_array(points)
+    with np.errstate(over="ignore", invalid="ignore"):
+        edges = np.roll(coords, -1, axis=0) - coords if len(coords) else np.zeros((0, 2))
+    return _to_float32(edges)
+
+def batch_edge_vectors32(coords, offsets):
+    """edge_vectors32'nin batch_is_convex düzenindeki çokgen grubu için hali"""
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    _, i1, _ = batch_indices(offsets)
+    return _to_float32(coords[i1] - coords[offsets[0]:offsets[-1]])
+
+def _to_float32(edges):
+    with np.errstate(over="ignore", invalid="ignore"):
+        unreliable = (edges != 0) & (np.abs(edges) < FLOAT32_TINY)
+        edges32 = edges.astype(np.float32)
+    edges32[unreliable] = np.nan
+    return edges32
+
+def float32_turns(first, second):
+    """Ardışık kenar çiftlerinden float32 çapraz çarpım ve işareti belirsiz üçlülerin maskesi"""
+    with np.errstate(over="ignore", invalid="ignore", under="ignore"):
+        p1 = first[:, 0] * second[:, 1]
+        p2 = first[:, 1] * second[:, 0]
+        cp = p1 - p2
+        # NaN/inf karşılaştırması False döner: sonlu olmayan her şey belirsiz sayılır
+        certain = np.abs(cp) > (np.abs(p1) + np.abs(p2)) * RELATIVE_BOUND + ABSOLUTE_BOUND
+    return cp, ~certain
+
+def float64_cross_products(coords, i0, i1, i2):
+    """Belirsiz üçlüleri cross_product_sign ile aynı işlem sırasıyla float64'te yeniden hesapla"""
+    p1, p2, p3 = coords[i0], coords[i1], coords[i2]
+    with np.errstate(over="ignore", invalid="ignore"):
+        return (p2[:, 0] - p1[:, 0]) * (p3[:, 1] - p2[:, 1]) - (p2[:, 1] - p1[:, 1]) * (p3[:, 0] - p2[:, 0])
+
+def blocked_is_polygon_convex(coords, block=BLOCK_TRIPLES):
+    """Karşılaştırma için: aynı blok düzeninde, doğrudan float64 koordinatlar üzerinde tarama"""
+    coords = polygon_array(coords)
+    n = len(coords)
+    has_pos = has_neg = False
+    for start in range(0, n, block):
+        end = min(n, start + block)
+        # Bloğun üçlüleri için end + 2 köşe gerekir; sondaki blok başa sarar
+        pts = coords[start:end + 2] if end + 2 <= n else np.concatenate([coords[start:], coords[:end + 2 - n]])
+        p1, p2, p3 = pts[:-2], pts[1:-1], pts[2:]
+        with np.errstate(over="ignore", invalid="ignore"):
+            cp = (p2[:, 0] - p1[:, 0]) * (p3[:, 1] - p2[:, 1]) - (p2[:, 1] - p1[:, 1]) * (p3[:, 0] - p2[:, 0])
+        positive, negative = turn_flags(cp)
+        has_pos = has_pos or bool(positive.any())
+        has_neg = has_neg or bool(negative.any())
+    return not (has_pos and has_neg)
+
+def mixed_is_polygon_convex(coords, edges32=None, block=BLOCK_TRIPLES, return_stats=False):
+    """Tarama float32 kenarlar üzerinde, yalnızca işareti belirsiz üçlüler float64 koordinatlardan
+
+    Belirli üçlülerin işareti float64 referansıyla (ve kesin sonuçla) aynıdır;
+    belirsizler referansın kendisiyle hesaplandığından sonuç is_polygon_convex
+    ile birebir aynıdır. coords yalnızca seyrek yükseltmelerde okunur.
+    """
+    coords = polygon_array(coords)
+    edges32 = edge_vectors32(coords) if edges32 is None else edges32
+    n = len(edges32)
+    has_pos = has_neg = False
+    escalated = 0
+    for start in range(0, n, block):
+        end = min(n, start + block)
+        # i. üçlü (i, i+1, i+2) = i. ve (i+1). kenarlar; son kenar başa sarar
+        second = edges32[start + 1:end + 1] if end < n else np.concatenate([edges32[start + 1:], edges32[:1]])
+        cp, uncertain = float32_turns(edges32[start:end], second)
+        idx = np.flatnonzero(uncertain)
+        if len(idx):
+            i0 = start + idx
+            cp = cp.astype(np.float64)
+            cp[idx] = float64_cross_products(coords, i0, (i0 + 1) % n, (i0 + 2) % n)
+            escalated += len(idx)
+        positive, negative = turn_flags(cp)
+        has_pos = has_pos or bool(positive.any())
+        has_neg = has_neg or bool(negative.any())
+    convex = not (has_pos and has_neg)
+    if return_stats:
+        return convex, {"triples": n, "escalated": escalated, "escalated_fraction": escalated / n if n else 0.0}
+    return convex
+
+def mixed_batch_is_convex(coords, offsets, edges32=None, return_stats=False):
+    """batch_is_convex'in float32 kenarlı ve yükseltmeli hali"""
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    num_polygons = len(offsets) - 1
+    if num_polygons <= 0:
+        return (np.zeros(0, dtype=bool), {"triples": 0, "escalated": 0, "escalated_fraction": 0.0}) \
+            if return_stats else np.zeros(0, dtype=bool)
+    edges32 = batch_edge_vectors32(coords, offsets) if edges32 is None else edges32
+    polygon_ids, i1, i2 = batch_indices(offsets)
+    base = offsets[0]
+    cp, uncertain = float32_turns(edges32, edges32[i1 - base])
+    idx = np.flatnonzero(uncertain)
+    if len(idx):
+        cp = cp.astype(np.float64)
+        cp[idx] = float64_cross_products(coords, base + idx, i1[idx], i2[idx])
+    positive, negative = turn_flags(cp)
+    has_pos = np.bincount(polygon_ids[positive], minlength=num_polygons) > 0
+    has_neg = np.bincount(polygon_ids[negative], minlength=num_polygons) > 0
+    convex = ~(has_pos & has_neg)
+    if return_stats:
+        triples = len(cp)
+        return convex, {"triples": triples, "escalated": len(idx),
+                        "escalated_fraction": len(idx) / triples if triples else 0.0}
+    return convex
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    from vectorized_solution import batch_is_convex, is_polygon_convex
+
+    def measure(fn, *args):
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        result = fn(*args)
+        elapsed_time = time.perf_counter() - start_time
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result, elapsed_time, peak
+
+    # 🔸 10M köşeli ince convex çokgen: aynı blok düzeninde float64 tarama ile float32 + yükseltme
+    n_points = 10000000
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    coords = np.column_stack([1000 + 10 * np.cos(angles), 2000 + 10 * np.sin(angles)])
+    start_time = time.perf_counter()
+    edges32 = edge_vectors32(coords)
+    prepare_time = time.perf_counter() - start_time
+    print("💾 {} köşe | float64 koordinat: {:.0f} MB | float32 kenar: {:.0f} MB (hazırlık {:.3f}s)".format(
+        n_points, coords.nbytes / 1e6, edges32.nbytes / 1e6, prepare_time))
+
+    expected, ref_time, ref_peak = measure(is_polygon_convex, coords)
+    blocked, blocked_time, blocked_peak = measure(blocked_is_polygon_convex, coords)
+    (actual, stats), mixed_time, mixed_peak = measure(
+        lambda: mixed_is_polygon_convex(coords, edges32, return_stats=True))
+    row = "   {:<26}: {:.3f}s | tepe geçici {:.0f} MB | kalıcı {:.0f} MB"
+    print(row.format("float64 is_polygon_convex", ref_time, ref_peak / 1e6, coords.nbytes / 1e6))
+    print(row.format("float64 bloklu tarama", blocked_time, blocked_peak / 1e6, coords.nbytes / 1e6),
+          "| aynı sonuç: {}".format(blocked == expected))
+    # float32 taraması seyrek yükseltmeler için float64 koordinatları da bellekte tutar
+    print(row.format("float32 + yükseltme", mixed_time, mixed_peak / 1e6, (coords.nbytes + edges32.nbytes) / 1e6),
+          "| bloklu float64'e göre {:.2f}x (hazırlık dahil {:.2f}x) | yükseltilen {:.4%} | aynı sonuç: {}".format(
+              blocked_time / mixed_time, blocked_time / (mixed_time + prepare_time),
+              stats["escalated_fraction"], actual == expected))
+
+    # Çekişmeli durum: neredeyse doğrusal köşeler ve tekrarlar içeren küçük çokgenler
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(3, 30, 300000)
+    base = rng.uniform(-1e6, 1e6, (len(sizes), 2))
+    coords = np.repeat(base, sizes, axis=0) + rng.normal(0, 1, (int(sizes.sum()), 2))
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    line = rng.random(len(coords)) < 0.2 # bazı köşeleri önceki kenarın doğrultusuna yerleştir
+    coords[2:][line[2:]] = 2 * coords[1:-1][line[2:]] - coords[:-2][line[2:]] + rng.normal(0, 1e-9, (int(line[2:].sum()), 2))
+    edges32 = batch_edge_vectors32(coords, offsets)
+    expected, ref_time, _ = measure(batch_is_convex, coords, offsets)
+    (actual, stats), mixed_time, _ = measure(lambda: mixed_batch_is_convex(coords, offsets, edges32, return_stats=True))
+    print("📦 {} çokgen (neredeyse doğrusal) | batch_is_convex {:.3f}s | float32 {:.3f}s | yükseltilen {:.4%} | aynı sonuç: {}".format(
+        len(sizes), ref_time, mixed_time, stats["escalated_fraction"], bool((actual == expected).all())))
@@ -50,23 +50,20 @@ def visualize_polygon(points, is_convex):
     plt.title("Polygon is " + ("CONVEX" if is_convex else "CONCAVE"), fontsize=14, color='green' if is_convex else 'red')
     plt.show()
 
-if __name__ == "__main__":
-    # 🔸 Örnek 1: Concave polygon
+def parallel_convex(points, thread_count):
+    """Noktaları thread'lere dağıt ve çokgenin convex olup olmadığını döndür"""
     SIGNS.clear()
-    points = [ (2, 2), (0, 2),(0,5),(1,5),(2,5),(3,4),(4,5),(5,5),(6,5),(7,5),(8,5),(9,5),(10,5)]
     point_len = len(points) # dizideki nokta satısı
     
-    points_for_c = points.copy() # c diline gönderilecek olan nokta dizisi
+    points_for_c = list(points) # c diline gönderilecek olan nokta dizisi
     
     points_for_c.append(points[0])
-    points_for_c.append(points[1])
+    points_for_c.append(points[1 % point_len])
     
-    thread_count = 1 # thread sayısı
+    thread_count = max(1, min(thread_count, point_len)) # nokta sayısından fazla thread açma
     points_per_thread = point_len // thread_count # her bir thread'e düşen nokta sayısı
     fazlalık = point_len % thread_count # fazlalık nokta sayısı
     
-    
-    start_time = time.time() # başlangıç zamanı
     # Threadler için dizileri oluşturma
     total = 0
     threads = []
@@ -78,7 +75,6 @@ if __name__ == "__main__":
         for j in range(points_per_thread):
             thread_array.append(points_for_c[total : total + 3])
             total += 1
-        print("Thread {}: {}".format(i, thread_array))
         points_per_thread = point_len // thread_count # her bir thread'e düşen nokta sayısı
         
         t = threading.Thread(target=is_polygon_convex, args=(thread_array,))
@@ -89,11 +85,18 @@ if __name__ == "__main__":
     for t in threads:
         t.join()
                 
+    return check_convexity()
+
+if __name__ == "__main__":
+    # 🔸 Örnek 1: Concave polygon
+    points = [ (2, 2), (0, 2),(0,5),(1,5),(2,5),(3,4),(4,5),(5,5),(6,5),(7,5),(8,5),(9,5),(10,5)]
+    
+    thread_count = 1 # thread sayısı
+    
+    start_time = time.time() # başlangıç zamanı
     # Convexlik testi ve görselleştirme
-    is_convex = check_convexity()
+    is_convex = parallel_convex(points, thread_count)
     end_time = time.time() # bitiş zamanı
     elapsed_time = end_time - start_time # geçen süre
     print("Elapsed time: {:.2f} seconds".format(elapsed_time))
     visualize_polygon(points, is_convex)
-    
-    
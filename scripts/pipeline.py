@@ -0,0 +1,310 @@
+import io
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ingest import DEFAULT_BATCH_VERTICES, FORMATS, file_format, iter_batches, iter_stream_rings
+from vectorized_solution import batch_is_convex
+
+DEFAULT_IO_WORKERS = 4
+DEFAULT_PREFETCH = 8 # aynı anda okunmakta olan en fazla dosya sayısı
+DEFAULT_QUEUE_DEPTH = 4 # okunmuş ama henüz kontrol edilmemiş en fazla dosya sayısı
+STAGES = ("io", "compute", "write")
+CANCEL_POLL_SECONDS = 0.1 # bloklanan put/get'lerin iptal bayrağını kontrol etme aralığı
+
+def read_file(path):
+    """Dosyanın tamamını tek okumada belleğe al"""
+    with open(path, "rb") as f:
+        return f.read()
+
+def parse_file(path, data, fmt=None, exterior_only=False, batch_vertices=DEFAULT_BATCH_VERTICES):
+    """Okunmuş baytları ingest ayrıştırıcılarıyla batch tamponlarına çevir"""
+    fmt = file_format(path, fmt)
+    stream = io.BytesIO(data)
+    if fmt not in ("wkb", "npy"):
+        stream = io.TextIOWrapper(stream, encoding="utf-8")
+    return list(iter_batches(iter_stream_rings(stream, fmt, exterior_only), batch_vertices))
+
+def list_polygon_files(directory):
+    """Dizindeki, ingest'in tanıdığı uzantılara sahip dosyalar (sıralı)"""
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if os.path.splitext(name)[1].lower() in FORMATS)
+
+def new_stage_stats():
+    """busy: iş yapılan süre, starved: girdi beklenen süre, blocked: çıktı kuyruğu dolu beklenen süre"""
+    return {"busy_seconds": 0.0, "starved_seconds": 0.0, "blocked_seconds": 0.0, "items": 0}
+
+def check_batches(batches):
+    """Dosyanın batch'lerini kontrol et: (ids, köşe sayıları, convex) dizileri"""
+    ids, vertices, convex = [], [], []
+    for coords, offsets, batch_ids in batches:
+        ids.append(batch_ids)
+        vertices.append(np.diff(offsets))
+        convex.append(batch_is_convex(coords, offsets))
+    if not ids:
+        return np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+    return np.concatenate(ids), np.concatenate(vertices), np.concatenate(convex)
+
+def write_result(out, path, ids, vertices, convex):
+    """Dosyanın halka sonuçlarını CSV satırları olarak yaz"""
+    if out is not None:
+        out.write("".join(f"{path},{f},{p},{r},{v},{int(c)}\n"
+                          for (f, p, r), v, c in zip(ids.tolist(), vertices.tolist(), convex.tolist())))
+
+def _timed_put(q, item, stats, cancel=None):
+    """Kuyruk doluysa bekle; cancel ayarlanırsa bırakıp False döndür"""
+    start_time = time.perf_counter()
+    try:
+        while True:
+            try:
+                q.put(item, timeout=CANCEL_POLL_SECONDS)
+                return True
+            except queue.Full:
+                if cancel is not None and cancel.is_set():
+                    return False
+    finally:
+        stats["blocked_seconds"] += time.perf_counter() - start_time
+
+def _timed_get(q, stats, cancel=None):
+    """Kuyruk boşsa bekle; cancel ayarlanırsa None (akış sonu) döndür"""
+    start_time = time.perf_counter()
+    try:
+        while True:
+            try:
+                return q.get(timeout=CANCEL_POLL_SECONDS)
+            except queue.Empty:
+                if cancel is not None and cancel.is_set():
+                    return None
+    finally:
+        stats["starved_seconds"] += time.perf_counter() - start_time
+
+def _drain(q):
+    """Kuyruktaki öğeleri beklemeden at"""
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+def run_pipeline(paths, output=None, io_workers=DEFAULT_IO_WORKERS, prefetch=DEFAULT_PREFETCH,
+                 queue_depth=DEFAULT_QUEUE_DEPTH, fmt=None, exterior_only=False,
+                 batch_vertices=DEFAULT_BATCH_VERTICES, reader=read_file):
+    """Dosyaları önden okuyarak (I/O havuzu), kontrol ederek ve sonuçları eşzamansız yazarak işle
+
+    Okuma + ayrıştırma io_workers thread'lik havuzda en fazla prefetch dosya
+    önde yürür; ayrıştırılmış batch'ler sınırlı kuyrukla bu thread'deki
+    batch_is_convex'e, sonuçlar ikinci bir kuyrukla yazıcı thread'e geçer.
+    Bir aşama hata verirse iptal bayrağı diğerlerini durdurur ve ilk hata
+    yeniden fırlatılır.
+    Dönüş: (dosya başına özet sözlüğü, aşama istatistikleri)
+    """
+    paths = list(paths)
+    stats = {stage: new_stage_stats() for stage in STAGES}
+    stats["io"].update({"read_seconds": 0.0, "parse_seconds": 0.0, "bytes": 0})
+    loaded = queue.Queue(maxsize=max(1, queue_depth))
+    results = queue.Queue(maxsize=max(1, queue_depth))
+    summary = {}
+    errors = []
+    io_lock = threading.Lock()
+    cancel = threading.Event()
+
+    def load(path):
+        start_time = time.perf_counter()
+        data = reader(path)
+        read_time = time.perf_counter() - start_time
+        batches = parse_file(path, data, fmt, exterior_only, batch_vertices)
+        with io_lock:
+            stats["io"]["read_seconds"] += read_time
+            stats["io"]["parse_seconds"] += time.perf_counter() - start_time - read_time
+            stats["io"]["bytes"] += len(data)
+        return path, batches
+
+    def prefetcher():
+        # Dosya sırası korunur: sonuçlar gönderildikleri sırada kuyruğa girer
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, io_workers)) as pool:
+                pending = deque()
+                try:
+                    for path in paths:
+                        pending.append(pool.submit(load, path))
+                        if len(pending) >= max(1, prefetch):
+                            if not _timed_put(loaded, pending.popleft().result(), stats["io"], cancel):
+                                return
+                    while pending:
+                        if not _timed_put(loaded, pending.popleft().result(), stats["io"], cancel):
+                            return
+                finally:
+                    for future in pending: # iptalde henüz başlamamış okumalar atlanır
+                        future.cancel()
+        except Exception as exc:
+            errors.append(exc)
+            cancel.set()
+        finally:
+            _timed_put(loaded, None, stats["io"], cancel)
+
+    def writer():
+        out = None
+        try:
+            out = open(output, "w") if output else None
+            if out is not None:
+                out.write("path,feature,part,ring,vertices,convex\n")
+            while True:
+                item = _timed_get(results, stats["write"])
+                if item is None:
+                    break
+                start_time = time.perf_counter()
+                write_result(out, *item)
+                stats["write"]["busy_seconds"] += time.perf_counter() - start_time
+                stats["write"]["items"] += 1
+        except Exception as exc:
+            errors.append(exc)
+            cancel.set()
+            while results.get() is not None: # üreticiyi kilitlememek için kuyruğu boşalt
+                pass
+        finally:
+            if out is not None:
+                out.close()
+
+    start_time = time.perf_counter()
+    threads = [threading.Thread(target=prefetcher, daemon=True), threading.Thread(target=writer, daemon=True)]
+    for t in threads:
+        t.start()
+    try:
+        while True:
+            item = _timed_get(loaded, stats["compute"], cancel)
+            if item is None:
+                break
+            path, batches = item
+            compute_start = time.perf_counter()
+            ids, vertices, convex = check_batches(batches)
+            stats["compute"]["busy_seconds"] += time.perf_counter() - compute_start
+            stats["compute"]["items"] += 1
+            summary[path] = {"rings": len(convex), "convex": int(convex.sum()), "vertices": int(vertices.sum())}
+            _timed_put(results, (path, ids, vertices, convex), stats["compute"])
+    except BaseException:
+        # Hesaplama hatası: okuyucuları durdur, kuyruğu boşalt, özgün hata yukarı çıkar
+        cancel.set()
+        _drain(loaded)
+        raise
+    finally:
+        results.put(None) # yazıcı None'a kadar her zaman okur
+        for t in threads:
+            t.join()
+    stats["io"]["items"] = len(summary)
+    stats["io"]["busy_seconds"] = (stats["io"]["read_seconds"] + stats["io"]["parse_seconds"]) / max(1, io_workers)
+    finish_stats(stats, time.perf_counter() - start_time, io_workers)
+    if errors:
+        raise errors[0]
+    return summary, stats
+
+def run_sequential(paths, output=None, fmt=None, exterior_only=False, batch_vertices=DEFAULT_BATCH_VERTICES,
+                   reader=read_file):
+    """Karşılaştırma için eski yol: dosyayı oku, kontrol et, yaz, sonrakine geç"""
+    stats = {stage: new_stage_stats() for stage in STAGES}
+    stats["io"].update({"read_seconds": 0.0, "parse_seconds": 0.0, "bytes": 0})
+    summary = {}
+    start_time = time.perf_counter()
+    out = open(output, "w") if output else None
+    try:
+        if out is not None:
+            out.write("path,feature,part,ring,vertices,convex\n")
+        for path in paths:
+            t0 = time.perf_counter()
+            data = reader(path)
+            t1 = time.perf_counter()
+            batches = parse_file(path, data, fmt, exterior_only, batch_vertices)
+            t2 = time.perf_counter()
+            ids, vertices, convex = check_batches(batches)
+            t3 = time.perf_counter()
+            write_result(out, path, ids, vertices, convex)
+            t4 = time.perf_counter()
+            stats["io"]["read_seconds"] += t1 - t0
+            stats["io"]["parse_seconds"] += t2 - t1
+            stats["io"]["bytes"] += len(data)
+            stats["compute"]["busy_seconds"] += t3 - t2
+            stats["write"]["busy_seconds"] += t4 - t3
+            summary[path] = {"rings": len(convex), "convex": int(convex.sum()), "vertices": int(vertices.sum())}
+    finally:
+        if out is not None:
+            out.close()
+    for stage in STAGES:
+        stats[stage]["items"] = len(summary)
+    stats["io"]["busy_seconds"] = stats["io"]["read_seconds"] + stats["io"]["parse_seconds"]
+    finish_stats(stats, time.perf_counter() - start_time, 1)
+    return summary, stats
+
+def finish_stats(stats, wall, io_workers):
+    """Duvar süresini, darboğaz aşamasını ve max/toplam ideal sürelerini ekle"""
+    busy = {stage: stats[stage]["busy_seconds"] for stage in STAGES}
+    for stage in STAGES:
+        stats[stage]["utilization"] = busy[stage] / wall if wall > 0 else 0.0
+    stats["wall_seconds"] = wall
+    stats["io_workers"] = io_workers
+    stats["bottleneck"] = max(busy, key=busy.get)
+    # İdeal boru hattı en yavaş aşama kadar sürer; sıralı işleme hepsinin toplamı kadar
+    stats["ideal_seconds"] = max(busy.values())
+    stats["sum_seconds"] = sum(busy.values())
+    stats["megabytes_per_second"] = stats["io"]["bytes"] / wall / 1e6 if wall > 0 else 0.0
+
+def format_pipeline_stats(stats):
+    """Aşama istatistiklerini okunabilir satırlar halinde döndür"""
+    lines = ["{:.3f}s duvar | ideal max(aşamalar) {:.3f}s | toplam {:.3f}s | {:.1f} MB/s | darboğaz: {}".format(
+        stats["wall_seconds"], stats["ideal_seconds"], stats["sum_seconds"], stats["megabytes_per_second"],
+        stats["bottleneck"])]
+    for stage in STAGES:
+        s = stats[stage]
+        extra = ""
+        if stage == "io":
+            extra = " (okuma {:.3f}s + ayrıştırma {:.3f}s, {} thread)".format(
+                s["read_seconds"], s["parse_seconds"], stats["io_workers"])
+        lines.append("  {:<8} meşgul {:.3f}s | girdi bekleme {:.3f}s | çıktı bekleme {:.3f}s | kullanım {:.0%}{}".format(
+            stage, s["busy_seconds"], s["starved_seconds"], s["blocked_seconds"], s["utilization"], extra))
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Dizindeki poligon dosyalarını önden okuyan boru hattıyla kontrol et")
+    parser.add_argument("directory", nargs="?", help="girdi dizini (verilmezse sentetik örnek üretilir)")
+    parser.add_argument("--output", help="halka sonuçlarının yazılacağı CSV dosyası")
+    parser.add_argument("--io-workers", type=int, default=DEFAULT_IO_WORKERS)
+    parser.add_argument("--prefetch", type=int, default=DEFAULT_PREFETCH)
+    parser.add_argument("--queue-depth", type=int, default=DEFAULT_QUEUE_DEPTH)
+    parser.add_argument("--exterior-only", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="sentetik örnekte her okumaya eklenen depolama gecikmesi (saniye)")
+    args = parser.parse_args()
+
+    if args.directory:
+        summary, stats = run_pipeline(list_polygon_files(args.directory), args.output, args.io_workers,
+                                      args.prefetch, args.queue_depth, exterior_only=args.exterior_only)
+        print("{} dosya, {} halka".format(len(summary), sum(s["rings"] for s in summary.values())))
+        print(format_pipeline_stats(stats))
+        raise SystemExit
+
+    # 🔸 Sentetik dizin: büyük .npy çokgenleri ve WKB dosyaları, gecikmeli depolama taklidi
+    tmp = tempfile.mkdtemp()
+    rng = np.random.default_rng(0)
+    for k in range(40):
+        n = int(rng.integers(200000, 400000))
+        angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        np.save(os.path.join(tmp, f"polygon_{k:03d}.npy"), np.column_stack([np.cos(angles), np.sin(angles)]))
+    paths = list_polygon_files(tmp)
+
+    def slow_reader(path):
+        time.sleep(args.latency) # ağ depolamasındaki ilk bayt gecikmesi
+        return read_file(path)
+
+    seq_summary, seq_stats = run_sequential(paths, os.path.join(tmp, "sequential.csv"), reader=slow_reader)
+    print("🐢 Sıralı: " + format_pipeline_stats(seq_stats))
+    summary, stats = run_pipeline(paths, os.path.join(tmp, "pipeline.csv"), args.io_workers, args.prefetch,
+                                  args.queue_depth, reader=slow_reader)
+    print("🚰 Boru hattı: " + format_pipeline_stats(stats))
+    print("Hızlanma: {:.2f}x | aynı sonuç: {}".format(seq_stats["wall_seconds"] / stats["wall_seconds"],
+                                                     summary == seq_summary))
@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from parallel_solution import cross_product_sign
+from vectorized_solution import chunk_ranges, cross_product_signs, halo_chunk, is_polygon_convex, polygon_array
+
+def normalize_convex(points):
+    """Convex çokgeni tekrar eden ve doğrusal köşelerden arındır, saat yönünün tersine çevir"""
+    coords = polygon_array(points)
+    # Art arda tekrar eden köşeleri at (tekrarlar içbükey bir dönüşü gizleyebilir)
+    keep = np.any(coords != np.roll(coords, -1, axis=0), axis=1)
+    coords = coords[keep] if keep.any() else coords[:1]
+    if not is_polygon_convex(coords):
+        raise ValueError("Sorgu indeksi yalnızca convex çokgenler için kurulabilir")
+
+    # i. köşenin dönüşü (i-1, i, i+1) üçlüsüdür; sıfır olanlar doğrusaldır
+    if len(coords) >= 3:
+        turns = np.roll(cross_product_signs(halo_chunk(coords, 0, len(coords))), 1)
+        coords = coords[turns != 0]
+    if len(coords) < 3 or not is_polygon_convex(coords):
+        raise ValueError("Çokgenin alanı sıfır, sorgu indeksi kurulamaz")
+
+    x, y = coords[:, 0], coords[:, 1]
+    if np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)) < 0:
+        coords = coords[::-1] # saat yönündeyse ters çevir
+    return np.ascontiguousarray(coords)
+
+def build_query_index(points):
+    """Pivot köşe etrafında yelpaze (fan) ve açı tablosu oluştur"""
+    coords = normalize_convex(points)
+    pivot = coords[0]
+    fan = coords[1:] - pivot # pivot'tan diğer köşelere vektörler
+    first = fan[0]
+    # İlk yelpaze ışınına göre açı: convex çokgende [0, pi) aralığında ve artan
+    angles = np.arctan2(first[0] * fan[:, 1] - first[1] * fan[:, 0], fan @ first)
+    return {"coords": coords, "pivot": pivot, "fan": fan, "angles": angles,
+            "point_list": [tuple(p) for p in coords.tolist()]} # tekil sorgular için saf Python kopya
+
+def contains(index, point):
+    """Tek bir noktayı O(log n) ikili arama ile test et (kenar üstü içeride sayılır)"""
+    coords = index["point_list"]
+    pivot = coords[0]
+    q = tuple(point)
+    # Pivot'tan çıkan ilk ve son ışının dışındaysa çokgenin dışındadır
+    if cross_product_sign(pivot, coords[1], q) < 0 or cross_product_sign(pivot, coords[-1], q) > 0:
+        return False
+    lo, hi = 1, len(coords) - 1 # q, (pivot, coords[lo], coords[hi]) yelpaze diliminde
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if cross_product_sign(pivot, coords[mid], q) >= 0:
+            lo = mid
+        else:
+            hi = mid
+    return cross_product_sign(coords[lo], coords[hi], q) >= 0
+
+def contains_batch(index, queries):
+    """Nokta dizisini tek bir vektörel searchsorted geçişiyle test et"""
+    queries = polygon_array(queries)
+    fan = index["fan"]
+    first = fan[0]
+    v = queries - index["pivot"]
+
+    # 1) Açı ile yelpaze dilimini bul
+    q_angles = np.arctan2(first[0] * v[:, 1] - first[1] * v[:, 0], v @ first)
+    k = np.clip(np.searchsorted(index["angles"], q_angles, side="right") - 1, 0, len(fan) - 2)
+
+    # 2) arctan2 yuvarlama hatasını kesin çapraz çarpım testiyle düzelt
+    lo_cross = fan[k, 0] * v[:, 1] - fan[k, 1] * v[:, 0]
+    k = np.where((lo_cross < 0) & (k > 0), k - 1, k)
+    hi_cross = fan[k + 1, 0] * v[:, 1] - fan[k + 1, 1] * v[:, 0]
+    k = np.where((hi_cross > 0) & (k < len(fan) - 2), k + 1, k)
+
+    # 3) Yelpaze sınırları ve dilimin dış kenarı
+    inside_fan = ((first[0] * v[:, 1] - first[1] * v[:, 0]) >= 0) & \
+                 ((fan[-1, 0] * v[:, 1] - fan[-1, 1] * v[:, 0]) <= 0)
+    a = fan[k]
+    b = fan[k + 1]
+    edge = (b[:, 0] - a[:, 0]) * (v[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (v[:, 0] - a[:, 0])
+    return inside_fan & (edge >= 0)
+
+def contains_batch_parallel(index, queries, num_threads=4):
+    """Büyük sorgu gruplarını parçalara bölüp thread havuzunda test et"""
+    queries = polygon_array(queries)
+    result = np.empty(len(queries), dtype=bool)
+
+    def work(r):
+        result[r[0]:r[1]] = contains_batch(index, queries[r[0]:r[1]])
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        list(executor.map(work, chunk_ranges(len(queries), num_threads)))
+    return result
+
+if __name__ == "__main__":
+    import time
+
+    n_points = 100000
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    polygon = np.column_stack([10 * np.cos(angles), 10 * np.sin(angles)])
+
+    start_time = time.time()
+    index = build_query_index(polygon)
+    print("İndeks {} köşe için {:.4f} saniyede kuruldu".format(len(index["coords"]), time.time() - start_time))
+
+    print("(0, 0):", contains(index, (0, 0)), "| (11, 0):", contains(index, (11, 0)))
+
+    n_queries = 5000000
+    queries = np.random.default_rng(0).uniform(-12, 12, (n_queries, 2))
+    start_time = time.time()
+    inside = contains_batch_parallel(index, queries)
+    elapsed_time = time.time() - start_time
+    print("{} sorgu: {} içeride ({:.2f} saniye, {:.1f}M nokta/sn)".format(
+        n_queries, int(inside.sum()), elapsed_time, n_queries / elapsed_time / 1e6))
+    print("Beklenen oran ~{:.3f}, bulunan {:.3f}".format(np.pi * 100 / 24 ** 2, inside.mean()))
@@ -0,0 +1,227 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+from vectorized_solution import batch_indices, chunk_ranges
+
+DEFAULT_TOLERANCE = 1e-9 # modelin boyutuna göre bağıl düzlem uzaklığı toleransı
+CHUNK_ENTRIES = 1 << 23 # yüz x köşe matrisinin bir parçadaki eleman sayısı (~64 MB float64)
+
+def faces_to_ragged(faces):
+    """Yüz listesini (düz indeks dizisi, ofsetler) biçimine çevir (2B batch düzeniyle aynı)"""
+    if isinstance(faces, np.ndarray) and faces.ndim == 2:
+        faces = faces.astype(np.int64)
+        offsets = np.arange(len(faces) + 1, dtype=np.int64) * faces.shape[1]
+        return faces.reshape(-1), offsets
+    lengths = np.fromiter((len(f) for f in faces), dtype=np.int64, count=len(faces))
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    flat = np.fromiter((i for f in faces for i in f), dtype=np.int64, count=int(offsets[-1]))
+    return flat, offsets
+
+def face_planes(vertices, face_index, face_offsets):
+    """Her yüz için Newell normali (birim), merkez noktası ve alan vektörünün uzunluğunu hesapla"""
+    face_ids, next_pos, _ = batch_indices(face_offsets)
+    p = vertices[face_index]
+    q = vertices[face_index[next_pos]]
+    starts = face_offsets[:-1]
+    # Newell yöntemi: kenarların p x q toplamı, düzgün olmayan çokgen yüzlerde de kararlıdır
+    newell = np.add.reduceat(np.cross(p, q), starts, axis=0)
+    centroids = np.add.reduceat(p, starts, axis=0) / np.diff(face_offsets)[:, None]
+    length = np.linalg.norm(newell, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normals = np.where(length[:, None] > 0, newell / length[:, None], 0.0)
+    return normals, centroids, length, face_ids, next_pos
+
+def edge_fast_path(vertices, face_index, face_offsets, tol=DEFAULT_TOLERANCE):
+    """Kenar komşu yüz testi: karar verebilirse (sonuç, sebep), veremezse (None, sebep) döndür
+
+    Kapalı ve tutarlı yönlendirilmiş bir yüzeyde her kenar, komşu yüzün merkezini
+    yüzün iç tarafında görmelidir (yerel convexlik). İçbükey tek bir kenar
+    CONCAVE için yeterlidir; CONVEX kararı ise ek olarak merkez noktasının tüm
+    yüz düzlemlerinin içinde kalmasını ve yüzeyin onu tam bir kez sarmasını ister.
+    """
+    normals, centroids, length, face_ids, next_pos = face_planes(vertices, face_index, face_offsets)
+    eps = tol * max(np.abs(vertices).max(), 1e-300)
+
+    # Yönlü kenarlar: her kenarın tam olarak bir ters yönlü eşi olmalı
+    n_vertices = len(vertices)
+    src = face_index
+    dst = face_index[next_pos]
+    keys = src * n_vertices + dst
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    if (sorted_keys[1:] == sorted_keys[:-1]).any():
+        return None, "manifold olmayan veya tutarsız yönlendirilmiş yüzler"
+    match = np.searchsorted(sorted_keys, dst * n_vertices + src)
+    match = np.minimum(match, len(sorted_keys) - 1)
+    if (sorted_keys[match] != dst * n_vertices + src).any():
+        return None, "açık yüzey (eşi olmayan kenar)"
+    neighbor = face_ids[order[match]]
+
+    # Yönelim: işaretli hacim negatifse normaller içe bakıyordur
+    volume = np.sum(np.einsum("ij,ij->i", centroids, normals) * length) / 6
+    if volume == 0:
+        return None, "hacmi sıfır olan yüzey"
+    side = 1.0 if volume > 0 else -1.0
+
+    # Yerel convexlik: komşu yüzün merkezi bu yüzün düzleminin dışında olmamalı
+    offset = np.einsum("ij,ij->i", normals, centroids)
+    reach = side * (np.einsum("ij,ij->i", normals[face_ids], centroids[neighbor]) - offset[face_ids])
+    reflex = np.nonzero(reach > eps)[0]
+    if len(reflex):
+        e = reflex[0]
+        return False, f"içbükey kenar ({int(src[e])}, {int(dst[e])})"
+
+    # Köşeler merkeze kaydırıldığı için orijin, convex bir çokyüzlünün içindedir
+    if (side * offset <= eps).any():
+        return None, "merkez noktası bazı yüz düzlemlerinin dışında"
+    if abs(winding_number(vertices, face_index, face_offsets) * side - 1) > 1e-6:
+        return None, "yüzey merkezi bir kereden fazla sarıyor"
+    return True, "tüm kenarlar yerel convex ve yüzey yıldız biçimli"
+
+def winding_number(vertices, face_index, face_offsets):
+    """Yüzeyin orijini kaç kez sardığını katı açı toplamıyla hesapla (Van Oosterom-Strackee)"""
+    lengths = np.diff(face_offsets)
+    # Her yüzü ilk köşesinden yelpaze üçgenlerine böl
+    fan_counts = np.maximum(lengths - 2, 0)
+    tri_face = np.repeat(np.arange(len(lengths)), fan_counts)
+    local = np.arange(fan_counts.sum()) - np.repeat(np.cumsum(fan_counts) - fan_counts, fan_counts) + 1
+    base = face_offsets[:-1][tri_face]
+    a = vertices[face_index[base]]
+    b = vertices[face_index[base + local]]
+    c = vertices[face_index[base + local + 1]]
+    la, lb, lc = (np.linalg.norm(v, axis=1) for v in (a, b, c))
+    numerator = np.einsum("ij,ij->i", a, np.cross(b, c))
+    denominator = (la * lb * lc + np.einsum("ij,ij->i", a, b) * lc
+                   + np.einsum("ij,ij->i", a, c) * lb + np.einsum("ij,ij->i", b, c) * la)
+    return float(np.sum(2 * np.arctan2(numerator, denominator)) / (4 * np.pi))
+
+_WORKER = {}
+
+def _init_face_worker(vertices, normals, offsets, eps):
+    """Process havuzu başlatıcısı: büyük diziler her worker'a bir kez gönderilir"""
+    _WORKER.update(vertices=vertices, normals=normals, offsets=offsets, eps=eps)
+
+def face_sign_summary(vertices, normals, offsets, eps, start, end):
+    """[start, end) yüzleri için tüm köşelerin işaretli uzaklığı; her iki tarafta köşe var mı"""
+    distances = vertices @ normals[start:end].T - offsets[start:end]
+    has_pos = (distances > eps).any(axis=0)
+    has_neg = (distances < -eps).any(axis=0)
+    mixed = np.nonzero(has_pos & has_neg)[0]
+    return int(start + mixed[0]) if len(mixed) else None
+
+def _face_range_task(face_range):
+    w = _WORKER
+    return face_sign_summary(w["vertices"], w["normals"], w["offsets"], w["eps"], *face_range)
+
+def face_vertex_test(vertices, face_index, face_offsets, tol=DEFAULT_TOLERANCE, num_workers=1,
+                     chunk_entries=CHUNK_ENTRIES):
+    """Her yüz düzlemi için tüm köşelerin aynı tarafta olduğunu parçalar halinde kontrol et
+
+    Dönüş: (convex mi, karışık işaretli ilk yüz veya None).
+    """
+    normals, centroids, _, _, _ = face_planes(vertices, face_index, face_offsets)
+    offsets = np.einsum("ij,ij->i", normals, centroids)
+    eps = tol * max(np.abs(vertices).max(), 1e-300)
+    n_faces = len(normals)
+    # Bellek sınırı: bir parça en fazla chunk_entries yüz-köşe çifti içerir
+    faces_per_chunk = max(1, chunk_entries // max(1, len(vertices)))
+    ranges = [(s, min(s + faces_per_chunk, n_faces)) for s in range(0, n_faces, faces_per_chunk)]
+
+    if num_workers <= 1:
+        for start, end in ranges:
+            face = face_sign_summary(vertices, normals, offsets, eps, start, end)
+            if face is not None:
+                return False, face # karışık işaretli yüz bulundu, kalan parçalara gerek yok
+        return True, None
+
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_face_worker,
+                             initargs=(vertices, normals, offsets, eps)) as executor:
+        pending = {executor.submit(_face_range_task, r) for r in ranges}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    face = future.result()
+                    if face is not None:
+                        return False, face
+        finally:
+            for future in pending:
+                future.cancel()
+    return True, None
+
+def check_polyhedron(vertices, faces, tol=DEFAULT_TOLERANCE, num_workers=1, method="auto"):
+    """Çokyüzlünün convexliğini kontrol et ve kararın nasıl verildiğini döndür
+
+    method: "auto" önce kenar hızlı yolunu dener, karar veremezse yüz x köşe
+    testine geçer; "faces" doğrudan tam testi çalıştırır.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    vertices = vertices - vertices.mean(axis=0) # merkeze kaydırma hem duyarlılığı hem sarma testini sağlar
+    face_index, face_offsets = faces_to_ragged(faces)
+    if len(face_offsets) < 2:
+        return {"convex": True, "method": "empty", "reason": "yüz yok"}
+
+    reason = None
+    if method == "auto":
+        verdict, reason = edge_fast_path(vertices, face_index, face_offsets, tol)
+        if verdict is not None:
+            return {"convex": verdict, "method": "edges", "reason": reason}
+
+    convex, face = face_vertex_test(vertices, face_index, face_offsets, tol, num_workers)
+    return {"convex": convex, "method": "faces",
+            "reason": f"{face}. yüzün iki tarafında da köşe var" if face is not None else reason}
+
+def is_polyhedron_convex(vertices, faces, tol=DEFAULT_TOLERANCE, num_workers=1):
+    """Çokyüzlü convex ise True döndür"""
+    return check_polyhedron(vertices, faces, tol, num_workers)["convex"]
+
+def uv_sphere(n_lat, n_lon, radius=1.0):
+    """Üçgenlenmiş UV küre (test ve benchmark için convex örgü)"""
+    lat = np.linspace(0, np.pi, n_lat + 1)[1:-1]
+    lon = np.linspace(0, 2 * np.pi, n_lon, endpoint=False)
+    la, lo = np.meshgrid(lat, lon, indexing="ij")
+    ring = np.column_stack([np.sin(la).ravel() * np.cos(lo).ravel(),
+                            np.sin(la).ravel() * np.sin(lo).ravel(), np.cos(la).ravel()])
+    vertices = np.vstack([[0, 0, 1], ring, [0, 0, -1]]) * radius
+    south = len(vertices) - 1
+
+    def at(i, j):
+        return 1 + i * n_lon + j % n_lon
+
+    i, j = np.meshgrid(np.arange(n_lat - 2), np.arange(n_lon), indexing="ij")
+    i, j = i.ravel(), j.ravel()
+    faces = [np.column_stack([np.zeros(n_lon, dtype=np.int64), at(0, np.arange(n_lon) + 1), at(0, np.arange(n_lon))]),
+             np.column_stack([at(i, j), at(i, j + 1), at(i + 1, j)]),
+             np.column_stack([at(i, j + 1), at(i + 1, j + 1), at(i + 1, j)]),
+             np.column_stack([at(n_lat - 2, np.arange(n_lon)), at(n_lat - 2, np.arange(n_lon) + 1),
+                              np.full(n_lon, south)])]
+    return vertices, np.vstack(faces)
+
+if __name__ == "__main__":
+    import time
+
+    # 🔸 Örnek: küp (dörtgen yüzler) ve bir köşesi içeri itilmiş küp
+    cube = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], float)
+    quads = [[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+    print("Küp:", check_polyhedron(cube, quads))
+    dented = cube.copy()
+    dented[6] = [0.6, 0.6, 0.6]
+    tris = [[a, b, c] for q in quads for a, b, c in ((q[0], q[1], q[2]), (q[0], q[2], q[3]))]
+    print("Çökük küp:", check_polyhedron(dented, tris))
+    print("Açık küp (tam test):", check_polyhedron(cube, quads[1:]))
+
+    vertices, faces = uv_sphere(500, 1000)
+    print("\n🌐 UV küre: {} köşe, {} yüz".format(len(vertices), len(faces)))
+    for name, verts in (("convex", vertices), ("çökük", vertices * np.where(np.arange(len(vertices)) == 250000, 0.9, 1.0)[:, None])):
+        start_time = time.time()
+        result = check_polyhedron(verts, faces)
+        print("   {:<7} -> {} [{}] ({:.2f} saniye)".format(
+            name, "CONVEX" if result["convex"] else "CONCAVE", result["method"], time.time() - start_time))
+
+    small_vertices, small_faces = uv_sphere(60, 120)
+    for workers in (1, 2):
+        start_time = time.time()
+        result = check_polyhedron(small_vertices, small_faces, num_workers=workers, method="faces")
+        print("   tam yüz x köşe testi ({} yüz, {} process): {} ({:.2f} saniye)".format(
+            len(small_faces), workers, "CONVEX" if result["convex"] else "CONCAVE", time.time() - start_time))
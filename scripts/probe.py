@@ -0,0 +1,138 @@
+import random
+
+import numpy as np
+
+from series_solution import cross_product_sign
+from series_solution import is_polygon_convex as serial_convex
+from vectorized_solution import batch_is_convex, polygon_array, turn_flags
+from vectorized_solution import is_polygon_convex as vectorized_convex
+
+DEFAULT_SAMPLES = 32
+
+def probe_indices(n, samples=DEFAULT_SAMPLES, mode="strided", seed=None):
+    """Ön kontrolde bakılacak üçlülerin başlangıç indeksleri
+
+    strided: çokgen boyunca eşit aralıklı üçlüler; random: tekrarsız rastgele üçlüler
+    """
+    if samples >= n:
+        return list(range(n))
+    if mode == "strided":
+        return [i * n // samples for i in range(samples)]
+    if mode == "random":
+        return random.Random(seed).sample(range(n), samples)
+    raise ValueError(f"Bilinmeyen örnekleme biçimi: {mode}")
+
+def signs_are_mixed(signs):
+    """check_convexity kuralının tersi: hem pozitif hem negatif dönüş var mı"""
+    return not (all(signs) or not any(signs))
+
+def probe_concave(points, samples=DEFAULT_SAMPLES, mode="strided", seed=None):
+    """Örneklenen üçlülerde karışık işaret varsa True döndür (kesin CONCAVE)
+
+    Örnek tüm üçlülerin bir alt kümesi olduğundan, burada bulunan karışık
+    işaret tam taramada da bulunur; False ise karar tam taramaya kalır.
+    """
+    n = len(points)
+    signs = []
+    for i in probe_indices(n, samples, mode, seed):
+        cp = cross_product_sign(points[i], points[(i + 1) % n], points[(i + 2) % n])
+        if cp != 0:
+            signs.append(cp > 0)
+    return signs_are_mixed(signs)
+
+def probed_is_polygon_convex(points, samples=DEFAULT_SAMPLES, mode="strided", seed=None):
+    """Önce örnekleme ile hızlı ret, geçerse seri is_polygon_convex ile tam tarama"""
+    if probe_concave(points, samples, mode, seed):
+        return False
+    return serial_convex(points)
+
+def probe_concave_array(coords, samples=DEFAULT_SAMPLES, mode="strided", seed=None):
+    """probe_concave'in NumPy dizileri için vektörel hali"""
+    n = len(coords)
+    if n == 0:
+        return False
+    idx = np.asarray(probe_indices(n, samples, mode, seed), dtype=np.int64)
+    p1, p2, p3 = coords[idx], coords[(idx + 1) % n], coords[(idx + 2) % n]
+    with np.errstate(over="ignore", invalid="ignore"):
+        cp = (p2[:, 0] - p1[:, 0]) * (p3[:, 1] - p2[:, 1]) - (p2[:, 1] - p1[:, 1]) * (p3[:, 0] - p2[:, 0])
+    positive, negative = turn_flags(cp)
+    return bool(positive.any() and negative.any())
+
+def probed_vectorized_convex(points, samples=DEFAULT_SAMPLES, mode="strided", seed=None):
+    """Vektörel ön kontrol, geçerse vektörel tam tarama"""
+    coords = polygon_array(points)
+    if probe_concave_array(coords, samples, mode, seed):
+        return False
+    return vectorized_convex(coords)
+
+def probe_batch(coords, offsets, samples=DEFAULT_SAMPLES):
+    """Her çokgenden eşit aralıklı en fazla samples üçlüye bak; kesin concave olanların maskesi"""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    counts = np.minimum(lengths, samples)
+    polygon_ids = np.repeat(np.arange(len(lengths)), counts)
+    j = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    sizes = lengths[polygon_ids]
+    local = j * sizes // counts[polygon_ids] # probe_indices "strided" ile aynı dağılım
+    base = offsets[:-1][polygon_ids]
+    p1 = coords[base + local]
+    p2 = coords[base + (local + 1) % sizes]
+    p3 = coords[base + (local + 2) % sizes]
+    with np.errstate(over="ignore", invalid="ignore"):
+        cp = (p2[:, 0] - p1[:, 0]) * (p3[:, 1] - p2[:, 1]) - (p2[:, 1] - p1[:, 1]) * (p3[:, 0] - p2[:, 0])
+    positive, negative = turn_flags(cp)
+    has_pos = np.bincount(polygon_ids[positive], minlength=len(lengths)) > 0
+    has_neg = np.bincount(polygon_ids[negative], minlength=len(lengths)) > 0
+    return has_pos & has_neg
+
+def probed_batch_is_convex(coords, offsets, samples=DEFAULT_SAMPLES):
+    """Ön kontrolden geçen çokgenleri tek batch_is_convex çağrısıyla tam tara"""
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    concave = probe_batch(coords, offsets, samples)
+    convex = ~concave
+    survivors = np.nonzero(~concave)[0]
+    if len(survivors):
+        lengths = np.diff(offsets)[survivors]
+        sub_offsets = np.concatenate([[0], np.cumsum(lengths)])
+        # Kalan çokgenlerin köşelerini bitişik bir diziye topla
+        starts = np.repeat(offsets[survivors] - sub_offsets[:-1], lengths)
+        sub_coords = coords[starts + np.arange(sub_offsets[-1])]
+        convex[survivors] = batch_is_convex(sub_coords, sub_offsets)
+    return convex
+
+if __name__ == "__main__":
+    import time
+
+    # 🔸 Concave ağırlıklı iş yükü: %80 zikzak concave, %20 convex çokgen
+    rng = np.random.default_rng(0)
+    polygons = []
+    for k in range(200):
+        n = int(rng.integers(20000, 60000))
+        angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        radius = np.where(np.arange(n) % 4 == 0, 15.0, 8.0) if k % 5 else np.full(n, 10.0)
+        polygons.append(np.column_stack([radius * np.cos(angles), radius * np.sin(angles)]))
+    point_lists = [[tuple(p) for p in poly.tolist()] for poly in polygons]
+
+    for name, full, probed, inputs in (
+            ("seri", serial_convex, probed_is_polygon_convex, point_lists),
+            ("vektörel", vectorized_convex, probed_vectorized_convex, polygons)):
+        start_time = time.time()
+        expected = [full(p) for p in inputs]
+        full_time = time.time() - start_time
+        start_time = time.time()
+        actual = [probed(p) for p in inputs]
+        probe_time = time.time() - start_time
+        print("🔎 {:<9} tam tarama: {:.3f}s | ön kontrollü: {:.3f}s ({:.1f}x) | aynı sonuç: {}".format(
+            name, full_time, probe_time, full_time / probe_time, actual == expected))
+
+    coords = np.concatenate(polygons)
+    offsets = np.concatenate([[0], np.cumsum([len(p) for p in polygons])])
+    start_time = time.time()
+    expected = batch_is_convex(coords, offsets)
+    full_time = time.time() - start_time
+    start_time = time.time()
+    actual = probed_batch_is_convex(coords, offsets)
+    probe_time = time.time() - start_time
+    print("🔎 {:<9} tam tarama: {:.3f}s | ön kontrollü: {:.3f}s ({:.1f}x) | aynı sonuç: {}".format(
+        "toplu", full_time, probe_time, full_time / probe_time, bool((actual == expected).all())))
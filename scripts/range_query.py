@@ -0,0 +1,108 @@
+import numpy as np
+
+from vectorized_solution import cross_product_signs, halo_chunk, polygon_array, turn_flags
+
+# Toplu sorgularda yön kodları
+STRAIGHT, CCW, CW, MIXED = 0, 1, -1, 2
+DIRECTION_NAMES = {STRAIGHT: "straight", CCW: "ccw", CW: "cw", MIXED: "mixed"}
+
+def build_range_index(points):
+    """Köşe dönüş işaretlerinin önek sayılarını vektörel O(n) ile kur
+
+    v. köşenin dönüşü (v-1, v, v+1) üçlüsünün çapraz çarpımıdır. Her sorgu
+    yalnızca "aralıkta pozitif/negatif dönüş var mı" sorusu olduğundan,
+    önek sayıları segment tree veya sparse table ile aynı cevabı O(1)'de verir.
+    """
+    coords = polygon_array(points)
+    n = len(coords)
+    if n < 3:
+        positive = negative = np.zeros(n, dtype=bool)
+    else:
+        # i. üçlü (i+1). köşenin dönüşüdür; köşe numarasına göre hizala
+        positive, negative = turn_flags(np.roll(cross_product_signs(halo_chunk(coords, 0, n)), 1))
+    return {
+        "n": n,
+        "pos_prefix": np.concatenate([[0], np.cumsum(positive, dtype=np.int64)]),
+        "neg_prefix": np.concatenate([[0], np.cumsum(negative, dtype=np.int64)]),
+    }
+
+def _range_count(prefix, n, start, length):
+    """[start, start + length) köşe aralığındaki sayım (başa sarma dahil, vektörel)"""
+    end = start + length
+    wrapped = end > n
+    inner = prefix[np.minimum(end, n)] - prefix[start]
+    return np.where(wrapped, inner + prefix[np.where(wrapped, end - n, 0)], inner)
+
+def query_batch(index, i, j):
+    """(i, j) çiftlerinin her biri için i'den j'ye (ileri yönde, sarmalı) zincirin durumunu döndür
+
+    Dönüş: (convex dizisi, yön kodu dizisi). Zincirin dönüşleri yalnızca iç
+    köşelerde (i ve j hariç) ölçülür; yön kodları STRAIGHT, CCW, CW, MIXED.
+    i == j tam halka sayılır: i'den başlayıp i'ye dönen zincir tüm köşeleri
+    kapsar, sonuç çokgenin tamamı için verilen sonuçla aynıdır.
+    """
+    n = index["n"]
+    i = np.asarray(i, dtype=np.int64)
+    j = np.asarray(j, dtype=np.int64)
+    if n == 0:
+        shape = np.broadcast(i, j).shape
+        return np.ones(shape, dtype=bool), np.full(shape, STRAIGHT, dtype=np.int8)
+    i %= n
+    j %= n
+    # Zincirin iç köşe sayısı; i == j tam halkadır (n köşenin hepsi)
+    inner = np.where(i == j, n, np.maximum((j - i) % n - 1, 0))
+    start = (i + 1) % n
+    has_pos = _range_count(index["pos_prefix"], n, start, inner) > 0
+    has_neg = _range_count(index["neg_prefix"], n, start, inner) > 0
+    direction = np.where(has_pos & has_neg, MIXED, np.where(has_pos, CCW, np.where(has_neg, CW, STRAIGHT)))
+    return ~(has_pos & has_neg), direction.astype(np.int8)
+
+def query_chain(index, i, j):
+    """Tek zincir sorgusu: (convex mi, "ccw" / "cw" / "straight" / "mixed")"""
+    convex, direction = query_batch(index, i, j)
+    return bool(convex), DIRECTION_NAMES[int(direction)]
+
+if __name__ == "__main__":
+    import time
+    from series_solution import cross_product_sign
+
+    # 🔸 Kıyı şeridi benzeri sabit sınır: gürültülü yarıçaplı kapalı eğri
+    n_points = 1000000
+    rng = np.random.default_rng(0)
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    radius = 100 + np.cumsum(rng.normal(0, 0.05, n_points)) * np.sin(angles / 2)
+    boundary = np.column_stack([radius * np.cos(angles), radius * np.sin(angles)])
+
+    start_time = time.time()
+    index = build_range_index(boundary)
+    print("İndeks {} köşe için {:.4f} saniyede kuruldu".format(n_points, time.time() - start_time))
+    print("Zincir (10, 12):", query_chain(index, 10, 12), "| sarmalı (999990, 5):", query_chain(index, 999990, 5))
+
+    n_queries = 1000000
+    qi = rng.integers(0, n_points, n_queries)
+    qj = (qi + rng.integers(0, 50, n_queries)) % n_points
+    start_time = time.time()
+    convex, direction = query_batch(index, qi, qj)
+    elapsed_time = time.time() - start_time
+    print("{} sorgu {:.4f} saniyede ({:.1f}M sorgu/sn), convex oranı {:.3f}".format(
+        n_queries, elapsed_time, n_queries / elapsed_time / 1e6, convex.mean()))
+
+    # Kaba kuvvet ile karşılaştır (i == j tam halka: tüm köşeler bir kez gezilir)
+    points = [tuple(p) for p in boundary.tolist()]
+
+    def chain_signs(a, length):
+        signs = set()
+        for step in range(1, length + 1):
+            v = (a + step) % n_points
+            cp = cross_product_sign(points[v - 1], points[v], points[(v + 1) % n_points])
+            if cp != 0:
+                signs.add(cp > 0)
+        return signs
+
+    whole_ring = len(chain_signs(0, n_points)) < 2
+    mismatches = 0
+    for k in range(2000):
+        a, b = int(qi[k]), int(qj[k])
+        expected = whole_ring if a == b else len(chain_signs(a, max((b - a) % n_points - 1, 0))) < 2
+        mismatches += bool(convex[k]) != expected
+    print("Kaba kuvvet karşılaştırması: {} farklı sonuç".format(mismatches))
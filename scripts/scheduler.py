@@ -0,0 +1,205 @@
+import math
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from vectorized_solution import batch_is_convex, chunk_sign_summary, polygon_array
+
+POLICIES = ("static", "guided", "decreasing")
+DEFAULT_MIN_CHUNK = 4096 # bundan küçük iş parçaları zamanlama maliyetine değmez
+
+def chunk_size_policy(policy, total, workers, min_chunk=DEFAULT_MIN_CHUNK):
+    """Kalan üçlü sayısına göre sıradaki iş parçasının boyutunu veren fonksiyon üret
+
+    static: measure_parallel_time gibi worker başına eşit tek parça
+    guided: kalan işin worker sayısına bölümü (OpenMP guided)
+    decreasing: ilk parçadan min_chunk'a doğrusal azalan boyutlar (trapezoid)
+    """
+    workers = max(1, workers)
+    if policy == "static":
+        size = max(1, math.ceil(total / workers))
+        return lambda remaining: size
+    if policy == "guided":
+        return lambda remaining: max(min_chunk, math.ceil(remaining / workers))
+    if policy == "decreasing":
+        first = max(min_chunk, math.ceil(total / (2 * workers)))
+        count = max(1, math.ceil(2 * total / (first + min_chunk)))
+        step = (first - min_chunk) / max(1, count - 1)
+        state = {"index": 0}
+
+        def next_size(remaining):
+            size = max(min_chunk, int(first - step * state["index"]))
+            state["index"] += 1
+            return size
+        return next_size
+    raise ValueError(f"Bilinmeyen zamanlama politikası: {policy}")
+
+def build_tasks(offsets, next_size):
+    """Çokgenleri iş parçalarına böl: büyükler alt aralıklara kesilir, küçükler gruplanır
+
+    ("range", çokgen, başlangıç, bitiş): tek çokgenin [başlangıç, bitiş) üçlüleri
+    ("group", ilk, son): [ilk, son) çokgenlerinin tamamı, tek batch_is_convex çağrısı
+    """
+    lengths = np.diff(offsets).tolist()
+    remaining = int(offsets[-1] - offsets[0])
+    tasks = []
+    group_start, group_size = 0, 0
+    target = next_size(remaining)
+    for k, length in enumerate(lengths):
+        if length >= target:
+            if group_size:
+                tasks.append(("group", group_start, k))
+                remaining -= group_size
+                target = next_size(remaining)
+            start = 0
+            while start < length:
+                end = min(length, start + target)
+                tasks.append(("range", k, start, end))
+                remaining -= end - start
+                start = end
+                target = next_size(remaining)
+            group_start, group_size = k + 1, 0
+        else:
+            group_size += length
+            if group_size >= target:
+                tasks.append(("group", group_start, k + 1))
+                remaining -= group_size
+                target = next_size(remaining)
+                group_start, group_size = k + 1, 0
+    if group_size or group_start < len(lengths):
+        tasks.append(("group", group_start, len(lengths)))
+    return tasks
+
+def task_size(task, offsets):
+    """İş parçasındaki üçlü sayısı"""
+    if task[0] == "range":
+        return task[3] - task[2]
+    return int(offsets[task[2]] - offsets[task[1]])
+
+def scheduled_batch_convex(coords, offsets, num_workers=4, policy="guided", min_chunk=DEFAULT_MIN_CHUNK,
+                           steal=True):
+    """Çokgen grubunu dinamik iş parçaları ve iş çalma ile paralel kontrol et
+
+    Dönüş: (convex sonuç dizisi, yük dengesizliği istatistikleri)
+    """
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    num_polygons = len(offsets) - 1
+    total = int(offsets[-1] - offsets[0])
+    num_workers = max(1, num_workers)
+
+    tasks = build_tasks(offsets, chunk_size_policy(policy, total, num_workers, min_chunk))
+    # Parçalar worker'lara sırayla dağıtılır; her worker kendi kuyruğunun başından alır,
+    # boşalınca diğerlerinin sonundan çalar (deque uçları thread-safe'tir)
+    deques = [deque(tasks[w::num_workers]) for w in range(num_workers)]
+
+    convex = np.ones(num_polygons, dtype=bool)
+    has_pos = np.zeros(num_polygons, dtype=bool)
+    has_neg = np.zeros(num_polygons, dtype=bool)
+    split = np.zeros(num_polygons, dtype=bool)
+    for task in tasks:
+        if task[0] == "range":
+            split[task[1]] = True
+
+    stats = [{"busy_seconds": 0.0, "tasks": 0, "triples": 0, "steals": 0, "skipped": 0}
+             for _ in range(num_workers)]
+
+    def run_task(task, own):
+        if task[0] == "group":
+            first, last = task[1], task[2]
+            base = offsets[first]
+            convex[first:last] = batch_is_convex(coords[base:offsets[last]], offsets[first:last + 1] - base)
+            return True
+        k, start, end = task[1], task[2], task[3]
+        if has_pos[k] and has_neg[k]:
+            own["skipped"] += 1 # çokgen başka bir parçada concave bulundu
+            return False
+        pos, neg = chunk_sign_summary(coords[offsets[k]:offsets[k + 1]], start, end)
+        # Yalnızca True yazılır: eşzamanlı yazmalar birbirinin sonucunu silemez
+        if pos:
+            has_pos[k] = True
+        if neg:
+            has_neg[k] = True
+        return True
+
+    def worker(w):
+        own = stats[w]
+        victims = [(w + i) % num_workers for i in range(1, num_workers)]
+        while True:
+            try:
+                task = deques[w].popleft()
+            except IndexError:
+                task = None
+                if steal:
+                    for v in victims:
+                        try:
+                            task = deques[v].pop()
+                            own["steals"] += 1
+                            break
+                        except IndexError:
+                            continue
+                if task is None:
+                    return
+            start_time = time.perf_counter()
+            if run_task(task, own):
+                own["tasks"] += 1
+                own["triples"] += task_size(task, offsets)
+            own["busy_seconds"] += time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(w,)) for w in range(num_workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start_time
+
+    convex[split] = ~(has_pos[split] & has_neg[split])
+    busy = [s["busy_seconds"] for s in stats]
+    mean_busy = sum(busy) / num_workers
+    return convex, {
+        "policy": policy,
+        "workers": num_workers,
+        "steal": steal,
+        "tasks": len(tasks),
+        "wall_seconds": wall,
+        "per_worker": stats,
+        # 1.0 mükemmel denge; 2.0 en yavaş worker'ın ortalamanın iki katı çalıştığı anlamına gelir
+        "imbalance": max(busy) / mean_busy if mean_busy > 0 else 1.0,
+        "efficiency": sum(busy) / (num_workers * wall) if wall > 0 else 1.0,
+        "steals": sum(s["steals"] for s in stats),
+        "skipped": sum(s["skipped"] for s in stats),
+    }
+
+def scheduled_convex(points, num_workers=4, policy="guided", min_chunk=DEFAULT_MIN_CHUNK, steal=True):
+    """Tek çokgeni dinamik zamanlayıcı ile kontrol et; (sonuç, istatistikler) döndür"""
+    coords = polygon_array(points)
+    if len(coords) == 0:
+        return True, None
+    convex, stats = scheduled_batch_convex(coords, [0, len(coords)], num_workers, policy, min_chunk, steal)
+    return bool(convex[0]), stats
+
+def format_stats(stats):
+    """İstatistikleri tek satırlık özet olarak yazdır"""
+    return ("{:<10} çalma={:<5} | {:>5} parça | {:.4f}s | dengesizlik {:.2f} | verim {:.2f} | "
+            "{} çalma, {} atlanan").format(stats["policy"], str(stats["steal"]), stats["tasks"], stats["wall_seconds"],
+                                          stats["imbalance"], stats["efficiency"], stats["steals"], stats["skipped"])
+
+if __name__ == "__main__":
+    # 🔸 Dengesiz grup: bir dev convex çokgen, on binlerce küçük çokgen ve erken biten concave çokgen
+    rng = np.random.default_rng(0)
+    polygons = []
+    for n in [2000000] + rng.integers(3, 40, 30000).tolist() + [500000]:
+        angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        polygons.append(np.column_stack([np.cos(angles), np.sin(angles)]))
+    polygons[-1][1] *= 0.5 # son çokgen concave: ilk parçada karar verilir
+    coords = np.concatenate(polygons)
+    offsets = np.concatenate([[0], np.cumsum([len(p) for p in polygons])])
+    expected = batch_is_convex(coords, offsets)
+
+    print("⚖️ {} çokgen, {} köşe".format(len(polygons), len(coords)))
+    for policy, steal in (("static", False), ("guided", False), ("guided", True), ("decreasing", True)):
+        convex, stats = scheduled_batch_convex(coords, offsets, num_workers=4, policy=policy, steal=steal)
+        print("   " + format_stats(stats), "| doğru:", bool((convex == expected).all()))
@@ -35,31 +35,32 @@ def visualize_polygon(points, is_convex, time_diff):
     plt.title("Polygon is " + ("CONVEX" if is_convex else "CONCAVE"), fontsize=14, color='green' if is_convex else 'red')
     plt.show()
 
-# 🔸 Örnek 1: Concave polygon
-points1 = [(0, 0), (2, 0), (2, 2), (1, 1), (0, 2)]
+if __name__ == "__main__":
+    # 🔸 Örnek 1: Concave polygon
+    points1 = [(0, 0), (2, 0), (2, 2), (1, 1), (0, 2)]
 
-# 🔹 Örnek 2: Convex polygon
-points2 = [(0, 0), (2, 0), (3, 1), (2, 2), (0, 2)]
+    # 🔹 Örnek 2: Convex polygon
+    points2 = [(0, 0), (2, 0), (3, 1), (2, 2), (0, 2)]
 
-points3 = [
-    (1, 1),
-    (3, 1),
-    (4, 3),
-    (2, 2),  # ← buradaki içbükey köşe nedeniyle concave olur
-    (4, 5),
-    (3, 5),
-    (1, 5),
-    (0, 3)
-]
+    points3 = [
+        (1, 1),
+        (3, 1),
+        (4, 3),
+        (2, 2),  # ← buradaki içbükey köşe nedeniyle concave olur
+        (4, 5),
+        (3, 5),
+        (1, 5),
+        (0, 3)
+    ]
 
-# ⚙️ Hangisini test etmek istiyorsan onu kullan
-points = points2  # veya points2
+    # ⚙️ Hangisini test etmek istiyorsan onu kullan
+    points = points2  # veya points2
 
-# Convexlik testi ve görselleştirme
-import time
-start_time = time.time()
-is_convex = is_polygon_convex(points)
-end_time = time.time()
+    # Convexlik testi ve görselleştirme
+    import time
+    start_time = time.time()
+    is_convex = is_polygon_convex(points)
+    end_time = time.time()
 
-time_diff = end_time - start_time
-visualize_polygon(points, is_convex,time_diff)
+    time_diff = end_time - start_time
+    visualize_polygon(points, is_convex,time_diff)
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+def polygon_array(points):
+    """Nokta listesini (n, 2) boyutlu float64 NumPy dizisine çevir"""
+    coords = np.asarray(points, dtype=np.float64)
+    return coords.reshape(-1, 2)
+
+def chunk_ranges(n, num_chunks):
+    """n üçlüyü num_chunks parçaya böl (measure_parallel_time ile aynı dağılım)"""
+    num_chunks = max(1, min(num_chunks, n)) if n > 0 else 1
+    per_chunk = n // num_chunks
+    remainder = n % num_chunks # fazlalık ilk parçalara birer birer dağıtılır
+
+    ranges = []
+    start_idx = 0
+    for i in range(num_chunks):
+        end_idx = start_idx + per_chunk + (1 if i < remainder else 0)
+        if end_idx > start_idx:
+            ranges.append((start_idx, end_idx))
+        start_idx = end_idx
+    return ranges
+
+def halo_chunk(coords, start, end):
+    """[start, end) üçlüleri için gerekli noktaları 2 noktalık halo ile al"""
+    n = len(coords)
+    # i. üçlü (i, i+1, i+2) noktalarını kullanır, son iki nokta başa sarar
+    return coords.take(np.arange(start, end + 2) % n, axis=0)
+
+def cross_product_signs(chunk):
+    """Halo'lu bir nokta dizisindeki ardışık üçlülerin çapraz çarpımlarını hesapla"""
+    x = chunk[:, 0]
+    y = chunk[:, 1]
+    # cross_product_sign ile aynı işlem sırası: (x2 - x1)*(y3 - y2) - (y2 - y1)*(x3 - x2)
+    with np.errstate(over="ignore", invalid="ignore"):
+        return (x[1:-1] - x[:-2]) * (y[2:] - y[1:-1]) - (y[1:-1] - y[:-2]) * (x[2:] - x[1:-1])
+
+def turn_flags(cross_products):
+    """Seri koddaki `if cp != 0: signs.append(cp > 0)` kuralının vektörel hali
+
+    Taşmadan doğan NaN değerler seri kodda olduğu gibi negatif dönüş sayılır.
+    """
+    positive = cross_products > 0
+    negative = (cross_products != 0) & ~positive
+    return positive, negative
+
+def sign_summary(cross_products):
+    """Çapraz çarpımları (pozitif var mı, negatif var mı) özetine indir"""
+    positive, negative = turn_flags(cross_products)
+    return bool(positive.any()), bool(negative.any())
+
+def merge_sign_summaries(summaries):
+    """Parça özetlerini tek bir (pozitif var mı, negatif var mı) özetinde birleştir"""
+    has_pos = False
+    has_neg = False
+    for pos, neg in summaries:
+        has_pos = has_pos or pos
+        has_neg = has_neg or neg
+    return has_pos, has_neg
+
+def summary_is_convex(summary):
+    """Özetten convexlik sonucunu çıkar (check_convexity ile aynı kural)"""
+    has_pos, has_neg = summary
+    return not (has_pos and has_neg)
+
+def chunk_sign_summary(coords, start, end):
+    """[start, end) aralığındaki üçlülerin işaret özetini hesapla"""
+    return sign_summary(cross_product_signs(halo_chunk(coords, start, end)))
+
+def is_polygon_convex(points, num_chunks=1):
+    """Çokgenin convex olup olmadığını vektörel olarak döndür"""
+    coords = polygon_array(points)
+    n = len(coords)
+    if n == 0:
+        return True
+
+    summaries = []
+    for start, end in chunk_ranges(n, num_chunks):
+        summary = chunk_sign_summary(coords, start, end)
+        summaries.append(summary)
+        if not summary_is_convex(summary):
+            break # karışık işaret bulundu, diğer parçalara gerek yok
+    return summary_is_convex(merge_sign_summaries(summaries))
+
+def threaded_is_polygon_convex(points, num_threads=4):
+    """Parçaları thread havuzunda paralel işle (NumPy işlemleri GIL'i bırakır)"""
+    coords = polygon_array(points)
+    n = len(coords)
+    if n == 0:
+        return True
+
+    ranges = chunk_ranges(n, num_threads)
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        summaries = executor.map(lambda r: chunk_sign_summary(coords, r[0], r[1]), ranges)
+        return summary_is_convex(merge_sign_summaries(summaries))
+
+def batch_indices(offsets):
+    """Ofset dizisinden her köşe için çokgen numarası ve sonraki iki köşe indeksini üret"""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    polygon_ids = np.repeat(np.arange(len(lengths)), lengths)
+    starts = offsets[:-1][polygon_ids]
+    sizes = lengths[polygon_ids]
+    local = np.arange(offsets[-1] - offsets[0]) + offsets[0] - starts
+    i1 = starts + (local + 1) % sizes
+    i2 = starts + (local + 2) % sizes
+    return polygon_ids, i1, i2
+
+def batch_is_convex(coords, offsets):
+    """Ardışık saklanan çokgen grubunun her biri için convexlik sonucunu döndür
+
+    coords: (toplam_nokta, 2) dizisi, offsets: uzunluğu çokgen_sayısı + 1 olan
+    dizi; k. çokgen coords[offsets[k]:offsets[k+1]] aralığındadır.
+    """
+    coords = polygon_array(coords)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    num_polygons = len(offsets) - 1
+    if num_polygons <= 0:
+        return np.zeros(0, dtype=bool)
+
+    polygon_ids, i1, i2 = batch_indices(offsets)
+    p1 = coords[offsets[0]:offsets[-1]]
+    p2 = coords[i1]
+    p3 = coords[i2]
+    with np.errstate(over="ignore", invalid="ignore"):
+        cp = (p2[:, 0] - p1[:, 0]) * (p3[:, 1] - p2[:, 1]) - (p2[:, 1] - p1[:, 1]) * (p3[:, 0] - p2[:, 0])
+
+    positive, negative = turn_flags(cp)
+    has_pos = np.bincount(polygon_ids[positive], minlength=num_polygons) > 0
+    has_neg = np.bincount(polygon_ids[negative], minlength=num_polygons) > 0
+    return ~(has_pos & has_neg)
+
+if __name__ == "__main__":
+    import time
+
+    # 🔸 Örnek: concave ve convex çokgenler
+    points1 = [(0, 0), (2, 0), (2, 2), (1, 1), (0, 2)]
+    points2 = [(0, 0), (2, 0), (3, 1), (2, 2), (0, 2)]
+    print("Örnek 1:", "CONVEX" if is_polygon_convex(points1) else "CONCAVE")
+    print("Örnek 2:", "CONVEX" if is_polygon_convex(points2) else "CONCAVE")
+
+    coords = np.concatenate([polygon_array(points1), polygon_array(points2)])
+    print("Toplu sonuç:", batch_is_convex(coords, [0, len(points1), len(coords)]))
+
+    n_points = 1000000
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    big = np.column_stack([10 * np.cos(angles), 10 * np.sin(angles)])
+    start_time = time.time()
+    is_convex = is_polygon_convex(big, num_chunks=8)
+    elapsed_time = time.time() - start_time
+    print("{} nokta: {} ({:.4f} saniye)".format(n_points, "CONVEX" if is_convex else "CONCAVE", elapsed_time))